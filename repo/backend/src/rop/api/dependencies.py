@@ -1,39 +1,111 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import TypeVar
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from rop.application.catalog.service import CatalogService
+from rop.application.catalog.service import AsyncCatalogService, CatalogService
 from rop.application.commerce.service import CommerceService
 from rop.application.inventory.service import InventoryService
-from rop.application.kitchen.service import KitchenService
+from rop.application.kitchen.service import AsyncKitchenService, KitchenService
 from rop.application.staff.service import StaffService
-from rop.infrastructure.db.session import get_session_factory
+from rop.infrastructure.db.async_session import get_async_session_factory
+from rop.infrastructure.db.consistency import (
+    CONSISTENCY_TOKEN_HEADER,
+    async_read_session,
+    committed,
+    parse_consistency_token,
+    read_session,
+    track_commits,
+    write_position,
+)
+from rop.infrastructure.db.session import get_session_factory, session_scope
 from rop.infrastructure.messaging.redis_publisher import RedisEventPublisher
 
+T = TypeVar("T")
 
-def get_db_session() -> Iterator[Session]:
+
+def get_db_session(request: Request) -> Iterator[Session]:
     session = get_session_factory()()
+    track_commits(session)
+    try:
+        yield session
+        if committed(session):
+            request.state.consistency_token = write_position(session)
+    finally:
+        session.close()
+
+
+def get_read_db_session(request: Request) -> Iterator[Session]:
+    """A session for GET handlers: a replica unless the caller's token is ahead of it."""
+    session = read_session(parse_consistency_token(request.headers.get(CONSISTENCY_TOKEN_HEADER)))
     try:
         yield session
     finally:
         session.close()
 
 
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    session = get_async_session_factory()()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_async_read_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    session = await async_read_session(
+        parse_consistency_token(request.headers.get(CONSISTENCY_TOKEN_HEADER))
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 def get_commerce_service(db: Session = Depends(get_db_session)) -> CommerceService:
     return CommerceService(db=db, publisher=RedisEventPublisher())
 
 
+def get_read_commerce_service(db: Session = Depends(get_read_db_session)) -> CommerceService:
+    return CommerceService(db=db, publisher=RedisEventPublisher())
+
+
 def get_catalog_service(db: Session = Depends(get_db_session)) -> CatalogService:
     return CatalogService(db=db)
 
 
+def get_read_catalog_service(db: Session = Depends(get_read_db_session)) -> CatalogService:
+    return CatalogService(db=db)
+
+
+async def get_async_catalog_service(
+    db: AsyncSession = Depends(get_async_read_db_session),
+) -> AsyncCatalogService:
+    return AsyncCatalogService(db=db)
+
+
 def get_kitchen_service(db: Session = Depends(get_db_session)) -> KitchenService:
     return KitchenService(db=db, publisher=RedisEventPublisher())
 
 
+async def get_async_kitchen_service() -> AsyncKitchenService:
+    return AsyncKitchenService()
+
+
+def run_with_kitchen_service(call: Callable[[KitchenService], T]) -> T:
+    """Run ``call`` against a sync :class:`KitchenService` on its own session.
+
+    For async kitchen routes falling back to the threadpool; call it through
+    ``run_in_threadpool``, never on the event loop.
+    """
+    with session_scope() as db:
+        return call(KitchenService(db=db, publisher=RedisEventPublisher()))
+
+
 def get_staff_service(
     commerce: CommerceService = Depends(get_commerce_service),
 ) -> StaffService:
@@ -1,19 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 import os
-import time
 from contextlib import asynccontextmanager, suppress
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_client import Counter, Histogram
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 
 from rop.api.error_handling import register_exception_handlers
-from rop.api.middleware.request_id import RequestIDMiddleware
+from rop.api.middleware.access_log import AccessLogMiddleware
+from rop.api.responses import FastJSONResponse
 from rop.api.routes.admin import router as admin_router
 from rop.api.routes.catalog import router as catalog_router
 from rop.api.routes.commerce import router as commerce_router
@@ -22,24 +19,23 @@ from rop.api.routes.inventory import router as inventory_router
 from rop.api.routes.kitchen import router as kitchen_router
 from rop.api.routes.metrics import router as metrics_router
 from rop.api.routes.staff import router as staff_router
+from rop.api.sse.hub import SseHub
+from rop.api.sse.routes import router as sse_router
 from rop.api.ws.manager import ConnectionManager
 from rop.api.ws.routes import router as ws_router
+from rop.infrastructure.cache.redis_client import close_async_redis_clients
+from rop.infrastructure.db.async_session import dispose_async_engines
+from rop.infrastructure.db.consistency import CONSISTENCY_TOKEN_HEADER
+from rop.infrastructure.messaging.change_notifier import ChangeNotifier
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
 from rop.infrastructure.messaging.redis_ws_fanout import start_redis_ws_fanout
 from rop.infrastructure.observability.logging_config import configure_logging
 from rop.infrastructure.observability.otel import configure_otel
 
-logger = logging.getLogger("rop.api.access")
 
-REQUEST_COUNT = Counter(
-    "http_requests_total",
-    "Total number of HTTP requests",
-    ["method", "path", "status_code"],
-)
-REQUEST_LATENCY = Histogram(
-    "http_request_duration_seconds",
-    "HTTP request duration in seconds",
-    ["method", "path"],
-)
+def _threadpool_tokens() -> int:
+    """Concurrent sync route handlers; AnyIO defaults to 40."""
+    return max(1, int(os.getenv("HTTP_THREADPOOL_TOKENS", "40")))
 
 
 def _cors_allow_origins() -> list[str]:
@@ -50,46 +46,14 @@ def _cors_allow_origins() -> list[str]:
     return [origin.strip() for origin in raw_value.split(",") if origin.strip()]
 
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        started = time.perf_counter()
-        path = request.url.path
-        method = request.method
-        try:
-            response = await call_next(request)
-        except Exception:
-            duration_ms = (time.perf_counter() - started) * 1000
-            REQUEST_COUNT.labels(method=method, path=path, status_code="500").inc()
-            REQUEST_LATENCY.labels(method=method, path=path).observe(duration_ms / 1000)
-            logger.exception(
-                "request_error",
-                extra={
-                    "method": method,
-                    "path": path,
-                    "status_code": 500,
-                    "duration_ms": round(duration_ms, 2),
-                },
-            )
-            raise
-
-        duration_ms = (time.perf_counter() - started) * 1000
-        REQUEST_COUNT.labels(method=method, path=path, status_code=str(response.status_code)).inc()
-        REQUEST_LATENCY.labels(method=method, path=path).observe(duration_ms / 1000)
-        logger.info(
-            "request_complete",
-            extra={
-                "method": method,
-                "path": path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-            },
-        )
-        return response
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.ws_manager = ConnectionManager()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _threadpool_tokens()
+    subscriptions = FanoutSubscriptions()
+    app.state.fanout_subscriptions = subscriptions
+    app.state.ws_manager = ConnectionManager(subscriptions=subscriptions)
+    app.state.kitchen_changes = ChangeNotifier(subscriptions)
+    app.state.sse_hub = SseHub(subscriptions=subscriptions)
     fanout_task = asyncio.create_task(start_redis_ws_fanout(app.state))
     app.state.redis_fanout_task = fanout_task
     try:
@@ -98,12 +62,20 @@ async def lifespan(app: FastAPI):
         fanout_task.cancel()
         with suppress(asyncio.CancelledError):
             await fanout_task
+        await app.state.ws_manager.shutdown()
+        await dispose_async_engines()
+        await close_async_redis_clients()
 
 
 def create_app() -> FastAPI:
     configure_logging()
 
-    app = FastAPI(title="FoodBiz Backend", version="1.0.0", lifespan=lifespan)
+    app = FastAPI(
+        title="FoodBiz Backend",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse,
+    )
     register_exception_handlers(app)
     app.include_router(health_router)
     app.include_router(metrics_router)
@@ -114,16 +86,16 @@ def create_app() -> FastAPI:
     app.include_router(staff_router)
     app.include_router(kitchen_router)
     app.include_router(ws_router)
+    app.include_router(sse_router)
 
     app.add_middleware(AccessLogMiddleware)
-    app.add_middleware(RequestIDMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=_cors_allow_origins(),
         allow_credentials=False,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["ETag", "X-Request-Id"],
+        expose_headers=["ETag", "X-Request-Id", CONSISTENCY_TOKEN_HEADER],
     )
 
     configure_otel(app)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import logging
+import time
+from uuid import uuid4
+
+from opentelemetry import trace
+from prometheus_client import Counter, Histogram
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from rop.api.middleware.request_id import REQUEST_ID_HEADER, request_id_context
+from rop.infrastructure.db.consistency import CONSISTENCY_TOKEN_HEADER
+from rop.infrastructure.db.query_stats import QueryStats, request_query_stats
+
+logger = logging.getLogger("rop.api.access")
+
+# Labels stay bounded: routes are templates ("/v1/orders/{order_id}") with one bucket for
+# paths that matched nothing, and methods outside the standard set share "other".
+UNMATCHED_ROUTE = "unmatched"
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+# Dense between 25ms and 1s, where API requests are expected to finish, so p95 and p99
+# interpolate within a narrow bucket; the tail beyond stays coarse.
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.2,
+    0.3,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "Total number of HTTP requests",
+    ["method", "route", "status_code"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration in seconds",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+
+def _method_label(scope: Scope) -> str:
+    method = scope["method"]
+    return method if method in _METHODS else "other"
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+def _exemplar() -> dict[str, str] | None:
+    """The current trace id, for jumping from a metric bucket to a sampled trace."""
+    span_context = trace.get_current_span().get_span_context()
+    if not span_context.is_valid or not span_context.trace_flags.sampled:
+        return None
+    return {"trace_id": format(span_context.trace_id, "032x")}
+
+
+def _record_queries(
+    labels: dict[str, str],
+    queries: QueryStats,
+    exemplar: dict[str, str] | None,
+) -> dict[str, object]:
+    """Export a request's SQL totals to metrics and its span; return access log fields."""
+    REQUEST_DB_STATEMENTS.labels(**labels).observe(queries.statements, exemplar)
+    REQUEST_DB_DURATION.labels(**labels).observe(queries.duration_seconds, exemplar)
+    db_duration_ms = round(queries.duration_seconds * 1000, 2)
+    span = trace.get_current_span()
+    span.set_attribute("db.statement_count", queries.statements)
+    span.set_attribute("db.duration_ms", db_duration_ms)
+    return {"db_statements": queries.statements, "db_duration_ms": db_duration_ms}
+
+
+class AccessLogMiddleware:
+    """Request id, response headers, metrics and the access log in one ASGI pass.
+
+    The request is timed to the start of its response, so a streamed body (an SSE
+    stream, say) is logged once its headers go out rather than when it closes. The
+    response messages themselves pass straight through; nothing is buffered or moved to
+    another task.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or str(uuid4())
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        response_started = False
+
+        token = request_id_context.set(request_id)
+        try:
+            with request_query_stats() as queries:
+
+                async def send_wrapper(message: Message) -> None:
+                    nonlocal response_started
+                    if message["type"] == "http.response.start":
+                        response_started = True
+                        headers = MutableHeaders(scope=message)
+                        headers[REQUEST_ID_HEADER] = request_id
+                        # Set by get_db_session once a write commits, before the response.
+                        consistency_token = state.get("consistency_token")
+                        if consistency_token:
+                            headers[CONSISTENCY_TOKEN_HEADER] = consistency_token
+                        self._log(scope, message["status"], started, queries)
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                except Exception:
+                    if not response_started:
+                        self._log(scope, 500, started, queries, error=True)
+                    raise
+        finally:
+            request_id_context.reset(token)
+
+    @staticmethod
+    def _log(
+        scope: Scope,
+        status_code: int,
+        started: float,
+        queries: QueryStats,
+        *,
+        error: bool = False,
+    ) -> None:
+        duration_seconds = time.perf_counter() - started
+        labels = {"method": _method_label(scope), "route": _route_template(scope)}
+        exemplar = _exemplar()
+        REQUEST_COUNT.labels(status_code=str(status_code), **labels).inc(exemplar=exemplar)
+        REQUEST_LATENCY.labels(**labels).observe(duration_seconds, exemplar)
+        extra = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "duration_ms": round(duration_seconds * 1000, 2),
+            **_record_queries(labels, queries, exemplar),
+        }
+        if error:
+            logger.exception("request_error", extra=extra)
+        else:
+            logger.info("request_complete", extra=extra)
@@ -1,10 +1,6 @@
 from __future__ import annotations
 
 from contextvars import ContextVar
-from uuid import uuid4
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 
 REQUEST_ID_HEADER = "X-Request-Id"
 request_id_context: ContextVar[str | None] = ContextVar("request_id", default=None)
@@ -12,17 +8,3 @@ request_id_context: ContextVar[str | None] = ContextVar("request_id", default=No
 
 def get_request_id() -> str | None:
     return request_id_context.get()
-
-
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get(REQUEST_ID_HEADER, str(uuid4()))
-        token = request_id_context.set(request_id)
-        request.state.request_id = request_id
-        try:
-            response = await call_next(request)
-        finally:
-            request_id_context.reset(token)
-
-        response.headers[REQUEST_ID_HEADER] = request_id
-        return response
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON rendered by pydantic-core's compiled serializer.
+
+    Models, dicts, datetimes and enums are written straight to bytes, with no
+    ``jsonable_encoder`` pass or ``json.dumps``. Hot handlers return
+    ``FastJSONResponse(document)`` themselves, where the document is a dict the service
+    built from rows it trusts. FastAPI passes a returned response through untouched, so
+    ``response_model`` still documents the route but is not validated again.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
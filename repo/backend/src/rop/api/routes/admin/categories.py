@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
 
-from rop.api.dependencies import get_catalog_service
+from rop.api.dependencies import get_catalog_service, get_read_catalog_service
 from rop.application.catalog.schemas import (
     CategoryCreateRequest,
     CategoryResponse,
@@ -26,7 +26,7 @@ def create_category(
 @router.get("/v1/admin/categories/{category_id}", response_model=CategoryResponse)
 def get_category(
     category_id: str,
-    service: CatalogService = Depends(get_catalog_service),
+    service: CatalogService = Depends(get_read_catalog_service),
 ) -> CategoryResponse:
     return service.get_category(category_id)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
 
-from rop.api.dependencies import get_commerce_service
+from rop.api.dependencies import get_commerce_service, get_read_commerce_service
 from rop.application.commerce.schemas import (
     LocationCreateRequest,
     LocationResponse,
@@ -26,7 +26,7 @@ def create_location(
 @router.get("/v1/admin/locations/{location_id}", response_model=LocationResponse)
 def get_location(
     location_id: str,
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> LocationResponse:
     return service.get_location(location_id)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
 
-from rop.api.dependencies import get_catalog_service
+from rop.api.dependencies import get_catalog_service, get_read_catalog_service
 from rop.application.catalog.schemas import (
     MenuItemCreateRequest,
     MenuItemResponse,
@@ -26,7 +26,7 @@ def create_menu_item(
 @router.get("/v1/admin/menu-items/{item_id}", response_model=MenuItemResponse)
 def get_menu_item(
     item_id: str,
-    service: CatalogService = Depends(get_catalog_service),
+    service: CatalogService = Depends(get_read_catalog_service),
 ) -> MenuItemResponse:
     return service.get_menu_item(item_id)
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Header, status
 
-from rop.api.dependencies import get_commerce_service
+from rop.api.dependencies import get_commerce_service, get_read_commerce_service
+from rop.api.responses import FastJSONResponse
 from rop.application.commerce.schemas import OrderCreateRequest, OrderResponse, OrderUpdateRequest
 from rop.application.commerce.service import CommerceService
 
@@ -14,16 +15,19 @@ def create_order(
     request: OrderCreateRequest,
     service: CommerceService = Depends(get_commerce_service),
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
-) -> OrderResponse:
-    return service.create_order(request, idempotency_key=idempotency_key)
+) -> FastJSONResponse:
+    return FastJSONResponse(
+        service.create_order(request, idempotency_key=idempotency_key),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get("/v1/orders/{order_id}", response_model=OrderResponse)
 def get_order(
     order_id: str,
-    service: CommerceService = Depends(get_commerce_service),
-) -> OrderResponse:
-    return service.get_order(order_id)
+    service: CommerceService = Depends(get_read_commerce_service),
+) -> FastJSONResponse:
+    return FastJSONResponse(service.get_order(order_id))
 
 
 @router.patch("/v1/orders/{order_id}", response_model=OrderResponse)
@@ -31,13 +35,13 @@ def update_order(
     order_id: str,
     request: OrderUpdateRequest,
     service: CommerceService = Depends(get_commerce_service),
-) -> OrderResponse:
-    return service.update_order(order_id, request)
+) -> FastJSONResponse:
+    return FastJSONResponse(service.update_order(order_id, request))
 
 
 @router.delete("/v1/orders/{order_id}", response_model=OrderResponse)
 def delete_order(
     order_id: str,
     service: CommerceService = Depends(get_commerce_service),
-) -> OrderResponse:
-    return service.delete_order(order_id)
+) -> FastJSONResponse:
+    return FastJSONResponse(service.delete_order(order_id))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
 
-from rop.api.dependencies import get_commerce_service
+from rop.api.dependencies import get_commerce_service, get_read_commerce_service
 from rop.application.commerce.schemas import (
     SessionCreateRequest,
     SessionResponse,
@@ -24,7 +24,7 @@ def create_session(
 @router.get("/v1/sessions/{session_id}", response_model=SessionResponse)
 def get_session(
     session_id: str,
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> SessionResponse:
     return service.get_session(session_id)
 
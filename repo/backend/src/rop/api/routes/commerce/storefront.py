@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Query
 
-from rop.api.dependencies import get_commerce_service
+from rop.api.dependencies import get_read_commerce_service
 from rop.application.commerce.schemas import (
     LocationListResponse,
     LocationResponse,
+    PickupBoardResponse,
     RestaurantListResponse,
     RestaurantResponse,
 )
@@ -17,7 +18,7 @@ router = APIRouter()
 
 @router.get("/v1/restaurants", response_model=RestaurantListResponse)
 def list_restaurants(
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> RestaurantListResponse:
     return service.list_restaurants()
 
@@ -25,7 +26,7 @@ def list_restaurants(
 @router.get("/v1/restaurants/{restaurant_id}", response_model=RestaurantResponse)
 def get_restaurant(
     restaurant_id: str,
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> RestaurantResponse:
     return service.get_restaurant(restaurant_id)
 
@@ -34,7 +35,7 @@ def get_restaurant(
 def list_locations(
     restaurant_id: str,
     channel: Channel | None = Query(default=None),
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> LocationListResponse:
     return service.list_locations(restaurant_id, channel)
 
@@ -42,6 +43,14 @@ def list_locations(
 @router.get("/v1/locations/{location_id}", response_model=LocationResponse)
 def get_location(
     location_id: str,
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> LocationResponse:
     return service.get_location(location_id)
+
+
+@router.get("/v1/locations/{location_id}/pickup-board", response_model=PickupBoardResponse)
+def get_pickup_board(
+    location_id: str,
+    service: CommerceService = Depends(get_read_commerce_service),
+) -> PickupBoardResponse:
+    return service.pickup_board(location_id)
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
+from rop.api.routes.kitchen.board import router as board_router
 from rop.api.routes.kitchen.queue import router as queue_router
+from rop.api.routes.kitchen.stations import router as stations_router
+from rop.api.routes.kitchen.stats import router as stats_router
 
 router = APIRouter()
 router.include_router(queue_router)
+router.include_router(stations_router)
+router.include_router(board_router)
+router.include_router(stats_router)
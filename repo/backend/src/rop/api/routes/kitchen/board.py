@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from rop.api.dependencies import get_kitchen_service
+from rop.application.kitchen.schemas import (
+    KitchenBoardConsistencyResponse,
+    KitchenBoardRebuildResponse,
+)
+from rop.application.kitchen.service import KitchenService
+
+router = APIRouter()
+
+
+@router.get(
+    "/v1/restaurants/{restaurant_id}/kitchen/board/consistency",
+    response_model=KitchenBoardConsistencyResponse,
+)
+def check_kitchen_board(
+    restaurant_id: str,
+    service: KitchenService = Depends(get_kitchen_service),
+) -> KitchenBoardConsistencyResponse:
+    return service.check_board(restaurant_id)
+
+
+@router.post(
+    "/v1/restaurants/{restaurant_id}/kitchen/board/rebuild",
+    response_model=KitchenBoardRebuildResponse,
+)
+def rebuild_kitchen_board(
+    restaurant_id: str,
+    service: KitchenService = Depends(get_kitchen_service),
+) -> KitchenBoardRebuildResponse:
+    return service.rebuild_board(restaurant_id)
@@ -1,53 +1,125 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+import asyncio
+import re
+from typing import Any
 
-from rop.api.dependencies import get_kitchen_service
+from fastapi import APIRouter, Depends, Query, Request
+from starlette.concurrency import run_in_threadpool
+
+from rop.api.dependencies import (
+    get_async_kitchen_service,
+    get_kitchen_service,
+    run_with_kitchen_service,
+)
+from rop.api.responses import FastJSONResponse
 from rop.application.commerce.schemas import OrderResponse
-from rop.application.kitchen.schemas import KitchenQueueResponse
-from rop.application.kitchen.service import KitchenService
+from rop.application.kitchen.schemas import KitchenQueueChangesResponse, KitchenQueueResponse
+from rop.application.kitchen.service import AsyncKitchenService, KitchenService
 from rop.domain.commerce.enums import OrderStatus
+from rop.domain.errors import ValidationError
+from rop.infrastructure.messaging.change_notifier import ChangeNotifier
 
 router = APIRouter()
 
+MAX_LONG_POLL_SECONDS = 30.0
+_WAIT_PATTERN = re.compile(r"^(?P<value>\d+(?:\.\d+)?)(?P<unit>ms|s)?$")
+
+
+def _parse_wait(raw_value: str | None) -> float:
+    if raw_value is None:
+        return 0.0
+    match = _WAIT_PATTERN.match(raw_value.strip())
+    if match is None:
+        raise ValidationError(
+            "wait must be a duration such as '20s' or '500ms'",
+            code="INVALID_WAIT",
+            details={"wait": raw_value},
+        )
+    seconds = float(match.group("value"))
+    if match.group("unit") == "ms":
+        seconds /= 1000
+    return min(seconds, MAX_LONG_POLL_SECONDS)
+
+
+def _has_changes(response: dict[str, Any]) -> bool:
+    return bool(response["reset"] or response["orders"] or response["removed"])
+
 
 @router.get("/v1/restaurants/{restaurant_id}/kitchen/orders", response_model=KitchenQueueResponse)
-def kitchen_queue(
+async def kitchen_queue(
     restaurant_id: str,
     status: OrderStatus | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
+    service: AsyncKitchenService = Depends(get_async_kitchen_service),
+) -> FastJSONResponse:
+    queue = await service.queue(restaurant_id, status, limit)
+    if queue is None:
+        queue = await run_in_threadpool(
+            run_with_kitchen_service,
+            lambda kitchen: kitchen.queue(restaurant_id, status, limit),
+        )
+    return FastJSONResponse(queue)
+
+
+@router.get(
+    "/v1/restaurants/{restaurant_id}/kitchen/orders/changes",
+    response_model=KitchenQueueChangesResponse,
+)
+async def kitchen_queue_changes(
+    request: Request,
+    restaurant_id: str,
+    since: str | None = Query(default=None),
+    wait: str | None = Query(default=None),
     service: KitchenService = Depends(get_kitchen_service),
-) -> KitchenQueueResponse:
-    return service.queue(restaurant_id, status, limit)
+) -> FastJSONResponse:
+    wait_seconds = _parse_wait(wait)
+    notifier: ChangeNotifier = request.app.state.kitchen_changes
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_seconds
+    with notifier.watch(restaurant_id) as changed:
+        response = await run_in_threadpool(service.changes, restaurant_id, since)
+        if _has_changes(response) or wait_seconds <= 0:
+            return FastJSONResponse(response)
+        if not notifier.subscribed(restaurant_id):
+            # Events published before the fanout's SUBSCRIBE lands never wake the notifier,
+            # so read again once it has.
+            await notifier.wait_subscribed(restaurant_id, wait_seconds)
+            response = await run_in_threadpool(service.changes, restaurant_id, response["cursor"])
+            if _has_changes(response):
+                return FastJSONResponse(response)
+        if await notifier.wait(changed, max(0.0, deadline - loop.time())):
+            response = await run_in_threadpool(service.changes, restaurant_id, response["cursor"])
+        return FastJSONResponse(response)
 
 
 @router.post("/v1/orders/{order_id}/accept", response_model=OrderResponse)
 def accept_order(
     order_id: str,
     service: KitchenService = Depends(get_kitchen_service),
-) -> OrderResponse:
-    return service.transition(order_id, "accept")
+) -> FastJSONResponse:
+    return FastJSONResponse(service.transition(order_id, "accept"))
 
 
 @router.post("/v1/orders/{order_id}/ready", response_model=OrderResponse)
 def mark_ready(
     order_id: str,
     service: KitchenService = Depends(get_kitchen_service),
-) -> OrderResponse:
-    return service.transition(order_id, "ready")
+) -> FastJSONResponse:
+    return FastJSONResponse(service.transition(order_id, "ready"))
 
 
 @router.post("/v1/orders/{order_id}/served", response_model=OrderResponse)
 def mark_served(
     order_id: str,
     service: KitchenService = Depends(get_kitchen_service),
-) -> OrderResponse:
-    return service.transition(order_id, "served")
+) -> FastJSONResponse:
+    return FastJSONResponse(service.transition(order_id, "served"))
 
 
 @router.post("/v1/orders/{order_id}/settled", response_model=OrderResponse)
 def mark_settled(
     order_id: str,
     service: KitchenService = Depends(get_kitchen_service),
-) -> OrderResponse:
-    return service.transition(order_id, "settled")
+) -> FastJSONResponse:
+    return FastJSONResponse(service.transition(order_id, "settled"))
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from starlette.concurrency import run_in_threadpool
+
+from rop.api.dependencies import get_async_kitchen_service, run_with_kitchen_service
+from rop.api.responses import FastJSONResponse
+from rop.application.kitchen.schemas import KitchenStationQueueResponse
+from rop.application.kitchen.service import AsyncKitchenService
+from rop.domain.commerce.enums import OrderStatus
+
+router = APIRouter()
+
+
+@router.get(
+    "/v1/restaurants/{restaurant_id}/kitchen/stations/{station}/orders",
+    response_model=KitchenStationQueueResponse,
+)
+async def station_queue(
+    restaurant_id: str,
+    station: str,
+    status: OrderStatus | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    service: AsyncKitchenService = Depends(get_async_kitchen_service),
+) -> FastJSONResponse:
+    queue = await service.station_queue(restaurant_id, station, status, limit)
+    if queue is None:
+        queue = await run_in_threadpool(
+            run_with_kitchen_service,
+            lambda kitchen: kitchen.station_queue(restaurant_id, station, status, limit),
+        )
+    return FastJSONResponse(queue)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from rop.api.dependencies import get_kitchen_service
+from rop.application.kitchen.schemas import PrepSummaryResponse, PrepTimeStatsResponse
+from rop.application.kitchen.service import KitchenService
+
+router = APIRouter()
+
+
+@router.get(
+    "/v1/restaurants/{restaurant_id}/kitchen/prep-stats",
+    response_model=PrepTimeStatsResponse,
+)
+def prep_stats(
+    restaurant_id: str,
+    menu_item_id: str | None = Query(default=None),
+    station: str | None = Query(default=None),
+    service: KitchenService = Depends(get_kitchen_service),
+) -> PrepTimeStatsResponse:
+    return service.prep_stats(restaurant_id, menu_item_id, station)
+
+
+@router.get(
+    "/v1/restaurants/{restaurant_id}/kitchen/prep-summary",
+    response_model=PrepSummaryResponse,
+)
+def prep_summary(
+    restaurant_id: str,
+    station: str | None = Query(default=None),
+    service: KitchenService = Depends(get_kitchen_service),
+) -> PrepSummaryResponse:
+    return service.prep_summary(restaurant_id, station)
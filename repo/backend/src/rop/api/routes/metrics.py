@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from fastapi import APIRouter, Request, Response
+from prometheus_client import REGISTRY
+from prometheus_client.exposition import choose_encoder
 
 router = APIRouter()
 
 
 @router.get("/metrics")
-def metrics() -> Response:
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+def metrics(request: Request) -> Response:
+    # Exemplars are only part of the OpenMetrics format, which Prometheus asks for.
+    encoder, content_type = choose_encoder(request.headers.get("accept", ""))
+    return Response(content=encoder(REGISTRY), media_type=content_type)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
 
-from rop.api.dependencies import get_commerce_service
+from rop.api.dependencies import get_commerce_service, get_read_commerce_service
 from rop.application.commerce.schemas import (
     SessionResponse,
     TableCreateRequest,
@@ -26,7 +26,7 @@ def create_table(
 @router.get("/v1/tables/{table_id}", response_model=TableResponse)
 def get_table(
     table_id: str,
-    service: CommerceService = Depends(get_commerce_service),
+    service: CommerceService = Depends(get_read_commerce_service),
 ) -> TableResponse:
     return service.get_table(table_id)
 
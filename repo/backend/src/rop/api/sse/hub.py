@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
+
+logger = logging.getLogger(__name__)
+
+SSE_CLIENTS = Gauge(
+    "sse_clients",
+    "Connected Server-Sent Events clients",
+    ["stream"],
+)
+SSE_DROPPED_CLIENTS = Counter(
+    "sse_dropped_clients_total",
+    "Server-Sent Events clients disconnected because their queue overflowed",
+    ["stream"],
+)
+
+ORDER_STREAM = "order"
+PICKUP_BOARD_STREAM = "pickup_board"
+
+_PICKUP_CHANNEL = "pickup"
+_PICKUP_READY_STATUS = "ready"
+_PICKUP_CLEARED_STATUSES = frozenset({"served", "settled", "canceled"})
+
+
+def _queue_size() -> int:
+    return max(1, int(os.getenv("SSE_QUEUE_SIZE", "64")))
+
+
+def sse_frame(event: str, data: str, event_id: int | None = None) -> str:
+    """Format one SSE message; ``data`` must be single-line JSON."""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {data}\n\n"
+
+
+@dataclass(eq=False, slots=True)
+class SseSubscriber:
+    stream: str
+    restaurant_id: str
+    key: str
+    # ``None`` tells the response to end because the client fell behind.
+    queue: asyncio.Queue[str | None]
+
+
+def _pickup_board_frame(payload: dict[str, Any]) -> str | None:
+    status = payload.get("status")
+    if status == _PICKUP_READY_STATUS:
+        event = "pickup.ready"
+    elif status in _PICKUP_CLEARED_STATUSES:
+        event = "pickup.cleared"
+    else:
+        return None
+    # The board is public, so it only carries what a pickup screen displays.
+    data = {
+        "order_id": payload.get("order_id"),
+        "status": status,
+        "updated_at": payload.get("updated_at"),
+    }
+    seq = payload.get("seq")
+    return sse_frame(
+        event,
+        json.dumps(data, separators=(",", ":")),
+        seq if isinstance(seq, int) else None,
+    )
+
+
+class SseHub:
+    """Fans restaurant events out to Server-Sent Events clients.
+
+    Clients follow a single order or the pickup board of one location instead of a whole
+    restaurant. Subscribers are indexed by order id and by location, and each event is
+    decoded and formatted once; the resulting frame is shared by every subscriber it
+    reaches. Events for restaurants without SSE clients are not decoded at all.
+    """
+
+    def __init__(
+        self,
+        subscriptions: FanoutSubscriptions | None = None,
+        queue_size: int | None = None,
+    ) -> None:
+        self._subscriptions = subscriptions
+        self._queue_size = queue_size or _queue_size()
+        self._by_order: dict[str, set[SseSubscriber]] = {}
+        self._by_pickup_location: dict[str, set[SseSubscriber]] = {}
+        self._restaurants: dict[str, int] = {}
+
+    def _index(self, stream: str) -> dict[str, set[SseSubscriber]]:
+        return self._by_order if stream == ORDER_STREAM else self._by_pickup_location
+
+    def subscribe(self, stream: str, restaurant_id: str, key: str) -> SseSubscriber:
+        """Start queueing frames for an order id or a pickup location id."""
+        subscriber = SseSubscriber(
+            stream=stream,
+            restaurant_id=restaurant_id,
+            key=key,
+            queue=asyncio.Queue(maxsize=self._queue_size),
+        )
+        self._index(stream).setdefault(key, set()).add(subscriber)
+        self._restaurants[restaurant_id] = self._restaurants.get(restaurant_id, 0) + 1
+        if self._subscriptions is not None:
+            self._subscriptions.acquire(restaurant_id)
+        SSE_CLIENTS.labels(stream=stream).inc()
+        return subscriber
+
+    def unsubscribe(self, subscriber: SseSubscriber) -> None:
+        index = self._index(subscriber.stream)
+        subscribers = index.get(subscriber.key)
+        if subscribers is None or subscriber not in subscribers:
+            return
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del index[subscriber.key]
+        remaining = self._restaurants[subscriber.restaurant_id] - 1
+        if remaining:
+            self._restaurants[subscriber.restaurant_id] = remaining
+        else:
+            del self._restaurants[subscriber.restaurant_id]
+        if self._subscriptions is not None:
+            self._subscriptions.release(subscriber.restaurant_id)
+        SSE_CLIENTS.labels(stream=subscriber.stream).dec()
+
+    def publish(self, restaurant_id: str, message_json_str: str) -> None:
+        if restaurant_id not in self._restaurants:
+            return
+        try:
+            payload = json.loads(message_json_str)
+        except ValueError:
+            return
+        if not isinstance(payload, dict):
+            return
+
+        order_id = payload.get("order_id")
+        subscribers = self._by_order.get(order_id) if isinstance(order_id, str) else None
+        if subscribers:
+            seq = payload.get("seq")
+            self._offer(
+                subscribers,
+                sse_frame(
+                    str(payload.get("event_type", "message")),
+                    message_json_str,
+                    seq if isinstance(seq, int) else None,
+                ),
+            )
+
+        location_id = payload.get("location_id")
+        if payload.get("channel") != _PICKUP_CHANNEL or not isinstance(location_id, str):
+            return
+        subscribers = self._by_pickup_location.get(location_id)
+        if subscribers:
+            frame = _pickup_board_frame(payload)
+            if frame is not None:
+                self._offer(subscribers, frame)
+
+    def _offer(self, subscribers: set[SseSubscriber], frame: str) -> None:
+        for subscriber in list(subscribers):
+            try:
+                subscriber.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: SseSubscriber) -> None:
+        self.unsubscribe(subscriber)
+        SSE_DROPPED_CLIENTS.labels(stream=subscriber.stream).inc()
+        logger.warning(
+            "sse_client_dropped",
+            extra={"restaurant_id": subscriber.restaurant_id, "stream": subscriber.stream},
+        )
+        # Make room for the end-of-stream marker; the client reconnects for a fresh snapshot.
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
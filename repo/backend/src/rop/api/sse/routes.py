@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+
+import pydantic_core
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Receive, Scope, Send
+
+from rop.api.dependencies import get_commerce_service
+from rop.api.sse.hub import (
+    ORDER_STREAM,
+    PICKUP_BOARD_STREAM,
+    SseHub,
+    SseSubscriber,
+    sse_frame,
+)
+from rop.application.commerce.service import CommerceService
+
+router = APIRouter()
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+# Tells EventSource how long to wait before reconnecting after the stream ends.
+_RETRY_MILLISECONDS = 3000
+
+
+def _keepalive_seconds() -> float:
+    return float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+
+
+async def _frames(subscriber: SseSubscriber, snapshot: str) -> AsyncIterator[str]:
+    yield f"retry: {_RETRY_MILLISECONDS}\n" + snapshot
+    keepalive_seconds = _keepalive_seconds()
+    while True:
+        try:
+            frame = await asyncio.wait_for(subscriber.queue.get(), keepalive_seconds)
+        except asyncio.TimeoutError:
+            # Comments keep proxies from timing the stream out and surface dead clients.
+            yield ": keepalive\n\n"
+            continue
+        if frame is None:
+            return
+        yield frame
+
+
+class _EventStreamResponse(StreamingResponse):
+    """Streams a subscriber's frames and unsubscribes it however the response ends."""
+
+    def __init__(self, hub: SseHub, subscriber: SseSubscriber, snapshot: str) -> None:
+        super().__init__(
+            _frames(subscriber, snapshot),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+        )
+        self._hub = hub
+        self._subscriber = subscriber
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._hub.unsubscribe(self._subscriber)
+
+
+@router.get("/v1/orders/{order_id}/events")
+async def order_events(
+    order_id: str,
+    request: Request,
+    service: CommerceService = Depends(get_commerce_service),
+) -> StreamingResponse:
+    """Stream one order's events, starting with a ``snapshot`` of the order."""
+    hub: SseHub = request.app.state.sse_hub
+    order = await run_in_threadpool(service.get_order, order_id)
+    # Subscribe before reading the snapshot so no change falls between the two.
+    subscriber = hub.subscribe(ORDER_STREAM, order["restaurant_id"], order["id"])
+    try:
+        order = await run_in_threadpool(service.get_order, order_id)
+    except BaseException:
+        hub.unsubscribe(subscriber)
+        raise
+    snapshot = sse_frame("snapshot", pydantic_core.to_json(order).decode())
+    return _EventStreamResponse(hub, subscriber, snapshot)
+
+
+@router.get("/v1/locations/{location_id}/pickup-board/events")
+async def pickup_board_events(
+    location_id: str,
+    request: Request,
+    service: CommerceService = Depends(get_commerce_service),
+) -> StreamingResponse:
+    """Public stream of pickup orders becoming ready or collected at a location."""
+    hub: SseHub = request.app.state.sse_hub
+    location = await run_in_threadpool(service.get_location, location_id)
+    subscriber = hub.subscribe(PICKUP_BOARD_STREAM, location.restaurant_id, location.id)
+    try:
+        board = await run_in_threadpool(service.pickup_board, location_id)
+    except BaseException:
+        hub.unsubscribe(subscriber)
+        raise
+    return _EventStreamResponse(hub, subscriber, sse_frame("snapshot", board.model_dump_json()))
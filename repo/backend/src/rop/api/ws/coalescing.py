@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+
+# Order events carry the whole order, so a later status change or update for the same
+# order supersedes an earlier one still waiting in a batch. ``order.created`` is never
+# dropped: clients create tickets from it.
+_SUPERSEDABLE_EVENTS = frozenset(
+    {
+        "order.updated",
+        "order.accepted",
+        "order.ready",
+        "order.served",
+        "order.settled",
+        "order.canceled",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def supersede_key(message_json_str: str) -> str | None:
+    """Order id a frame is a superseded status snapshot of, or ``None`` to always send it.
+
+    Every recipient of an event shares the same string, so the cache decodes each event
+    once however many coalescing connections it reaches.
+    """
+    try:
+        payload = json.loads(message_json_str)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    event_type = payload.get("event_type")
+    order_id = payload.get("order_id")
+    if event_type in _SUPERSEDABLE_EVENTS and isinstance(order_id, str):
+        return order_id
+    return None
+
+
+def collapse(frames: list[str]) -> list[str]:
+    """Drop order status snapshots that a later one in the batch supersedes."""
+    if len(frames) < 2:
+        return frames
+    latest: dict[str, int] = {}
+    for position, frame in enumerate(frames):
+        key = supersede_key(frame)
+        if key is not None:
+            latest[key] = position
+    return [
+        frame
+        for position, frame in enumerate(frames)
+        if (key := supersede_key(frame)) is None or latest[key] == position
+    ]
+
+
+def batch_frame(frames: list[str]) -> str:
+    """Join already-encoded JSON frames into one JSON array frame without re-encoding."""
+    return "[" + ",".join(frames) + "]"
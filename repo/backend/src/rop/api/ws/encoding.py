@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+
+import msgpack  # type: ignore[import-untyped]
+
+from rop.api.ws.coalescing import batch_frame
+
+JSON = "json"
+MSGPACK = "msgpack"
+
+ENCODINGS = (JSON, MSGPACK)
+
+Frame = str | bytes
+
+
+@lru_cache(maxsize=4096)
+def msgpack_event(message_json_str: str) -> bytes:
+    """MessagePack form of a published event.
+
+    Every recipient of an event shares the same string, so each event is converted once
+    however many msgpack clients receive it.
+    """
+    return msgpack.packb(json.loads(message_json_str))
+
+
+def _json_with_prev_seq(message_json_str: str, prev_seq: int) -> str:
+    # Published events start with their seq, so the watermark goes right after it.
+    end = message_json_str.find(",")
+    if end < 0:
+        end = len(message_json_str) - 1
+    return f'{message_json_str[:end]},"prev_seq":{prev_seq}{message_json_str[end:]}'
+
+
+def _msgpack_with_prev_seq(packed: bytes, prev_seq: int) -> bytes:
+    # Rewrite the map header for one more entry and put the watermark first.
+    head = packed[0]
+    if head == 0xDE:
+        size, body = int.from_bytes(packed[1:3], "big"), packed[3:]
+    elif head == 0xDF:
+        size, body = int.from_bytes(packed[1:5], "big"), packed[5:]
+    else:
+        size, body = head & 0x0F, packed[1:]
+    packer = msgpack.Packer()
+    return packer.pack_map_header(size + 1) + packer.pack("prev_seq") + packer.pack(prev_seq) + body
+
+
+def encode_frame(message_json_str: str, encoding: str, prev_seq: int | None = None) -> Frame:
+    """The socket frame for an event, with ``prev_seq`` added when one is given.
+
+    The shared encoding is reused either way; a watermark only costs a splice.
+    """
+    if encoding == MSGPACK:
+        packed = msgpack_event(message_json_str)
+        return packed if prev_seq is None else _msgpack_with_prev_seq(packed, prev_seq)
+    if prev_seq is None:
+        return message_json_str
+    return _json_with_prev_seq(message_json_str, prev_seq)
+
+
+def encode_batch(
+    frames: list[str],
+    encoding: str,
+    prev_seqs: list[int | None] | None = None,
+) -> Frame:
+    """One array frame holding ``frames``, built from their shared encodings."""
+    watermarks = prev_seqs or [None] * len(frames)
+    if encoding == MSGPACK:
+        # A msgpack array is its header followed by the packed elements.
+        return msgpack.Packer().pack_array_header(len(frames)) + b"".join(
+            _msgpack_with_prev_seq(msgpack_event(frame), prev_seq)
+            if prev_seq is not None
+            else msgpack_event(frame)
+            for frame, prev_seq in zip(frames, watermarks)
+        )
+    return batch_frame(
+        [
+            frame if prev_seq is None else _json_with_prev_seq(frame, prev_seq)
+            for frame, prev_seq in zip(frames, watermarks)
+        ]
+    )
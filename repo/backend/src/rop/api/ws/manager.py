@@ -1,53 +1,560 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from collections import defaultdict
+import os
+import re
+import zlib
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
 
 from fastapi import WebSocket
+from prometheus_client import Counter, Gauge, Histogram
+
+from rop.api.ws.coalescing import collapse
+from rop.api.ws.encoding import JSON, Frame, encode_batch, encode_frame
+from rop.api.ws.topics import index_topic, matches, message_topics
+from rop.infrastructure.messaging.event_stream import frame_seq
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
 
 logger = logging.getLogger(__name__)
 
+WS_SEND_QUEUE_MESSAGES = Gauge(
+    "ws_send_queue_messages",
+    "Messages waiting in websocket send queues",
+)
+WS_SEND_QUEUE_DEPTH = Histogram(
+    "ws_send_queue_depth",
+    "Websocket send queue depth right after a message is enqueued",
+    buckets=(0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
+WS_EVICTIONS = Counter(
+    "ws_evictions_total",
+    "Websocket clients disconnected for falling behind",
+    ["reason"],
+)
+WS_BATCH_EVENTS = Histogram(
+    "ws_batch_events",
+    "Events in each coalesced websocket frame",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+WS_SUPERSEDED_EVENTS = Counter(
+    "ws_superseded_events_total",
+    "Order status events dropped from a coalesced frame because a later one replaced them",
+)
+WS_CONNECTIONS = Gauge(
+    "ws_connections",
+    "Websocket connections by restaurant, role and whether they owe a heartbeat reply",
+    ["restaurant_id", "role", "state"],
+)
+WS_REJECTED_CONNECTIONS = Counter(
+    "ws_rejected_connections_total",
+    "Websocket clients refused at connect",
+    ["reason"],
+)
+
+_PING_FRAME = json.dumps({"type": "ping"})
+# Roles come from the client, so anything unexpected shares one label value.
+_ROLE_LABEL = re.compile(r"^[A-Z][A-Z_]{0,31}$")
+
+# Close code 1013 ("try again later") tells a well-behaved client to reconnect and resync.
+_EVICTION_CLOSE_CODE = 1013
+
+
+# Produces the frames a resuming client missed and the sequence they cover through.
+Replay = Callable[[], Awaitable[tuple[list[str], int | None]]]
+
+
+def _send_queue_size() -> int:
+    return max(1, int(os.getenv("WS_SEND_QUEUE_SIZE", "256")))
+
+
+def _send_timeout_seconds() -> float:
+    return float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "5"))
+
+
+def _ping_interval_seconds() -> float:
+    return float(os.getenv("WS_PING_INTERVAL_SECONDS", "20"))
+
+
+def _ping_timeout_seconds() -> float:
+    return float(os.getenv("WS_PING_TIMEOUT_SECONDS", "20"))
+
+
+def _max_connections() -> int:
+    return max(1, int(os.getenv("WS_MAX_CONNECTIONS", "10000")))
+
+
+def _max_connections_per_restaurant() -> int:
+    return max(1, int(os.getenv("WS_MAX_CONNECTIONS_PER_RESTAURANT", "500")))
+
+
+def _role_label(role: str) -> str:
+    return role if _ROLE_LABEL.match(role) else "OTHER"
+
+
+def _lock_stripes() -> int:
+    return max(1, int(os.getenv("WS_LOCK_STRIPES", "16")))
+
+
+@dataclass(eq=False, slots=True)
+class _Connection:
+    websocket: WebSocket
+    restaurant_id: str
+    role: str
+    queue: asyncio.Queue[str]
+    topics: set[str] = field(default_factory=set)
+    # Zero sends every frame on its own; otherwise frames are batched over this window.
+    coalesce_seconds: float = 0.0
+    # Frames are queued as the published JSON and encoded for the socket when sent.
+    encoding: str = JSON
+    writer: asyncio.Task[None] | None = field(default=None)
+    # Only clients that asked for heartbeats are pinged and reaped for not answering.
+    heartbeat: bool = False
+    # Loop time of the client's last inbound message and of the ping still unanswered.
+    last_seen: float = 0.0
+    pinged_at: float | None = None
+    # Live frames up to this sequence were already sent by the replay and are skipped.
+    skip_through: int | None = None
+    # Filtered and coalescing clients skip seqs by design, so their event frames carry
+    # ``prev_seq``: the seq of the event frame sent before it on this connection.
+    watermark: bool = False
+    last_seq: int = 0
+
+
+@dataclass(slots=True)
+class _RestaurantConnections:
+    sockets: dict[WebSocket, _Connection] = field(default_factory=dict)
+    # Connections without topics receive every event for the restaurant.
+    unfiltered: set[_Connection] = field(default_factory=set)
+    # Highest seq broadcast so far, to notice events lost before they reached this replica.
+    last_seq: int | None = None
+    # Each filter is indexed under one of its topics; candidates are then checked in full.
+    by_topic: dict[str, set[_Connection]] = field(default_factory=dict)
+
+    def index(self, connection: _Connection) -> None:
+        if not connection.topics:
+            self.unfiltered.add(connection)
+        for topic_filter in connection.topics:
+            self.by_topic.setdefault(index_topic(topic_filter), set()).add(connection)
+
+    def unindex(self, connection: _Connection) -> None:
+        self.unfiltered.discard(connection)
+        for topic_filter in connection.topics:
+            topic = index_topic(topic_filter)
+            subscribers = self.by_topic.get(topic)
+            if subscribers is None:
+                continue
+            subscribers.discard(connection)
+            if not subscribers:
+                del self.by_topic[topic]
+
 
 class ConnectionManager:
-    def __init__(self) -> None:
-        self._connections: dict[str, set[WebSocket]] = defaultdict(set)
-        self._socket_to_restaurant: dict[WebSocket, str] = {}
-        self._lock = asyncio.Lock()
+    """Tracks websocket clients per restaurant and fans events out to them.
+
+    Clients may subscribe to topic filters (see ``rop.api.ws.topics``) and an index from
+    topic to connections means an event is only checked against clients with a filter on
+    one of its topics, and reaches those with a filter it fully matches; clients without
+    topics get every event for their restaurant.
+
+    Clients can opt into coalescing: their writer collects frames for a short window and
+    sends them as one JSON array frame, dropping order status updates that a later one
+    supersedes. Clients can also ask for MessagePack binary frames; the encoded form of
+    an event is shared by every recipient rather than produced per socket.
 
-    async def register(self, websocket: WebSocket, restaurant_id: str, role: str) -> None:
+    Filtered and coalescing clients see gaps in ``seq`` by design, so their event frames
+    also carry ``prev_seq``, the seq of the previous event frame sent to them; a client
+    that finds it differs from the last seq it received has missed events. When the
+    restaurant's own ``seq`` jumps, events were lost before reaching this replica, and
+    those clients are disconnected to resume with ``last_event_id``.
+
+    Clients that opt into heartbeats are pinged once silent for the ping interval and
+    reaped if they stay silent past the timeout, so sockets left half-open by sleeping
+    tablets do not linger. Other clients, which may never reply, rely on the server's
+    protocol-level ping. Each restaurant, and the replica as a whole, is capped at a
+    number of connections.
+
+    Every connection owns a bounded send queue drained by its own writer task, so a
+    broadcast only enqueues and one slow client never holds up the rest. Clients whose
+    queue overflows, or whose send stalls past the deadline, are disconnected. Registry
+    updates take one of a fixed set of locks picked by restaurant id.
+
+    The first connection for a restaurant acquires it in ``subscriptions`` and the last
+    one releases it, so the replica only receives events it has clients for.
+    """
+
+    def __init__(
+        self,
+        send_queue_size: int | None = None,
+        send_timeout_seconds: float | None = None,
+        subscriptions: FanoutSubscriptions | None = None,
+        ping_interval_seconds: float | None = None,
+        ping_timeout_seconds: float | None = None,
+        max_connections_per_restaurant: int | None = None,
+        max_connections: int | None = None,
+    ) -> None:
+        self._subscriptions = subscriptions
+        self._ping_interval_seconds = ping_interval_seconds or _ping_interval_seconds()
+        self._ping_timeout_seconds = ping_timeout_seconds or _ping_timeout_seconds()
+        self._max_connections_per_restaurant = (
+            max_connections_per_restaurant or _max_connections_per_restaurant()
+        )
+        self._max_connections = max_connections or _max_connections()
+        self._send_queue_size = send_queue_size or _send_queue_size()
+        self._send_timeout_seconds = send_timeout_seconds or _send_timeout_seconds()
+        self._restaurants: dict[str, _RestaurantConnections] = {}
+        self._by_socket: dict[WebSocket, _Connection] = {}
+        self._locks = [asyncio.Lock() for _ in range(_lock_stripes())]
+        self._closing: set[asyncio.Task[None]] = set()
+        self._heartbeat: asyncio.Task[None] | None = None
+        self._gauge_labels: set[tuple[str, str, str]] = set()
+
+    def _lock(self, restaurant_id: str) -> asyncio.Lock:
+        return self._locks[zlib.crc32(restaurant_id.encode("utf-8")) % len(self._locks)]
+
+    async def register(
+        self,
+        websocket: WebSocket,
+        restaurant_id: str,
+        role: str,
+        topics: Iterable[str] = (),
+        replay: Replay | None = None,
+        coalesce_seconds: float = 0.0,
+        encoding: str = JSON,
+        last_event_id: int | None = None,
+        heartbeat: bool = False,
+    ) -> bool:
+        """Accept and index a client, returning ``False`` if its restaurant or the replica
+        is full.
+
+        With ``replay`` the client is indexed first, so live events start queueing, then
+        the missed frames are sent before the writer drains the queue, skipping anything
+        the replay already covered. With ``coalesce_seconds`` every frame, replay included,
+        is a JSON array of events. ``last_event_id`` is the seq the client resumes from,
+        the first ``prev_seq`` it is sent. With ``heartbeat`` the client is pinged when
+        silent and must answer.
+        """
         await websocket.accept()
-        async with self._lock:
-            self._connections[restaurant_id].add(websocket)
-            self._socket_to_restaurant[websocket] = restaurant_id
+        connection = _Connection(
+            websocket=websocket,
+            restaurant_id=restaurant_id,
+            role=role,
+            queue=asyncio.Queue(maxsize=self._send_queue_size),
+            topics=set(topics),
+            coalesce_seconds=coalesce_seconds,
+            encoding=encoding,
+            last_seen=asyncio.get_running_loop().time(),
+            last_seq=last_event_id or 0,
+            heartbeat=heartbeat,
+        )
+        connection.watermark = bool(connection.topics) or bool(coalesce_seconds)
+        async with self._lock(restaurant_id):
+            restaurant = self._restaurants.get(restaurant_id)
+            full: str | None
+            if len(self._by_socket) >= self._max_connections:
+                full = "replica_limit"
+            elif (
+                restaurant is not None
+                and len(restaurant.sockets) >= self._max_connections_per_restaurant
+            ):
+                full = "restaurant_limit"
+            else:
+                full = None
+                if restaurant is None:
+                    restaurant = self._restaurants[restaurant_id] = _RestaurantConnections()
+                    if self._subscriptions is not None:
+                        self._subscriptions.acquire(restaurant_id)
+                restaurant.sockets[websocket] = connection
+                restaurant.index(connection)
+                self._by_socket[websocket] = connection
+        if full is not None:
+            WS_REJECTED_CONNECTIONS.labels(reason=full).inc()
+            logger.warning(
+                "ws_client_rejected", extra={"restaurant_id": restaurant_id, "reason": full}
+            )
+            scope = full.partition("_")[0]
+            await self._close(websocket, f"{scope} connection limit reached")
+            return False
+        if replay is not None:
+            try:
+                frames, connection.skip_through = await replay()
+                if coalesce_seconds and frames:
+                    frames = collapse(frames)
+                    encoded = [encode_batch(frames, encoding, self._watermarks(connection, frames))]
+                else:
+                    encoded = [
+                        encode_frame(frame, encoding, prev_seq)
+                        for frame, prev_seq in zip(frames, self._watermarks(connection, frames))
+                    ]
+                for frame in encoded:
+                    await asyncio.wait_for(
+                        self._send_frame(websocket, frame),
+                        timeout=self._send_timeout_seconds,
+                    )
+            except BaseException:
+                await self._remove(connection)
+                raise
+        connection.writer = asyncio.create_task(self._write_loop(connection))
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
         logger.info(
             "ws_client_connected",
-            extra={"restaurant_id": restaurant_id, "role": role},
+            extra={
+                "restaurant_id": restaurant_id,
+                "role": role,
+                "topics": sorted(connection.topics),
+                "coalesce_seconds": coalesce_seconds,
+                "encoding": encoding,
+                "heartbeat": heartbeat,
+            },
         )
+        return True
+
+    async def update_topics(
+        self,
+        websocket: WebSocket,
+        subscribe: Iterable[str] = (),
+        unsubscribe: Iterable[str] = (),
+    ) -> set[str]:
+        """Change a connection's topics and return the resulting subscription."""
+        connection = self._by_socket.get(websocket)
+        if connection is None:
+            return set()
+        async with self._lock(connection.restaurant_id):
+            restaurant = self._restaurants.get(connection.restaurant_id)
+            if restaurant is None or restaurant.sockets.get(websocket) is not connection:
+                return set()
+            restaurant.unindex(connection)
+            connection.topics = (connection.topics | set(subscribe)) - set(unsubscribe)
+            # Once a client has skipped events it keeps getting watermarks.
+            connection.watermark = connection.watermark or bool(connection.topics)
+            restaurant.index(connection)
+            return set(connection.topics)
+
+    def touch(self, websocket: WebSocket) -> None:
+        """Record that a client is alive because it sent a message."""
+        connection = self._by_socket.get(websocket)
+        if connection is None:
+            return
+        connection.last_seen = asyncio.get_running_loop().time()
+        connection.pinged_at = None
+
+    def send(self, websocket: WebSocket, message_json_str: str) -> bool:
+        """Queue a frame for a single client, returning ``False`` if it cannot take it."""
+        connection = self._by_socket.get(websocket)
+        if connection is None:
+            return False
+        try:
+            connection.queue.put_nowait(message_json_str)
+        except asyncio.QueueFull:
+            return False
+        WS_SEND_QUEUE_MESSAGES.inc()
+        return True
 
     async def unregister(self, websocket: WebSocket) -> None:
-        async with self._lock:
-            restaurant_id = self._socket_to_restaurant.pop(websocket, None)
-            if restaurant_id is None:
+        connection = self._by_socket.get(websocket)
+        if connection is None or not await self._remove(connection):
+            return
+        logger.info("ws_client_disconnected", extra={"restaurant_id": connection.restaurant_id})
+
+    async def _remove(self, connection: _Connection) -> bool:
+        async with self._lock(connection.restaurant_id):
+            if self._by_socket.get(connection.websocket) is not connection:
+                return False
+            del self._by_socket[connection.websocket]
+            restaurant = self._restaurants.get(connection.restaurant_id)
+            if restaurant is not None:
+                restaurant.sockets.pop(connection.websocket, None)
+                restaurant.unindex(connection)
+                if not restaurant.sockets:
+                    del self._restaurants[connection.restaurant_id]
+                    if self._subscriptions is not None:
+                        self._subscriptions.release(connection.restaurant_id)
+        WS_SEND_QUEUE_MESSAGES.dec(connection.queue.qsize())
+        writer = connection.writer
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        return True
+
+    async def _evict(self, connection: _Connection, reason: str) -> None:
+        if not await self._remove(connection):
+            return
+        WS_EVICTIONS.labels(reason=reason).inc()
+        logger.warning(
+            "ws_client_evicted",
+            extra={"restaurant_id": connection.restaurant_id, "reason": reason},
+        )
+        # Closing sends a frame to a client that is already behind, so never wait on it here.
+        task = asyncio.create_task(self._close(connection.websocket, reason))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, websocket: WebSocket, reason: str) -> None:
+        with suppress(Exception):
+            await asyncio.wait_for(
+                websocket.close(code=_EVICTION_CLOSE_CODE, reason=reason),
+                timeout=self._send_timeout_seconds,
+            )
+
+    def _skip_replayed(self, connection: _Connection, message: str) -> bool:
+        if connection.skip_through is None:
+            return False
+        seq = frame_seq(message)
+        if seq is None:
+            return False
+        if seq <= connection.skip_through:
+            return True
+        connection.skip_through = None
+        return False
+
+    @staticmethod
+    def _watermarks(connection: _Connection, messages: list[str]) -> list[int | None]:
+        """The ``prev_seq`` of each message about to be sent, advancing the connection's."""
+        if not connection.watermark:
+            return [None] * len(messages)
+        watermarks: list[int | None] = []
+        for message in messages:
+            seq = frame_seq(message)
+            if seq is None:
+                watermarks.append(None)
+                continue
+            watermarks.append(connection.last_seq)
+            connection.last_seq = seq
+        return watermarks
+
+    @staticmethod
+    async def _send_frame(websocket: WebSocket, frame: Frame) -> None:
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+
+    async def _next_frame(self, connection: _Connection) -> Frame | None:
+        message = await connection.queue.get()
+        WS_SEND_QUEUE_MESSAGES.dec()
+        if not connection.coalesce_seconds:
+            if self._skip_replayed(connection, message):
+                return None
+            [prev_seq] = self._watermarks(connection, [message])
+            return encode_frame(message, connection.encoding, prev_seq)
+
+        await asyncio.sleep(connection.coalesce_seconds)
+        messages = [message]
+        while not connection.queue.empty():
+            messages.append(connection.queue.get_nowait())
+        WS_SEND_QUEUE_MESSAGES.dec(len(messages) - 1)
+        messages = [queued for queued in messages if not self._skip_replayed(connection, queued)]
+        if not messages:
+            return None
+        frames = collapse(messages)
+        WS_SUPERSEDED_EVENTS.inc(len(messages) - len(frames))
+        WS_BATCH_EVENTS.observe(len(frames))
+        return encode_batch(frames, connection.encoding, self._watermarks(connection, frames))
+
+    async def _write_loop(self, connection: _Connection) -> None:
+        while True:
+            message = await self._next_frame(connection)
+            if message is None:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._send_frame(connection.websocket, message),
+                    timeout=self._send_timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                await self._evict(connection, "send_timeout")
                 return
-            sockets = self._connections.get(restaurant_id)
-            if not sockets:
+            except Exception:
+                await self.unregister(connection.websocket)
                 return
-            sockets.discard(websocket)
-            if not sockets:
-                self._connections.pop(restaurant_id, None)
-        logger.info("ws_client_disconnected", extra={"restaurant_id": restaurant_id})
+
+    async def _heartbeat_loop(self) -> None:
+        tick = min(self._ping_interval_seconds, self._ping_timeout_seconds) / 2
+        while True:
+            await asyncio.sleep(tick)
+            now = asyncio.get_running_loop().time()
+            counts: dict[tuple[str, str, str], int] = {}
+            for connection in list(self._by_socket.values()):
+                if connection.heartbeat and not await self._check_heartbeat(connection, now):
+                    continue
+                labels = (
+                    connection.restaurant_id,
+                    _role_label(connection.role),
+                    "active" if connection.pinged_at is None else "idle",
+                )
+                counts[labels] = counts.get(labels, 0) + 1
+            self._set_connection_gauges(counts)
+
+    async def _check_heartbeat(self, connection: _Connection, now: float) -> bool:
+        """Ping a silent client or evict one that let a ping go unanswered."""
+        if connection.pinged_at is not None:
+            if now - connection.pinged_at >= self._ping_timeout_seconds:
+                await self._evict(connection, "heartbeat_timeout")
+                return False
+        elif now - connection.last_seen >= self._ping_interval_seconds:
+            connection.pinged_at = now
+            self.send(connection.websocket, _PING_FRAME)
+        return True
+
+    def _set_connection_gauges(self, counts: dict[tuple[str, str, str], int]) -> None:
+        for labels in self._gauge_labels - counts.keys():
+            WS_CONNECTIONS.remove(*labels)
+        for labels, count in counts.items():
+            WS_CONNECTIONS.labels(*labels).set(count)
+        self._gauge_labels = set(counts)
 
     async def broadcast(self, restaurant_id: str, message_json_str: str) -> None:
-        async with self._lock:
-            targets = list(self._connections.get(restaurant_id, set()))
+        restaurant = self._restaurants.get(restaurant_id)
+        if restaurant is None:
+            return
+        seq = frame_seq(message_json_str)
+        if seq is not None:
+            lost = restaurant.last_seq is not None and seq > restaurant.last_seq + 1
+            restaurant.last_seq = max(seq, restaurant.last_seq or 0)
+            if lost:
+                # Filtered clients cannot see this gap themselves; unfiltered ones can.
+                for connection in list(restaurant.sockets.values()):
+                    if connection.watermark:
+                        await self._evict(connection, "upstream_gap")
+        # Only decode the event when someone on this restaurant filters by topic.
+        topics = message_topics(message_json_str) if restaurant.by_topic else set()
+        async with self._lock(restaurant_id):
+            targets = set(restaurant.unfiltered)
+            for topic in topics:
+                targets.update(
+                    connection
+                    for connection in restaurant.by_topic.get(topic, ())
+                    if matches(connection.topics, topics)
+                )
 
-        stale: list[WebSocket] = []
-        for websocket in targets:
+        overflowed: list[_Connection] = []
+        for connection in targets:
             try:
-                await websocket.send_text(message_json_str)
-            except Exception:
-                stale.append(websocket)
+                connection.queue.put_nowait(message_json_str)
+            except asyncio.QueueFull:
+                overflowed.append(connection)
+                continue
+            WS_SEND_QUEUE_MESSAGES.inc()
+            WS_SEND_QUEUE_DEPTH.observe(connection.queue.qsize())
+
+        for connection in overflowed:
+            await self._evict(connection, "queue_full")
 
-        for websocket in stale:
-            await self.unregister(websocket)
+    async def shutdown(self) -> None:
+        tasks: list[asyncio.Task[None]] = []
+        if self._heartbeat is not None:
+            tasks.append(self._heartbeat)
+            self._heartbeat = None
+        self._set_connection_gauges({})
+        for connection in list(self._by_socket.values()):
+            if connection.writer is not None:
+                tasks.append(connection.writer)
+            await self._remove(connection)
+        tasks.extend(self._closing)
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancellations to land so no task outlives the manager.
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,15 +1,132 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import time
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from starlette.concurrency import run_in_threadpool
 
-from rop.api.ws.manager import ConnectionManager
+from rop.api.ws.encoding import ENCODINGS, JSON
+from rop.api.ws.manager import WS_REJECTED_CONNECTIONS, ConnectionManager, Replay
+from rop.api.ws.topics import STATION, matches, message_topics, parse_topics, topic
+from rop.application.catalog.service import AsyncCatalogService
+from rop.domain.errors import NotFoundError, ValidationError
+from rop.infrastructure.db.consistency import async_read_session
+from rop.infrastructure.messaging.event_stream import RedisEventStream
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+# Restaurants confirmed to exist, with the monotonic time each confirmation expires.
+_known_restaurants: dict[str, float] = {}
+_KNOWN_RESTAURANT_SECONDS = 60.0
+
+
+def _coalesce_max_ms() -> int:
+    return int(os.getenv("WS_COALESCE_MAX_MS", "250"))
+
+
+async def _restaurant_exists(restaurant_id: str) -> bool:
+    """Whether ``restaurant_id`` is a live restaurant.
+
+    The id comes from the client and keys the connection cap and metrics labels, so
+    unknown ids are refused. Confirmations are remembered for a minute so a reconnect
+    storm does not turn into one query per socket.
+    """
+    now = time.monotonic()
+    if _known_restaurants.get(restaurant_id, 0.0) > now:
+        return True
+    session = await async_read_session(None)
+    try:
+        await AsyncCatalogService(session).require_restaurant(restaurant_id)
+    except NotFoundError:
+        return False
+    finally:
+        await session.close()
+    _known_restaurants[restaurant_id] = now + _KNOWN_RESTAURANT_SECONDS
+    return True
+
+
+def _query_topics(websocket: WebSocket) -> set[str]:
+    raw_topics = [
+        raw_topic
+        for value in websocket.query_params.getlist("topics")
+        for raw_topic in value.split(",")
+        if raw_topic.strip()
+    ]
+    station = websocket.query_params.get("station")
+    if station is not None:
+        raw_topics.append(topic(STATION, station))
+    return parse_topics(raw_topics)
+
+
+def _replay(restaurant_id: str, last_event_id: int, topics: set[str]) -> Replay:
+    async def replay() -> tuple[list[str], int | None]:
+        missed = await run_in_threadpool(
+            RedisEventStream().read_since,
+            restaurant_id,
+            last_event_id,
+        )
+        if missed.reset:
+            # The seq leads, as on events, so the reset carries a watermark like they do.
+            reset = json.dumps({"seq": missed.seq, "type": "reset"}, separators=(",", ":"))
+            return [reset], missed.seq
+        frames = [
+            frame for frame in missed.events if not topics or matches(topics, message_topics(frame))
+        ]
+        return frames, missed.seq
+
+    return replay
+
+
+def _error_frame(code: str, message: str) -> str:
+    return json.dumps({"type": "error", "code": code, "message": message})
+
+
+async def _handle_control_message(
+    manager: ConnectionManager,
+    websocket: WebSocket,
+    raw_message: str,
+) -> None:
+    """Apply a ``{"action": "subscribe" | "unsubscribe", "topics": [...]}`` message.
+
+    ``{"action": "pong"}`` answers a heartbeat ping (clients connected with
+    ``heartbeat=1``) and needs no reply.
+    """
+    try:
+        message = json.loads(raw_message)
+    except ValueError:
+        manager.send(websocket, _error_frame("INVALID_MESSAGE", "messages must be JSON"))
+        return
+    action = message.get("action") if isinstance(message, dict) else None
+    if action == "pong":
+        return
+    raw_topics = message.get("topics") if isinstance(message, dict) else None
+    if action not in {"subscribe", "unsubscribe"} or not isinstance(raw_topics, list):
+        manager.send(
+            websocket,
+            _error_frame(
+                "INVALID_MESSAGE",
+                'expected {"action": "subscribe" | "unsubscribe", "topics": [...]}',
+            ),
+        )
+        return
+    try:
+        topics = parse_topics(str(raw_topic) for raw_topic in raw_topics)
+    except ValidationError as exc:
+        manager.send(websocket, _error_frame(exc.code, str(exc)))
+        return
+
+    if action == "subscribe":
+        current = await manager.update_topics(websocket, subscribe=topics)
+    else:
+        current = await manager.update_topics(websocket, unsubscribe=topics)
+    manager.send(websocket, json.dumps({"type": "subscriptions", "topics": sorted(current)}))
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     restaurant_id = websocket.query_params.get("restaurant_id")
@@ -17,12 +134,67 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     if not restaurant_id:
         await websocket.close(code=1008, reason="restaurant_id query parameter is required")
         return
+    try:
+        topics = _query_topics(websocket)
+    except ValidationError as exc:
+        await websocket.close(code=1008, reason=str(exc))
+        return
+    last_event_id = websocket.query_params.get("last_event_id")
+    if last_event_id is not None and not last_event_id.isdigit():
+        await websocket.close(code=1008, reason="last_event_id must be a seq from a prior event")
+        return
+    coalesce_ms = websocket.query_params.get("coalesce_ms", "0")
+    if not coalesce_ms.isdigit() or int(coalesce_ms) > _coalesce_max_ms():
+        await websocket.close(
+            code=1008,
+            reason=f"coalesce_ms must be an integer from 0 to {_coalesce_max_ms()}",
+        )
+        return
+    encoding = websocket.query_params.get("encoding", JSON)
+    if encoding not in ENCODINGS:
+        await websocket.close(code=1008, reason=f"encoding must be one of {', '.join(ENCODINGS)}")
+        return
+
+    heartbeat = websocket.query_params.get("heartbeat", "0")
+    if heartbeat not in {"0", "1"}:
+        await websocket.close(code=1008, reason="heartbeat must be 0 or 1")
+        return
+
+    try:
+        known = await _restaurant_exists(restaurant_id)
+    except Exception:
+        logger.exception("ws_restaurant_check_failed", extra={"restaurant_id": restaurant_id})
+        await websocket.close(code=1013, reason="try again later")
+        return
+    if not known:
+        WS_REJECTED_CONNECTIONS.labels(reason="unknown_restaurant").inc()
+        await websocket.close(code=1008, reason="restaurant not found")
+        return
 
     manager: ConnectionManager = websocket.app.state.ws_manager
-    await manager.register(websocket=websocket, restaurant_id=restaurant_id, role=role)
     try:
+        registered = await manager.register(
+            websocket=websocket,
+            restaurant_id=restaurant_id,
+            role=role,
+            topics=topics,
+            replay=(
+                _replay(restaurant_id, int(last_event_id), topics)
+                if last_event_id is not None
+                else None
+            ),
+            coalesce_seconds=int(coalesce_ms) / 1000,
+            encoding=encoding,
+            last_event_id=int(last_event_id) if last_event_id is not None else None,
+            heartbeat=heartbeat == "1",
+        )
+        if not registered:
+            return
         while True:
-            await websocket.receive_text()
+            raw_message = await websocket.receive_text()
+            # Any message proves the client is alive, not only heartbeat replies.
+            manager.touch(websocket)
+            await _handle_control_message(manager, websocket, raw_message)
     except WebSocketDisconnect:
         await manager.unregister(websocket)
     except Exception:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any
+
+from rop.domain.errors import ValidationError
+from rop.domain.kitchen.stations import normalize_station
+
+LOCATION = "location"
+STATION = "station"
+TABLE = "table"
+ORDER = "order"
+EVENT = "event"
+
+TOPIC_DIMENSIONS = (LOCATION, STATION, TABLE, ORDER, EVENT)
+
+# Topics joined by this separator form one filter that matches only events carrying all
+# of them, e.g. ``station:grill;location:loc_001``.
+FILTER_SEPARATOR = ";"
+
+# A filter is indexed under its most selective topic; see ``index_topic``.
+_INDEX_PREFERENCE = (ORDER, TABLE, STATION, LOCATION, EVENT)
+
+_MAX_TOPIC_VALUE_LENGTH = 100
+
+
+def topic(dimension: str, value: str) -> str:
+    return f"{dimension}:{value}"
+
+
+def _parse_topic(raw_topic: str) -> str:
+    dimension, _, value = raw_topic.strip().partition(":")
+    value = value.strip()
+    if dimension not in TOPIC_DIMENSIONS or not value or len(value) > _MAX_TOPIC_VALUE_LENGTH:
+        raise ValidationError(
+            f"topics must look like '<dimension>:<value>' with a dimension in "
+            f"{', '.join(TOPIC_DIMENSIONS)}",
+            code="INVALID_TOPIC",
+            details={"topic": raw_topic},
+        )
+    if dimension == STATION:
+        value = normalize_station(value)
+    return topic(dimension, value)
+
+
+def parse_topics(raw_topics: Iterable[str]) -> set[str]:
+    """Validate filters of ``dimension:value`` topics such as ``station:grill``.
+
+    Each entry is one filter; topics joined with ``;`` must all match, so
+    ``station:grill;location:loc_001`` is the grill at one location. Filters come back in
+    a canonical form with their topics sorted.
+    """
+    filters: set[str] = set()
+    for raw_filter in raw_topics:
+        topics = {_parse_topic(raw_topic) for raw_topic in raw_filter.split(FILTER_SEPARATOR)}
+        filters.add(FILTER_SEPARATOR.join(sorted(topics)))
+    return filters
+
+
+@lru_cache(maxsize=4096)
+def filter_topics(topic_filter: str) -> frozenset[str]:
+    """The topics an event must all carry to match a canonical filter."""
+    return frozenset(topic_filter.split(FILTER_SEPARATOR))
+
+
+def index_topic(topic_filter: str) -> str:
+    """The topic a filter is indexed under: the one fewest events are expected to carry."""
+    return min(
+        filter_topics(topic_filter),
+        key=lambda candidate: (_INDEX_PREFERENCE.index(candidate.partition(":")[0]), candidate),
+    )
+
+
+def matches(filters: Iterable[str], topics: set[str]) -> bool:
+    """Whether an event with ``topics`` matches any one of ``filters``."""
+    return any(filter_topics(topic_filter) <= topics for topic_filter in filters)
+
+
+def event_topics(payload: Mapping[str, Any]) -> set[str]:
+    """Every topic an event is published under."""
+    topics: set[str] = set()
+    for dimension, field in ((LOCATION, "location_id"), (TABLE, "table_id"), (ORDER, "order_id")):
+        value = payload.get(field)
+        if isinstance(value, str) and value:
+            topics.add(topic(dimension, value))
+    event_type = payload.get("event_type")
+    if isinstance(event_type, str) and event_type:
+        topics.add(topic(EVENT, event_type))
+    stations = payload.get("stations")
+    if isinstance(stations, list):
+        topics.update(topic(STATION, station) for station in stations if isinstance(station, str))
+    return topics
+
+
+def message_topics(message_json_str: str) -> set[str]:
+    try:
+        payload = json.loads(message_json_str)
+    except ValueError:
+        return set()
+    return event_topics(payload) if isinstance(payload, dict) else set()
@@ -44,6 +44,7 @@ class MenuItemCreateRequest(CatalogBaseModel):
     currency: str = Field(default="USD", min_length=3, max_length=3)
     is_active: bool = True
     is_available: bool = True
+    station: str | None = Field(default=None, max_length=50)
 
 
 class MenuItemUpdateRequest(CatalogBaseModel):
@@ -55,6 +56,7 @@ class MenuItemUpdateRequest(CatalogBaseModel):
     currency: str | None = Field(default=None, min_length=3, max_length=3)
     is_active: bool | None = None
     is_available: bool | None = None
+    station: str | None = Field(default=None, max_length=50)
 
 
 class MenuItemResponse(CatalogBaseModel):
@@ -68,6 +70,7 @@ class MenuItemResponse(CatalogBaseModel):
     currency: str
     is_active: bool
     is_available: bool
+    station: str | None
     created_at: datetime
     updated_at: datetime
     deleted_at: datetime | None
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
-from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from rop.application.catalog.schemas import (
@@ -20,6 +21,9 @@ from rop.application.catalog.schemas import (
     PublicMenuItemResponse,
 )
 from rop.domain.errors import NotFoundError
+from rop.domain.ids import new_id
+from rop.domain.kitchen.stations import normalize_station
+from rop.infrastructure.cache.catalog_version import RedisCatalogVersions
 from rop.infrastructure.db.models import CategoryModel, MenuItemModel, RestaurantModel
 
 
@@ -32,8 +36,9 @@ def _money(value: Decimal) -> float:
 
 
 class CatalogService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, versions: RedisCatalogVersions | None = None) -> None:
         self._db = db
+        self._versions = versions or RedisCatalogVersions()
 
     def _require_restaurant(self, restaurant_id: str) -> RestaurantModel:
         restaurant = self._db.get(RestaurantModel, restaurant_id)
@@ -77,6 +82,7 @@ class CatalogService:
             currency=item.currency,
             is_active=item.is_active,
             is_available=item.is_available,
+            station=item.station,
             created_at=item.created_at,
             updated_at=item.updated_at,
             deleted_at=item.deleted_at,
@@ -85,7 +91,7 @@ class CatalogService:
     def create_category(self, request: CategoryCreateRequest) -> CategoryResponse:
         self._require_restaurant(request.restaurant_id)
         category = CategoryModel(
-            id=f"cat_{uuid4().hex[:12]}",
+            id=new_id("cat"),
             restaurant_id=request.restaurant_id,
             name=request.name.strip(),
             sort_order=request.sort_order,
@@ -129,7 +135,7 @@ class CatalogService:
                 raise NotFoundError("category not found for restaurant", code="CATEGORY_NOT_FOUND")
 
         item = MenuItemModel(
-            id=f"itm_{uuid4().hex[:12]}",
+            id=new_id("itm"),
             restaurant_id=request.restaurant_id,
             category_id=request.category_id,
             sku=request.sku.strip() if request.sku else None,
@@ -139,10 +145,12 @@ class CatalogService:
             currency=request.currency.upper(),
             is_active=request.is_active,
             is_available=request.is_available,
+            station=normalize_station(request.station) if request.station else None,
         )
         self._db.add(item)
         self._db.commit()
         self._db.refresh(item)
+        self._versions.bump(item.restaurant_id)
         return self._serialize_item(item)
 
     def get_menu_item(self, item_id: str) -> MenuItemResponse:
@@ -173,9 +181,12 @@ class CatalogService:
             item.is_active = request.is_active
         if request.is_available is not None:
             item.is_available = request.is_available
+        if request.station is not None:
+            item.station = normalize_station(request.station) if request.station else None
         item.updated_at = _utcnow()
         self._db.commit()
         self._db.refresh(item)
+        self._versions.bump(item.restaurant_id)
         return self._serialize_item(item)
 
     def delete_menu_item(self, item_id: str) -> MenuItemResponse:
@@ -186,52 +197,87 @@ class CatalogService:
         item.updated_at = item.deleted_at
         self._db.commit()
         self._db.refresh(item)
+        self._versions.bump(item.restaurant_id)
         return self._serialize_item(item)
 
     def get_public_catalog(self, restaurant_id: str) -> CatalogResponse:
         self._require_restaurant(restaurant_id)
-        categories = self._db.scalars(
-            select(CategoryModel)
-            .where(
-                CategoryModel.restaurant_id == restaurant_id,
-                CategoryModel.deleted_at.is_(None),
-                CategoryModel.is_active.is_(True),
-            )
-            .order_by(CategoryModel.sort_order.asc(), CategoryModel.name.asc())
-        ).all()
-        items = self._db.scalars(
-            select(MenuItemModel)
-            .where(
-                MenuItemModel.restaurant_id == restaurant_id,
-                MenuItemModel.deleted_at.is_(None),
-                MenuItemModel.is_active.is_(True),
-                MenuItemModel.is_available.is_(True),
-            )
-            .order_by(MenuItemModel.name.asc())
-        ).all()
-
-        grouped_items: dict[str | None, list[PublicMenuItemResponse]] = defaultdict(list)
-        for item in items:
-            grouped_items[item.category_id].append(
-                PublicMenuItemResponse(
-                    id=item.id,
-                    category_id=item.category_id,
-                    sku=item.sku,
-                    name=item.name,
-                    description=item.description,
-                    price=_money(item.price),
-                    currency=item.currency,
-                    is_available=item.is_available,
-                )
-            )
+        categories = self._db.scalars(_public_categories_query(restaurant_id)).all()
+        items = self._db.scalars(_public_items_query(restaurant_id)).all()
+        return _public_catalog(restaurant_id, categories, items)
+
+
+class AsyncCatalogService:
+    """Catalog reads on an ``AsyncSession`` so they never wait for a threadpool slot."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def require_restaurant(self, restaurant_id: str) -> RestaurantModel:
+        restaurant = await self._db.get(RestaurantModel, restaurant_id)
+        if restaurant is None or restaurant.deleted_at is not None:
+            raise NotFoundError("restaurant not found", code="RESTAURANT_NOT_FOUND")
+        return restaurant
+
+    async def get_public_catalog(self, restaurant_id: str) -> CatalogResponse:
+        await self.require_restaurant(restaurant_id)
+        categories = (await self._db.scalars(_public_categories_query(restaurant_id))).all()
+        items = (await self._db.scalars(_public_items_query(restaurant_id))).all()
+        return _public_catalog(restaurant_id, categories, items)
+
 
-        payload_categories = [
-            PublicCategoryResponse(
-                id=category.id,
-                name=category.name,
-                sort_order=category.sort_order,
-                items=grouped_items.get(category.id, []),
+def _public_categories_query(restaurant_id: str) -> Select[tuple[CategoryModel]]:
+    return (
+        select(CategoryModel)
+        .where(
+            CategoryModel.restaurant_id == restaurant_id,
+            CategoryModel.deleted_at.is_(None),
+            CategoryModel.is_active.is_(True),
+        )
+        .order_by(CategoryModel.sort_order.asc(), CategoryModel.name.asc())
+    )
+
+
+def _public_items_query(restaurant_id: str) -> Select[tuple[MenuItemModel]]:
+    return (
+        select(MenuItemModel)
+        .where(
+            MenuItemModel.restaurant_id == restaurant_id,
+            MenuItemModel.deleted_at.is_(None),
+            MenuItemModel.is_active.is_(True),
+            MenuItemModel.is_available.is_(True),
+        )
+        .order_by(MenuItemModel.name.asc())
+    )
+
+
+def _public_catalog(
+    restaurant_id: str,
+    categories: Sequence[CategoryModel],
+    items: Sequence[MenuItemModel],
+) -> CatalogResponse:
+    grouped_items: dict[str | None, list[PublicMenuItemResponse]] = defaultdict(list)
+    for item in items:
+        grouped_items[item.category_id].append(
+            PublicMenuItemResponse(
+                id=item.id,
+                category_id=item.category_id,
+                sku=item.sku,
+                name=item.name,
+                description=item.description,
+                price=_money(item.price),
+                currency=item.currency,
+                is_available=item.is_available,
             )
-            for category in categories
-        ]
-        return CatalogResponse(restaurant_id=restaurant_id, categories=payload_categories)
+        )
+
+    payload_categories = [
+        PublicCategoryResponse(
+            id=category.id,
+            name=category.name,
+            sort_order=category.sort_order,
+            items=grouped_items.get(category.id, []),
+        )
+        for category in categories
+    ]
+    return CatalogResponse(restaurant_id=restaurant_id, categories=payload_categories)
@@ -202,6 +202,7 @@ class OrderLineResponse(CommerceBaseModel):
     quantity: int
     line_total: float
     notes: str | None
+    station: str | None = None
 
 
 class OrderResponse(CommerceBaseModel):
@@ -226,3 +227,21 @@ class OrderResponse(CommerceBaseModel):
     updated_at: datetime
     deleted_at: datetime | None
     lines: list[OrderLineResponse]
+    eta_seconds: int | None = None
+
+
+# An OrderResponse as JSON-ready primitives. Hot paths build these straight from ORM rows
+# and render them with FastJSONResponse, skipping model construction and validation.
+OrderDocument = dict[str, Any]
+
+
+class PickupBoardOrderResponse(CommerceBaseModel):
+    order_id: str
+    status: OrderStatus
+    updated_at: datetime
+
+
+class PickupBoardResponse(CommerceBaseModel):
+    location_id: str
+    restaurant_id: str
+    orders: list[PickupBoardOrderResponse]
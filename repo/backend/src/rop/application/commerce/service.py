@@ -4,9 +4,8 @@ import hashlib
 import json
 from datetime import datetime, timezone
 from decimal import Decimal
-from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 
 from rop.application.commerce.schemas import (
@@ -15,9 +14,10 @@ from rop.application.commerce.schemas import (
     LocationResponse,
     LocationUpdateRequest,
     OrderCreateRequest,
-    OrderLineResponse,
-    OrderResponse,
+    OrderDocument,
     OrderUpdateRequest,
+    PickupBoardOrderResponse,
+    PickupBoardResponse,
     RestaurantCreateRequest,
     RestaurantListResponse,
     RestaurantResponse,
@@ -30,6 +30,8 @@ from rop.application.commerce.schemas import (
     TableSessionOpenRequest,
     TableUpdateRequest,
 )
+from rop.application.kitchen.prep_times import PrepTimeEstimator
+from rop.application.kitchen.stations import StationRouter
 from rop.domain.commerce.enums import (
     ActorType,
     Channel,
@@ -49,6 +51,10 @@ from rop.domain.commerce.rules import (
     ensure_third_party_metadata,
 )
 from rop.domain.errors import ConflictError, NotFoundError, ValidationError
+from rop.domain.ids import new_id
+from rop.domain.kitchen.stations import DEFAULT_STATION
+from rop.infrastructure.cache.kitchen_board import PrepSummaryChange, RedisKitchenBoard
+from rop.infrastructure.cache.prep_stats import RedisPrepTimeStats, item_scope
 from rop.infrastructure.db.models import (
     LocationModel,
     MenuItemModel,
@@ -61,19 +67,53 @@ from rop.infrastructure.db.models import (
 )
 from rop.infrastructure.messaging.redis_publisher import RedisEventPublisher
 
+# Hot-path statements are built once with bind parameters. Executing the same object lets
+# SQLAlchemy reuse its compiled form without rebuilding and re-traversing a new select()
+# on every call.
+_ORDER_BY_ID = (
+    select(OrderModel)
+    .options(joinedload(OrderModel.lines))
+    .where(OrderModel.id == bindparam("order_id"))
+)
+_ORDER_BY_IDEMPOTENCY_KEY = (
+    select(OrderModel)
+    .options(joinedload(OrderModel.lines))
+    .where(
+        OrderModel.restaurant_id == bindparam("restaurant_id"),
+        OrderModel.idempotency_key == bindparam("idempotency_key"),
+    )
+)
+_MENU_ITEMS_BY_ID = select(MenuItemModel).where(
+    MenuItemModel.id.in_(bindparam("menu_item_ids", expanding=True))
+)
+_OPEN_SESSION_FOR_TABLE = select(SessionModel).where(
+    SessionModel.table_id == bindparam("table_id"),
+    SessionModel.status == SessionStatus.OPEN.value,
+)
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
 def _money(value: Decimal) -> float:
-    return float(value.quantize(Decimal("0.01")))
+    # Money columns are Numeric(10, 2) and line totals are price times an integer, so the
+    # value already has two decimal places.
+    return float(value)
 
 
 class CommerceService:
-    def __init__(self, db: Session, publisher: RedisEventPublisher | None = None) -> None:
+    def __init__(
+        self,
+        db: Session,
+        publisher: RedisEventPublisher | None = None,
+        board: RedisKitchenBoard | None = None,
+    ) -> None:
         self._db = db
         self._publisher = publisher or RedisEventPublisher()
+        self._board = board or RedisKitchenBoard()
+        self._estimator = PrepTimeEstimator(self._board, RedisPrepTimeStats())
+        self._stations = StationRouter(db)
 
     def _require_restaurant(self, restaurant_id: str) -> RestaurantModel:
         restaurant = self._db.get(RestaurantModel, restaurant_id)
@@ -100,11 +140,7 @@ class CommerceService:
         return session
 
     def _require_order(self, order_id: str) -> OrderModel:
-        order = self._db.scalar(
-            select(OrderModel)
-            .options(joinedload(OrderModel.lines))
-            .where(OrderModel.id == order_id)
-        )
+        order = self._db.scalar(_ORDER_BY_ID, {"order_id": order_id})
         if order is None:
             raise NotFoundError("order not found", code="ORDER_NOT_FOUND")
         return order
@@ -180,42 +216,48 @@ class CommerceService:
             updated_at=session.updated_at,
         )
 
-    def _serialize_order(self, order: OrderModel) -> OrderResponse:
+    def _order_document(
+        self,
+        order: OrderModel,
+        eta_seconds: int | None = None,
+    ) -> OrderDocument:
         lines = [
-            OrderLineResponse(
-                id=line.id,
-                menu_item_id=line.menu_item_id,
-                item_name_snapshot=line.item_name_snapshot,
-                unit_price_snapshot=_money(line.unit_price_snapshot),
-                quantity=line.quantity,
-                line_total=_money(line.line_total),
-                notes=line.notes,
-            )
+            {
+                "id": line.id,
+                "menu_item_id": line.menu_item_id,
+                "item_name_snapshot": line.item_name_snapshot,
+                "unit_price_snapshot": _money(line.unit_price_snapshot),
+                "quantity": line.quantity,
+                "line_total": _money(line.line_total),
+                "notes": line.notes,
+                "station": line.station or DEFAULT_STATION,
+            }
             for line in order.lines
         ]
-        return OrderResponse(
-            id=order.id,
-            restaurant_id=order.restaurant_id,
-            location_id=order.location_id,
-            session_id=order.session_id,
-            table_id=order.table_id,
-            table_label=self._table_label(order.table_id),
-            channel=Channel(order.channel),
-            source_type=SourceType(order.source_type),
-            status=OrderStatus(order.status),
-            external_source=order.external_source,
-            external_reference=order.external_reference,
-            subtotal=_money(order.subtotal),
-            discount_total=_money(order.discount_total),
-            tax_total=_money(order.tax_total),
-            total=_money(order.total),
-            notes=order.notes,
-            idempotency_key=order.idempotency_key,
-            created_at=order.created_at,
-            updated_at=order.updated_at,
-            deleted_at=order.deleted_at,
-            lines=lines,
-        )
+        return {
+            "id": order.id,
+            "restaurant_id": order.restaurant_id,
+            "location_id": order.location_id,
+            "session_id": order.session_id,
+            "table_id": order.table_id,
+            "table_label": self._table_label(order.table_id),
+            "channel": order.channel,
+            "source_type": order.source_type,
+            "status": order.status,
+            "external_source": order.external_source,
+            "external_reference": order.external_reference,
+            "subtotal": _money(order.subtotal),
+            "discount_total": _money(order.discount_total),
+            "tax_total": _money(order.tax_total),
+            "total": _money(order.total),
+            "notes": order.notes,
+            "idempotency_key": order.idempotency_key,
+            "created_at": order.created_at,
+            "updated_at": order.updated_at,
+            "deleted_at": order.deleted_at,
+            "lines": lines,
+            "eta_seconds": eta_seconds,
+        }
 
     def _record_order_history(
         self,
@@ -227,7 +269,7 @@ class CommerceService:
     ) -> None:
         self._db.add(
             OrderStatusHistoryModel(
-                id=f"osh_{uuid4().hex[:12]}",
+                id=new_id("osh"),
                 order_id=order_id,
                 from_status=from_status,
                 to_status=to_status,
@@ -238,31 +280,68 @@ class CommerceService:
         )
 
     def _publish_order_event(self, event_type: str, order: OrderModel) -> None:
+        lines = [
+            {
+                "id": line.id,
+                "menu_item_id": line.menu_item_id,
+                "name": line.item_name_snapshot,
+                "quantity": line.quantity,
+                "notes": line.notes,
+                "station": line.station or DEFAULT_STATION,
+            }
+            for line in order.lines
+        ]
+        payload = {
+            "event_type": event_type,
+            "order_id": order.id,
+            "restaurant_id": order.restaurant_id,
+            "location_id": order.location_id,
+            "session_id": order.session_id,
+            "table_id": order.table_id,
+            "table_label": self._table_label(order.table_id),
+            "channel": order.channel,
+            "source_type": order.source_type,
+            "status": order.status,
+            "notes": order.notes,
+            "created_at": order.created_at.isoformat(),
+            "updated_at": order.updated_at.isoformat(),
+            "occurred_at": _utcnow().isoformat(),
+            "stations": sorted({line.station or DEFAULT_STATION for line in order.lines}),
+            "lines": lines,
+        }
+        write = self._board.apply_event(payload)
+        self._publisher.publish_json(restaurant_id=order.restaurant_id, payload=payload)
+        if write is not None and write.prep_changes:
+            self._publish_prep_summary_delta(order.restaurant_id, write.prep_changes)
+
+    def _publish_prep_summary_delta(
+        self,
+        restaurant_id: str,
+        changes: list[PrepSummaryChange],
+    ) -> None:
         self._publisher.publish_json(
-            restaurant_id=order.restaurant_id,
+            restaurant_id=restaurant_id,
             payload={
-                "event_type": event_type,
-                "order_id": order.id,
-                "restaurant_id": order.restaurant_id,
-                "location_id": order.location_id,
-                "session_id": order.session_id,
-                "table_id": order.table_id,
-                "table_label": self._table_label(order.table_id),
-                "channel": order.channel,
-                "source_type": order.source_type,
-                "status": order.status,
-                "notes": order.notes,
+                "event_type": "kitchen.prep_summary.delta",
+                "restaurant_id": restaurant_id,
                 "occurred_at": _utcnow().isoformat(),
+                "stations": sorted({change.key.station for change in changes}),
+                "items": [
+                    {
+                        "station": change.key.station,
+                        "menu_item_id": change.key.menu_item_id,
+                        "name": change.key.name,
+                        "notes": change.key.notes,
+                        "quantity_delta": change.quantity_delta,
+                        "quantity": change.quantity,
+                    }
+                    for change in changes
+                ],
             },
         )
 
     def _active_session_for_table(self, table_id: str) -> SessionModel | None:
-        return self._db.scalar(
-            select(SessionModel).where(
-                SessionModel.table_id == table_id,
-                SessionModel.status == SessionStatus.OPEN.value,
-            )
-        )
+        return self._db.scalar(_OPEN_SESSION_FOR_TABLE, {"table_id": table_id})
 
     def _validate_location_support(self, location: LocationModel, channel: Channel) -> None:
         support_matrix = {
@@ -280,7 +359,7 @@ class CommerceService:
 
     def create_restaurant(self, request: RestaurantCreateRequest) -> RestaurantResponse:
         restaurant = RestaurantModel(
-            id=f"rst_{uuid4().hex[:12]}",
+            id=new_id("rst"),
             slug=request.slug.strip().lower(),
             name=request.name.strip(),
             status=request.status.value,
@@ -332,7 +411,7 @@ class CommerceService:
     def create_location(self, request: LocationCreateRequest) -> LocationResponse:
         self._require_restaurant(request.restaurant_id)
         location = LocationModel(
-            id=f"loc_{uuid4().hex[:12]}",
+            id=new_id("loc"),
             restaurant_id=request.restaurant_id,
             name=request.name.strip(),
             location_type=request.location_type.value,
@@ -418,7 +497,7 @@ class CommerceService:
                     code="LOCATION_RESTAURANT_MISMATCH",
                 )
         table = TableModel(
-            id=f"tbl_{uuid4().hex[:12]}",
+            id=new_id("tbl"),
             restaurant_id=request.restaurant_id,
             location_id=request.location_id,
             label=request.label.strip(),
@@ -507,7 +586,7 @@ class CommerceService:
             table.updated_at = _utcnow()
 
         session = SessionModel(
-            id=f"ses_{uuid4().hex[:12]}",
+            id=new_id("ses"),
             restaurant_id=request.restaurant_id,
             location_id=location.id,
             channel=request.channel.value,
@@ -614,7 +693,7 @@ class CommerceService:
         self,
         request: OrderCreateRequest,
         idempotency_key: str | None,
-    ) -> OrderResponse:
+    ) -> OrderDocument:
         self._require_restaurant(request.restaurant_id)
         session = self._require_session(request.session_id)
         if session.restaurant_id != request.restaurant_id:
@@ -652,12 +731,8 @@ class CommerceService:
         payload_hash = self._create_order_payload_hash(request)
         if normalized_key:
             existing = self._db.scalar(
-                select(OrderModel)
-                .options(joinedload(OrderModel.lines))
-                .where(
-                    OrderModel.restaurant_id == request.restaurant_id,
-                    OrderModel.idempotency_key == normalized_key,
-                )
+                _ORDER_BY_IDEMPOTENCY_KEY,
+                {"restaurant_id": request.restaurant_id, "idempotency_key": normalized_key},
             )
             if existing is not None:
                 if existing.idempotency_hash != payload_hash:
@@ -665,13 +740,12 @@ class CommerceService:
                         "idempotency key was already used with a different payload",
                         code="IDEMPOTENCY_KEY_REPLAY_DIFFERENT_PAYLOAD",
                     )
-                return self._serialize_order(existing)
+                return self._order_document(existing)
 
         menu_item_ids = [line.menu_item_id for line in request.lines]
-        menu_items = self._db.scalars(
-            select(MenuItemModel).where(MenuItemModel.id.in_(menu_item_ids))
-        ).all()
+        menu_items = self._db.scalars(_MENU_ITEMS_BY_ID, {"menu_item_ids": menu_item_ids}).all()
         items_by_id = {item.id: item for item in menu_items}
+        stations = self._stations.route(request.restaurant_id, items_by_id)
 
         line_models: list[OrderLineModel] = []
         subtotal = Decimal("0.00")
@@ -687,18 +761,19 @@ class CommerceService:
             subtotal += line_total
             line_models.append(
                 OrderLineModel(
-                    id=f"orl_{uuid4().hex[:12]}",
+                    id=new_id("orl"),
                     menu_item_id=menu_item.id,
                     item_name_snapshot=menu_item.name,
                     unit_price_snapshot=menu_item.price,
                     quantity=line.quantity,
                     line_total=line_total,
                     notes=line.notes,
+                    station=stations[menu_item.id],
                 )
             )
 
         order = OrderModel(
-            id=f"ord_{uuid4().hex[:12]}",
+            id=new_id("ord"),
             restaurant_id=request.restaurant_id,
             location_id=session.location_id,
             session_id=session.id,
@@ -726,12 +801,47 @@ class CommerceService:
         self._db.refresh(order)
         order = self._require_order(order.id)
         self._publish_order_event("order.created", order)
-        return self._serialize_order(order)
+        return self._order_document(order)
+
+    def get_order(self, order_id: str) -> OrderDocument:
+        order = self._require_order(order_id)
+        eta_seconds = self._estimator.order_eta(
+            order.restaurant_id,
+            order.id,
+            OrderStatus(order.status),
+            [item_scope(line.menu_item_id) for line in order.lines if line.menu_item_id],
+            _utcnow(),
+        )
+        return self._order_document(order, eta_seconds=eta_seconds)
 
-    def get_order(self, order_id: str) -> OrderResponse:
-        return self._serialize_order(self._require_order(order_id))
+    def pickup_board(self, location_id: str) -> PickupBoardResponse:
+        """Pickup orders at a location that are ready to be collected, oldest first."""
+        location = self._require_location(location_id)
+        self._validate_location_support(location, Channel.PICKUP)
+        orders = self._db.scalars(
+            select(OrderModel)
+            .where(
+                OrderModel.location_id == location_id,
+                OrderModel.channel == Channel.PICKUP.value,
+                OrderModel.status == OrderStatus.READY.value,
+                OrderModel.deleted_at.is_(None),
+            )
+            .order_by(OrderModel.updated_at.asc())
+        ).all()
+        return PickupBoardResponse(
+            location_id=location.id,
+            restaurant_id=location.restaurant_id,
+            orders=[
+                PickupBoardOrderResponse(
+                    order_id=order.id,
+                    status=OrderStatus(order.status),
+                    updated_at=order.updated_at,
+                )
+                for order in orders
+            ],
+        )
 
-    def update_order(self, order_id: str, request: OrderUpdateRequest) -> OrderResponse:
+    def update_order(self, order_id: str, request: OrderUpdateRequest) -> OrderDocument:
         order = self._require_order(order_id)
         if not can_patch_order(OrderStatus(order.status)):
             raise ConflictError(
@@ -744,9 +854,10 @@ class CommerceService:
         self._db.commit()
         self._db.refresh(order)
         order = self._require_order(order.id)
-        return self._serialize_order(order)
+        self._publish_order_event("order.updated", order)
+        return self._order_document(order)
 
-    def delete_order(self, order_id: str) -> OrderResponse:
+    def delete_order(self, order_id: str) -> OrderDocument:
         order = self._require_order(order_id)
         if not can_delete_order(OrderStatus(order.status)):
             raise ConflictError(
@@ -767,4 +878,4 @@ class CommerceService:
         self._db.refresh(order)
         order = self._require_order(order.id)
         self._publish_order_event("order.canceled", order)
-        return self._serialize_order(order)
+        return self._order_document(order)
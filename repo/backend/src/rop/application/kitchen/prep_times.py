@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from rop.domain.commerce.enums import OrderStatus
+from rop.domain.kitchen.prep_time import ACCEPT_TO_READY, QuantileSketch, estimate_ready_seconds
+from rop.infrastructure.cache.kitchen_board import AsyncRedisKitchenBoard, RedisKitchenBoard
+from rop.infrastructure.cache.prep_stats import (
+    RESTAURANT_SCOPE,
+    AsyncRedisPrepTimeStats,
+    RedisPrepTimeStats,
+    station_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+MIN_SAMPLES = 5
+
+
+def _default_prep_seconds() -> float:
+    return float(os.getenv("KITCHEN_DEFAULT_PREP_SECONDS", "600"))
+
+
+def _parallel_tickets() -> int:
+    return max(1, int(os.getenv("KITCHEN_PARALLEL_TICKETS", "4")))
+
+
+def _median_prep_seconds(sketches: Mapping[str, QuantileSketch]) -> float:
+    """Median accept-to-ready time, preferring the slowest scope with enough samples."""
+    estimates = [
+        sketch.quantile(0.5)
+        for scope, sketch in sketches.items()
+        if scope != RESTAURANT_SCOPE and sketch.count >= MIN_SAMPLES
+    ]
+    scoped = [estimate for estimate in estimates if estimate is not None]
+    if scoped:
+        return max(scoped)
+    restaurant = sketches[RESTAURANT_SCOPE]
+    if restaurant.count >= MIN_SAMPLES:
+        return restaurant.quantile(0.5) or _default_prep_seconds()
+    return _default_prep_seconds()
+
+
+def _queue_etas(
+    tickets: Sequence[tuple[OrderStatus, datetime]],
+    prep_seconds: float,
+    accepted: int,
+    now: datetime,
+) -> list[int | None]:
+    parallel_tickets = _parallel_tickets()
+    pending_ahead = 0
+    etas: list[int | None] = []
+    for status, started_at in tickets:
+        etas.append(
+            estimate_ready_seconds(
+                status=status,
+                prep_seconds=prep_seconds,
+                parallel_tickets=parallel_tickets,
+                tickets_ahead=accepted + pending_ahead,
+                elapsed_seconds=(now - started_at).total_seconds(),
+            )
+        )
+        if status is OrderStatus.PENDING:
+            pending_ahead += 1
+    return etas
+
+
+class PrepTimeEstimator:
+    def __init__(self, board: RedisKitchenBoard, stats: RedisPrepTimeStats) -> None:
+        self._board = board
+        self._stats = stats
+
+    def prep_seconds(self, restaurant_id: str, scopes: Sequence[str], now: datetime) -> float:
+        """Median accept-to-ready time, preferring the slowest scope with enough samples."""
+        return _median_prep_seconds(
+            self._stats.sketches(restaurant_id, ACCEPT_TO_READY, [RESTAURANT_SCOPE, *scopes], now)
+        )
+
+    def queue_etas(
+        self,
+        restaurant_id: str,
+        tickets: Sequence[tuple[OrderStatus, datetime]],
+        now: datetime,
+        station: str | None = None,
+    ) -> list[int | None]:
+        """ETAs for a page of tickets ordered oldest first, given as (status, started_at).
+
+        With ``station`` set the page is that station's queue, so only its own backlog and
+        prep times count.
+        """
+        scopes = [station_scope(station)] if station is not None else []
+        try:
+            prep_seconds = self.prep_seconds(restaurant_id, scopes, now)
+            accepted = self._board.depth(restaurant_id, station)[OrderStatus.ACCEPTED.value]
+        except Exception:
+            logger.exception("kitchen_eta_failed", extra={"restaurant_id": restaurant_id})
+            return [None for _ in tickets]
+        return _queue_etas(tickets, prep_seconds, accepted, now)
+
+    def order_eta(
+        self,
+        restaurant_id: str,
+        order_id: str,
+        status: OrderStatus,
+        scopes: Sequence[str],
+        now: datetime,
+    ) -> int | None:
+        if status not in {OrderStatus.PENDING, OrderStatus.ACCEPTED, OrderStatus.READY}:
+            return None
+        try:
+            prep_seconds = self.prep_seconds(restaurant_id, scopes, now)
+            tickets_ahead = 0
+            elapsed_seconds = 0.0
+            if status is OrderStatus.PENDING:
+                accepted = self._board.depth(restaurant_id)[OrderStatus.ACCEPTED.value]
+                tickets_ahead = accepted + (self._board.pending_rank(restaurant_id, order_id) or 0)
+            elif status is OrderStatus.ACCEPTED:
+                ticket = self._board.ticket(restaurant_id, order_id)
+                if ticket is not None:
+                    started_at = ticket.accepted_at or ticket.updated_at
+                    elapsed_seconds = (now - started_at).total_seconds()
+        except Exception:
+            logger.exception("order_eta_failed", extra={"order_id": order_id})
+            return None
+        return estimate_ready_seconds(
+            status=status,
+            prep_seconds=prep_seconds,
+            parallel_tickets=_parallel_tickets(),
+            tickets_ahead=tickets_ahead,
+            elapsed_seconds=elapsed_seconds,
+        )
+
+
+class AsyncPrepTimeEstimator:
+    """:meth:`PrepTimeEstimator.queue_etas` with its Redis reads on the event loop."""
+
+    def __init__(self, board: AsyncRedisKitchenBoard, stats: AsyncRedisPrepTimeStats) -> None:
+        self._board = board
+        self._stats = stats
+
+    async def queue_etas(
+        self,
+        restaurant_id: str,
+        tickets: Sequence[tuple[OrderStatus, datetime]],
+        now: datetime,
+        station: str | None = None,
+    ) -> list[int | None]:
+        scopes = [station_scope(station)] if station is not None else []
+        try:
+            prep_seconds = _median_prep_seconds(
+                await self._stats.sketches(
+                    restaurant_id, ACCEPT_TO_READY, [RESTAURANT_SCOPE, *scopes], now
+                )
+            )
+            depth = await self._board.depth(restaurant_id, station)
+        except Exception:
+            logger.exception("kitchen_eta_failed", extra={"restaurant_id": restaurant_id})
+            return [None for _ in tickets]
+        return _queue_etas(tickets, prep_seconds, depth[OrderStatus.ACCEPTED.value], now)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
@@ -11,6 +12,15 @@ class KitchenBaseModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class KitchenTicketLineResponse(KitchenBaseModel):
+    id: str
+    menu_item_id: str | None
+    name: str
+    quantity: int
+    notes: str | None
+    station: str
+
+
 class KitchenQueueEntryResponse(KitchenBaseModel):
     id: str
     restaurant_id: str
@@ -23,9 +33,76 @@ class KitchenQueueEntryResponse(KitchenBaseModel):
     status: OrderStatus
     notes: str | None
     age_seconds: int
+    eta_seconds: int | None = None
+    stations: list[str]
+    lines: list[KitchenTicketLineResponse]
     created_at: datetime
     updated_at: datetime
 
 
+# A KitchenQueueEntryResponse as JSON-ready primitives, see OrderDocument.
+KitchenQueueEntryDocument = dict[str, Any]
+
+
 class KitchenQueueResponse(KitchenBaseModel):
     orders: list[KitchenQueueEntryResponse]
+
+
+class KitchenStationQueueResponse(KitchenBaseModel):
+    station: str
+    orders: list[KitchenQueueEntryResponse]
+
+
+class KitchenQueueChangesResponse(KitchenBaseModel):
+    cursor: str
+    reset: bool
+    orders: list[KitchenQueueEntryResponse]
+    removed: list[str]
+
+
+class KitchenBoardMismatchResponse(KitchenBaseModel):
+    order_id: str
+    database_status: OrderStatus | None
+    board_status: OrderStatus | None
+
+
+class KitchenBoardConsistencyResponse(KitchenBaseModel):
+    restaurant_id: str
+    consistent: bool
+    database_count: int
+    board_count: int
+    mismatches: list[KitchenBoardMismatchResponse]
+
+
+class KitchenBoardRebuildResponse(KitchenBaseModel):
+    restaurant_id: str
+    tickets: int
+
+
+class PrepTimeQuantilesResponse(KitchenBaseModel):
+    metric: str
+    scope: str
+    samples: int
+    p50_seconds: float | None
+    p90_seconds: float | None
+    p95_seconds: float | None
+
+
+class PrepTimeStatsResponse(KitchenBaseModel):
+    restaurant_id: str
+    window_seconds: int
+    stats: list[PrepTimeQuantilesResponse]
+
+
+class PrepSummaryItemResponse(KitchenBaseModel):
+    station: str
+    menu_item_id: str | None
+    name: str
+    notes: str | None
+    quantity: int
+
+
+class PrepSummaryResponse(KitchenBaseModel):
+    restaurant_id: str
+    station: str | None
+    items: list[PrepSummaryItemResponse]
@@ -1,84 +1,432 @@
 from __future__ import annotations
 
+import logging
+from collections.abc import Sequence
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from rop.application.commerce.schemas import OrderResponse
+from rop.application.commerce.schemas import OrderDocument
 from rop.application.commerce.service import CommerceService
-from rop.application.kitchen.schemas import KitchenQueueEntryResponse, KitchenQueueResponse
-from rop.domain.commerce.enums import ActorType, Channel, OrderStatus, SourceType
+from rop.application.kitchen.prep_times import AsyncPrepTimeEstimator, PrepTimeEstimator
+from rop.application.kitchen.schemas import (
+    KitchenBoardConsistencyResponse,
+    KitchenBoardMismatchResponse,
+    KitchenBoardRebuildResponse,
+    KitchenQueueEntryDocument,
+    PrepSummaryItemResponse,
+    PrepSummaryResponse,
+    PrepTimeQuantilesResponse,
+    PrepTimeStatsResponse,
+)
+from rop.domain.commerce.enums import ActorType, OrderStatus
+from rop.domain.errors import ConflictError, ValidationError
+from rop.domain.kitchen.prep_time import ACCEPT_TO_READY, READY_TO_SERVED
+from rop.domain.kitchen.stations import DEFAULT_STATION, normalize_station
 from rop.domain.kitchen.workflow import apply_action
-from rop.infrastructure.db.models import OrderModel, TableModel
+from rop.infrastructure.cache.kitchen_board import (
+    KITCHEN_BOARD_STATUSES,
+    AsyncRedisKitchenBoard,
+    KitchenTicket,
+    KitchenTicketLine,
+    RedisKitchenBoard,
+)
+from rop.infrastructure.cache.prep_stats import (
+    RESTAURANT_SCOPE,
+    ROLLING_WINDOWS,
+    WINDOW_SECONDS,
+    AsyncRedisPrepTimeStats,
+    RedisPrepTimeStats,
+    item_scope,
+    station_scope,
+)
+from rop.infrastructure.db.models import (
+    OrderLineModel,
+    OrderModel,
+    OrderStatusHistoryModel,
+    TableModel,
+)
 from rop.infrastructure.messaging.redis_publisher import RedisEventPublisher
 
+logger = logging.getLogger(__name__)
+
+_TIMED_TRANSITIONS = {
+    OrderStatus.READY: ACCEPT_TO_READY,
+    OrderStatus.SERVED: READY_TO_SERVED,
+}
+
+# Each attempt rereads the database; one only fails when the board's change log was
+# trimmed, or another rebuild swapped the board, while the database was being read.
+_REBUILD_ATTEMPTS = 3
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _order_status(value: str | None) -> OrderStatus | None:
+    return OrderStatus(value) if value is not None else None
+
+
 class KitchenService:
-    def __init__(self, db: Session, publisher: RedisEventPublisher | None = None) -> None:
+    def __init__(
+        self,
+        db: Session,
+        publisher: RedisEventPublisher | None = None,
+        board: RedisKitchenBoard | None = None,
+    ) -> None:
         self._db = db
-        self._commerce = CommerceService(db=db, publisher=publisher)
+        self._board = board or RedisKitchenBoard()
+        self._stats = RedisPrepTimeStats()
+        self._estimator = PrepTimeEstimator(self._board, self._stats)
+        self._commerce = CommerceService(db=db, publisher=publisher, board=self._board)
 
-    def queue(
-        self, restaurant_id: str, status: OrderStatus | None, limit: int
-    ) -> KitchenQueueResponse:
+    def _ticket_query(
+        self,
+        restaurant_id: str,
+        statuses: Sequence[OrderStatus],
+        station: str | None = None,
+    ):
+        accepted_at = (
+            select(func.max(OrderStatusHistoryModel.created_at))
+            .where(
+                OrderStatusHistoryModel.order_id == OrderModel.id,
+                OrderStatusHistoryModel.to_status == OrderStatus.ACCEPTED.value,
+            )
+            .correlate(OrderModel)
+            .scalar_subquery()
+        )
         query = (
-            select(OrderModel)
+            select(OrderModel, TableModel.label, accepted_at)
+            .outerjoin(TableModel, TableModel.id == OrderModel.table_id)
             .where(
                 OrderModel.restaurant_id == restaurant_id,
                 OrderModel.deleted_at.is_(None),
+                OrderModel.status.in_([status.value for status in statuses]),
             )
             .order_by(OrderModel.created_at.asc())
-            .limit(limit)
         )
-        if status is not None:
-            query = query.where(OrderModel.status == status.value)
-        else:
+        if station is not None:
             query = query.where(
-                OrderModel.status.in_(
-                    [
-                        OrderStatus.PENDING.value,
-                        OrderStatus.ACCEPTED.value,
-                        OrderStatus.READY.value,
-                    ]
+                select(OrderLineModel.id)
+                .where(
+                    OrderLineModel.order_id == OrderModel.id,
+                    func.coalesce(OrderLineModel.station, DEFAULT_STATION) == station,
+                )
+                .exists()
+            )
+        return query
+
+    def _ticket_lines(self, order_ids: Sequence[str]) -> dict[str, list[KitchenTicketLine]]:
+        lines: dict[str, list[KitchenTicketLine]] = {order_id: [] for order_id in order_ids}
+        if not order_ids:
+            return lines
+        rows = self._db.scalars(
+            select(OrderLineModel)
+            .where(OrderLineModel.order_id.in_(order_ids))
+            .order_by(OrderLineModel.created_at.asc())
+        ).all()
+        for line in rows:
+            lines[line.order_id].append(
+                KitchenTicketLine(
+                    id=line.id,
+                    menu_item_id=line.menu_item_id,
+                    name=line.item_name_snapshot,
+                    quantity=line.quantity,
+                    notes=line.notes,
+                    station=line.station or DEFAULT_STATION,
+                )
+            )
+        return lines
+
+    def _tickets_from_db(
+        self,
+        restaurant_id: str,
+        statuses: Sequence[OrderStatus],
+        limit: int | None = None,
+        station: str | None = None,
+    ) -> list[KitchenTicket]:
+        query = self._ticket_query(restaurant_id, statuses, station)
+        if limit is not None:
+            query = query.limit(limit)
+        rows = self._db.execute(query).all()
+        lines = self._ticket_lines([order.id for order, _, _ in rows])
+        return [
+            KitchenTicket(
+                id=order.id,
+                restaurant_id=order.restaurant_id,
+                location_id=order.location_id,
+                session_id=order.session_id,
+                table_id=order.table_id,
+                table_label=table_label,
+                channel=order.channel,
+                source_type=order.source_type,
+                status=order.status,
+                notes=order.notes,
+                created_at=order.created_at,
+                updated_at=order.updated_at,
+                accepted_at=accepted_at,
+                lines=lines[order.id],
+            )
+            for order, table_label, accepted_at in rows
+        ]
+
+    def _board_page(
+        self,
+        restaurant_id: str,
+        statuses: Sequence[OrderStatus],
+        limit: int,
+        station: str | None = None,
+    ) -> list[KitchenTicket] | None:
+        if any(status not in KITCHEN_BOARD_STATUSES for status in statuses):
+            return None
+        try:
+            tickets = self._board.page(restaurant_id, statuses, limit, station)
+            if tickets is None:
+                self.rebuild_board(restaurant_id)
+                tickets = self._board.page(restaurant_id, statuses, limit, station)
+            return tickets
+        except Exception:
+            logger.exception("kitchen_board_read_failed", extra={"restaurant_id": restaurant_id})
+            return None
+
+    def _queue_entries(
+        self,
+        restaurant_id: str,
+        status: OrderStatus | None,
+        limit: int,
+        station: str | None = None,
+    ) -> list[KitchenQueueEntryDocument]:
+        statuses = [status] if status is not None else list(KITCHEN_BOARD_STATUSES)
+        tickets = self._board_page(restaurant_id, statuses, limit, station)
+        if tickets is None:
+            tickets = self._tickets_from_db(restaurant_id, statuses, limit, station)
+
+        now = _utcnow()
+        etas = self._estimator.queue_etas(
+            restaurant_id,
+            [
+                (OrderStatus(ticket.status), ticket.accepted_at or ticket.updated_at)
+                for ticket in tickets
+            ],
+            now,
+            station,
+        )
+        return [
+            self._queue_entry(ticket, now, eta_seconds, station)
+            for ticket, eta_seconds in zip(tickets, etas, strict=True)
+        ]
+
+    def queue(self, restaurant_id: str, status: OrderStatus | None, limit: int) -> dict[str, Any]:
+        """A KitchenQueueResponse as JSON-ready primitives."""
+        return {"orders": self._queue_entries(restaurant_id, status, limit)}
+
+    def station_queue(
+        self,
+        restaurant_id: str,
+        station: str,
+        status: OrderStatus | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        """A KitchenStationQueueResponse as JSON-ready primitives."""
+        station = normalize_station(station)
+        return {
+            "station": station,
+            "orders": self._queue_entries(restaurant_id, status, limit, station),
+        }
+
+    @staticmethod
+    def _queue_entry(
+        ticket: KitchenTicket,
+        now: datetime,
+        eta_seconds: int | None = None,
+        station: str | None = None,
+    ) -> KitchenQueueEntryDocument:
+        """Queue entry for a ticket, keeping only ``station``'s lines when one is given."""
+        lines = [
+            {
+                "id": line.id,
+                "menu_item_id": line.menu_item_id,
+                "name": line.name,
+                "quantity": line.quantity,
+                "notes": line.notes,
+                "station": line.station,
+            }
+            for line in ticket.lines
+            if station is None or line.station == station
+        ]
+        return {
+            "id": ticket.id,
+            "restaurant_id": ticket.restaurant_id,
+            "location_id": ticket.location_id,
+            "session_id": ticket.session_id,
+            "table_id": ticket.table_id,
+            "table_label": ticket.table_label,
+            "channel": ticket.channel,
+            "source_type": ticket.source_type,
+            "status": ticket.status,
+            "notes": ticket.notes,
+            "age_seconds": max(0, int((now - ticket.created_at).total_seconds())),
+            "eta_seconds": eta_seconds,
+            "stations": ticket.stations,
+            "lines": lines,
+            "created_at": ticket.created_at,
+            "updated_at": ticket.updated_at,
+        }
+
+    def changes(self, restaurant_id: str, since: str | None) -> dict[str, Any]:
+        """A KitchenQueueChangesResponse as JSON-ready primitives."""
+        cursor: int | None = None
+        if since is not None:
+            if not since.isdigit():
+                raise ValidationError(
+                    "since must be a cursor returned by a previous changes call",
+                    code="INVALID_CURSOR",
+                    details={"since": since},
                 )
+            cursor = int(since)
+
+        changes = self._board.changes(restaurant_id, cursor)
+        if changes is None:
+            self.rebuild_board(restaurant_id)
+            changes = self._board.changes(restaurant_id, cursor)
+        if changes is None:
+            raise ConflictError(
+                "kitchen board is being rebuilt, retry the request",
+                code="KITCHEN_BOARD_UNAVAILABLE",
+            )
+
+        now = _utcnow()
+        return {
+            "cursor": str(changes.cursor),
+            "reset": changes.reset,
+            "orders": [self._queue_entry(ticket, now) for ticket in changes.tickets],
+            "removed": changes.removed,
+        }
+
+    def rebuild_board(self, restaurant_id: str) -> KitchenBoardRebuildResponse:
+        count: int | None = None
+        for _ in range(_REBUILD_ATTEMPTS):
+            # Events applied after this point win over the database snapshot below.
+            since = self._board.seq(restaurant_id)
+            tickets = self._tickets_from_db(restaurant_id, KITCHEN_BOARD_STATUSES)
+            # End the read transaction so long-lived callers do not pin a pooled connection.
+            self._db.commit()
+            count = self._board.rebuild(restaurant_id, tickets, since)
+            if count is not None:
+                break
+        if count is None:
+            raise ConflictError(
+                "kitchen board is being rebuilt, retry the request",
+                code="KITCHEN_BOARD_UNAVAILABLE",
             )
+        logger.info(
+            "kitchen_board_rebuilt",
+            extra={"restaurant_id": restaurant_id, "tickets": count},
+        )
+        return KitchenBoardRebuildResponse(restaurant_id=restaurant_id, tickets=count)
+
+    def check_board(self, restaurant_id: str) -> KitchenBoardConsistencyResponse:
+        database = {
+            ticket.id: ticket.status
+            for ticket in self._tickets_from_db(restaurant_id, KITCHEN_BOARD_STATUSES)
+        }
+        board = self._board.statuses(restaurant_id)
+        mismatches = [
+            KitchenBoardMismatchResponse(
+                order_id=order_id,
+                database_status=_order_status(database.get(order_id)),
+                board_status=_order_status(board.get(order_id)),
+            )
+            for order_id in sorted(database.keys() | board.keys())
+            if database.get(order_id) != board.get(order_id)
+        ]
+        return KitchenBoardConsistencyResponse(
+            restaurant_id=restaurant_id,
+            consistent=not mismatches,
+            database_count=len(database),
+            board_count=len(board),
+            mismatches=mismatches,
+        )
 
-        orders = self._db.scalars(query).all()
-        entries: list[KitchenQueueEntryResponse] = []
+    def prep_summary(self, restaurant_id: str, station: str | None) -> PrepSummaryResponse:
+        if station is not None:
+            station = normalize_station(station)
+        summary = self._board.prep_summary(restaurant_id)
+        if summary is None:
+            self.rebuild_board(restaurant_id)
+            summary = self._board.prep_summary(restaurant_id)
+        if summary is None:
+            raise ConflictError(
+                "kitchen board is being rebuilt, retry the request",
+                code="KITCHEN_BOARD_UNAVAILABLE",
+            )
+        items = [
+            PrepSummaryItemResponse(
+                station=key.station,
+                menu_item_id=key.menu_item_id,
+                name=key.name,
+                notes=key.notes,
+                quantity=quantity,
+            )
+            for key, quantity in summary.items()
+            if station is None or key.station == station
+        ]
+        items.sort(key=lambda item: (-item.quantity, item.name, item.notes or ""))
+        return PrepSummaryResponse(restaurant_id=restaurant_id, station=station, items=items)
+
+    def prep_stats(
+        self,
+        restaurant_id: str,
+        menu_item_id: str | None,
+        station: str | None = None,
+    ) -> PrepTimeStatsResponse:
+        scopes = [RESTAURANT_SCOPE]
+        if menu_item_id:
+            scopes.append(item_scope(menu_item_id))
+        if station:
+            scopes.append(station_scope(normalize_station(station)))
         now = _utcnow()
-        for order in orders:
-            table_label = None
-            if order.table_id:
-                table = self._db.get(TableModel, order.table_id)
-                table_label = table.label if table else None
-            entries.append(
-                KitchenQueueEntryResponse(
-                    id=order.id,
-                    restaurant_id=order.restaurant_id,
-                    location_id=order.location_id,
-                    session_id=order.session_id,
-                    table_id=order.table_id,
-                    table_label=table_label,
-                    channel=Channel(order.channel),
-                    source_type=SourceType(order.source_type),
-                    status=OrderStatus(order.status),
-                    notes=order.notes,
-                    age_seconds=max(0, int((now - order.created_at).total_seconds())),
-                    created_at=order.created_at,
-                    updated_at=order.updated_at,
+        stats: list[PrepTimeQuantilesResponse] = []
+        for metric in (ACCEPT_TO_READY, READY_TO_SERVED):
+            for scope, sketch in self._stats.sketches(restaurant_id, metric, scopes, now).items():
+                stats.append(
+                    PrepTimeQuantilesResponse(
+                        metric=metric,
+                        scope=scope,
+                        samples=sketch.count,
+                        p50_seconds=sketch.quantile(0.5),
+                        p90_seconds=sketch.quantile(0.9),
+                        p95_seconds=sketch.quantile(0.95),
+                    )
                 )
+        return PrepTimeStatsResponse(
+            restaurant_id=restaurant_id,
+            window_seconds=WINDOW_SECONDS * ROLLING_WINDOWS,
+            stats=stats,
+        )
+
+    def _status_entered_at(self, order_id: str, status: OrderStatus) -> datetime | None:
+        return self._db.scalar(
+            select(OrderStatusHistoryModel.created_at)
+            .where(
+                OrderStatusHistoryModel.order_id == order_id,
+                OrderStatusHistoryModel.to_status == status.value,
             )
-        return KitchenQueueResponse(orders=entries)
+            .order_by(OrderStatusHistoryModel.created_at.desc())
+            .limit(1)
+        )
 
-    def transition(self, order_id: str, action: str) -> OrderResponse:
+    def transition(self, order_id: str, action: str) -> OrderDocument:
         order = self._commerce._require_order(order_id)
         current_status = OrderStatus(order.status)
         next_status = apply_action(current_status, action)
+        timed_metric = _TIMED_TRANSITIONS.get(next_status)
+        started_at = (
+            self._status_entered_at(order.id, current_status) if timed_metric is not None else None
+        )
         order.status = next_status.value
         order.updated_at = _utcnow()
         actor_type = ActorType.KITCHEN if action in {"accept", "ready"} else ActorType.STAFF
@@ -98,4 +446,88 @@ class KitchenService:
             "settled": "order.settled",
         }[action]
         self._commerce._publish_order_event(event_type, order)
-        return self._commerce._serialize_order(order)
+        if timed_metric is not None and started_at is not None:
+            self._stats.record(
+                order.restaurant_id,
+                timed_metric,
+                (order.updated_at - started_at).total_seconds(),
+                [
+                    *[item_scope(line.menu_item_id) for line in order.lines if line.menu_item_id],
+                    *[station_scope(line.station or DEFAULT_STATION) for line in order.lines],
+                ],
+                at=order.updated_at,
+            )
+        return self._commerce._order_document(order)
+
+
+class AsyncKitchenService:
+    """Kitchen queue pages read from the Redis board on the event loop.
+
+    Displays poll these pages, so the common case should not hold a threadpool slot.
+    Only the board reads are async: when the board is not built yet or Redis fails, the
+    methods return ``None`` and the caller falls back to :class:`KitchenService` in the
+    threadpool, which rebuilds the board or reads the database.
+    """
+
+    def __init__(
+        self,
+        board: AsyncRedisKitchenBoard | None = None,
+        stats: AsyncRedisPrepTimeStats | None = None,
+    ) -> None:
+        self._board = board or AsyncRedisKitchenBoard()
+        self._estimator = AsyncPrepTimeEstimator(self._board, stats or AsyncRedisPrepTimeStats())
+
+    async def _queue_entries(
+        self,
+        restaurant_id: str,
+        status: OrderStatus | None,
+        limit: int,
+        station: str | None = None,
+    ) -> list[KitchenQueueEntryDocument] | None:
+        statuses = [status] if status is not None else list(KITCHEN_BOARD_STATUSES)
+        if any(status not in KITCHEN_BOARD_STATUSES for status in statuses):
+            return None
+        try:
+            tickets = await self._board.page(restaurant_id, statuses, limit, station)
+        except Exception:
+            logger.exception("kitchen_board_read_failed", extra={"restaurant_id": restaurant_id})
+            return None
+        if tickets is None:
+            return None
+
+        now = _utcnow()
+        etas = await self._estimator.queue_etas(
+            restaurant_id,
+            [
+                (OrderStatus(ticket.status), ticket.accepted_at or ticket.updated_at)
+                for ticket in tickets
+            ],
+            now,
+            station,
+        )
+        return [
+            KitchenService._queue_entry(ticket, now, eta_seconds, station)
+            for ticket, eta_seconds in zip(tickets, etas, strict=True)
+        ]
+
+    async def queue(
+        self,
+        restaurant_id: str,
+        status: OrderStatus | None,
+        limit: int,
+    ) -> dict[str, Any] | None:
+        """See :meth:`KitchenService.queue`; ``None`` when the board cannot serve it."""
+        entries = await self._queue_entries(restaurant_id, status, limit)
+        return None if entries is None else {"orders": entries}
+
+    async def station_queue(
+        self,
+        restaurant_id: str,
+        station: str,
+        status: OrderStatus | None,
+        limit: int,
+    ) -> dict[str, Any] | None:
+        """See :meth:`KitchenService.station_queue`; ``None`` when the board cannot serve it."""
+        station = normalize_station(station)
+        entries = await self._queue_entries(restaurant_id, status, limit, station)
+        return None if entries is None else {"station": station, "orders": entries}
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from rop.domain.kitchen.stations import DEFAULT_STATION
+from rop.infrastructure.cache.catalog_version import RedisCatalogVersions
+from rop.infrastructure.db.models import MenuItemModel
+
+_compiled_tables: dict[str, tuple[str, dict[str, str]]] = {}
+_compiled_lock = threading.Lock()
+
+
+class StationRouter:
+    """Routes menu items to prep stations through an in-process item->station table.
+
+    The table is compiled once per restaurant catalog version and reused until the shared
+    version changes, so routing an order costs a single Redis ``GET``.
+    """
+
+    def __init__(self, db: Session, versions: RedisCatalogVersions | None = None) -> None:
+        self._db = db
+        self._versions = versions or RedisCatalogVersions()
+
+    def _compile(self, restaurant_id: str) -> dict[str, str]:
+        rows = self._db.execute(
+            select(MenuItemModel.id, MenuItemModel.station).where(
+                MenuItemModel.restaurant_id == restaurant_id
+            )
+        ).all()
+        return {item_id: station or DEFAULT_STATION for item_id, station in rows}
+
+    def table(self, restaurant_id: str) -> Mapping[str, str]:
+        version = self._versions.current(restaurant_id)
+        if version is None:
+            return self._compile(restaurant_id)
+        cached = _compiled_tables.get(restaurant_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        table = self._compile(restaurant_id)
+        with _compiled_lock:
+            _compiled_tables[restaurant_id] = (version, table)
+        return table
+
+    def route(self, restaurant_id: str, menu_item_ids: Iterable[str]) -> dict[str, str]:
+        table = self.table(restaurant_id)
+        return {item_id: table.get(item_id, DEFAULT_STATION) for item_id in menu_item_ids}
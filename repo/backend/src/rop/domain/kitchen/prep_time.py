@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+
+from rop.domain.commerce.enums import OrderStatus
+
+ACCEPT_TO_READY = "accept_to_ready"
+READY_TO_SERVED = "ready_to_served"
+
+SKETCH_RELATIVE_ACCURACY = 0.02
+_GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+_MIN_SECONDS = 1.0
+
+
+def sketch_bucket(seconds: float) -> int:
+    """Bucket index of a duration in a log-bucketed quantile sketch."""
+    return math.ceil(math.log(max(seconds, _MIN_SECONDS)) / _LOG_GAMMA)
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch with bounded relative error.
+
+    Durations land in logarithmic buckets, so a quantile read is accurate to within
+    ``SKETCH_RELATIVE_ACCURACY`` of the true value while storage stays a small map of
+    bucket counts that can be incremented in place.
+    """
+
+    __slots__ = ("_counts", "_total")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self._total = 0
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[Mapping[int, int]]) -> QuantileSketch:
+        sketch = cls()
+        for mapping in counts:
+            for bucket, count in mapping.items():
+                sketch._counts[bucket] = sketch._counts.get(bucket, 0) + count
+                sketch._total += count
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    def add(self, seconds: float) -> None:
+        bucket = sketch_bucket(seconds)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self._total += 1
+
+    def quantile(self, q: float) -> float | None:
+        if self._total == 0:
+            return None
+        rank = q * (self._total - 1)
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen > rank:
+                return 2 * _GAMMA**bucket / (_GAMMA + 1)
+        return 2 * _GAMMA ** max(self._counts) / (_GAMMA + 1)
+
+
+def estimate_ready_seconds(
+    *,
+    status: OrderStatus,
+    prep_seconds: float,
+    parallel_tickets: int,
+    tickets_ahead: int = 0,
+    elapsed_seconds: float = 0.0,
+) -> int | None:
+    """Seconds until a ticket is expected to be ready.
+
+    Accepted tickets are already on the line and only have their remaining prep time
+    left. Pending tickets wait for a free slot: ``tickets_ahead`` counts accepted and
+    older pending tickets, and the kitchen works ``parallel_tickets`` at a time.
+    """
+    if status is OrderStatus.READY:
+        return 0
+    if status is OrderStatus.ACCEPTED:
+        return max(0, round(prep_seconds - elapsed_seconds))
+    if status is OrderStatus.PENDING:
+        waves = tickets_ahead // max(1, parallel_tickets) + 1
+        return round(waves * prep_seconds)
+    return None
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import re
+
+from rop.domain.errors import ValidationError
+
+DEFAULT_STATION = "general"
+
+_STATION_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,49}$")
+
+
+def normalize_station(value: str) -> str:
+    station = value.strip().lower()
+    if not _STATION_PATTERN.match(station):
+        raise ValidationError(
+            "station must be lowercase letters, digits, '-' or '_'",
+            code="INVALID_STATION",
+            details={"station": value},
+        )
+    return station
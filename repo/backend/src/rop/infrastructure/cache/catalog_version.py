@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import logging
+from uuid import uuid4
+
+from rop.infrastructure.cache.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCatalogVersions:
+    """Per-restaurant catalog version shared by every API replica.
+
+    Versions are random tokens rather than a counter so a flushed or restarted Redis can
+    never hand out a version that a replica already compiled against older data.
+    """
+
+    def __init__(self, timeout_seconds: float = 1.0) -> None:
+        self._timeout_seconds = timeout_seconds
+
+    @staticmethod
+    def _key(restaurant_id: str) -> str:
+        return f"catalog:{restaurant_id}:version"
+
+    def _client(self):
+        return get_redis_client(timeout_seconds=self._timeout_seconds)
+
+    def current(self, restaurant_id: str) -> str | None:
+        """Current version token, or ``None`` when Redis cannot be read."""
+        try:
+            value = self._client().get(self._key(restaurant_id))
+        except Exception:
+            logger.exception("catalog_version_read_failed", extra={"restaurant_id": restaurant_id})
+            return None
+        if value is None:
+            return ""
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def bump(self, restaurant_id: str) -> None:
+        try:
+            self._client().set(self._key(restaurant_id), uuid4().hex)
+        except Exception:
+            logger.exception("catalog_version_bump_failed", extra={"restaurant_id": restaurant_id})
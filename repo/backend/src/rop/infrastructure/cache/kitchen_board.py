@@ -0,0 +1,693 @@
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from redis.exceptions import WatchError
+
+from rop.domain.commerce.enums import OrderStatus
+from rop.infrastructure.cache.redis_client import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KITCHEN_BOARD_STATUSES: tuple[OrderStatus, ...] = (
+    OrderStatus.PENDING,
+    OrderStatus.ACCEPTED,
+    OrderStatus.READY,
+)
+
+_TICKET_FIELDS = (
+    "id",
+    "restaurant_id",
+    "location_id",
+    "session_id",
+    "table_id",
+    "table_label",
+    "channel",
+    "source_type",
+    "status",
+    "notes",
+    "created_at",
+    "updated_at",
+    "accepted_at",
+    "lines",
+)
+
+
+CHANGE_LOG_LENGTH = 1000
+
+# How many times a rebuild retries its swap when a concurrent write trips the WATCH.
+REBUILD_WATCH_ATTEMPTS = 5
+
+# Tickets in these statuses still need cooking and count towards the prep summary. They
+# must be the leading entries of KITCHEN_BOARD_STATUSES.
+PREP_SUMMARY_STATUSES: tuple[OrderStatus, ...] = (OrderStatus.PENDING, OrderStatus.ACCEPTED)
+
+# KEYS: seq, changes, floor, ticket, prep summary, then groups of one queue key per board
+# status: the restaurant-wide queues first, followed by one group per station on the ticket.
+# ARGV: order id, 1-based index of the target status (0 removes the ticket), score,
+# change log length, group size, number of leading statuses that count towards the prep
+# summary, number of prep summary entries, the prep entries as field/quantity pairs, then
+# the ticket hash as field/value pairs.
+# Returns the new sequence, the prep summary direction (1, -1 or 0) and the updated counts.
+_UPSERT_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local open_statuses = tonumber(ARGV[6])
+local was_open = false
+for i = 6, 5 + open_statuses do
+    if redis.call('ZSCORE', KEYS[i], ARGV[1]) then
+        was_open = true
+    end
+end
+for i = 6, #KEYS do
+    redis.call('ZREM', KEYS[i], ARGV[1])
+end
+local accepted_at = redis.call('HGET', KEYS[4], 'accepted_at')
+redis.call('DEL', KEYS[4])
+local target = tonumber(ARGV[2])
+local prep_entries = tonumber(ARGV[7])
+local fields_start = 8 + prep_entries * 2
+if target > 0 then
+    redis.call('HSET', KEYS[4], unpack(ARGV, fields_start))
+    if accepted_at then
+        redis.call('HSETNX', KEYS[4], 'accepted_at', accepted_at)
+    end
+    for i = 5 + target, #KEYS, tonumber(ARGV[5]) do
+        redis.call('ZADD', KEYS[i], ARGV[3], ARGV[1])
+    end
+end
+local is_open = target > 0 and target <= open_statuses
+local direction = 0
+local counts = {}
+if is_open ~= was_open then
+    direction = is_open and 1 or -1
+    for i = 8, fields_start - 1, 2 do
+        local count = redis.call('HINCRBY', KEYS[5], ARGV[i], direction * tonumber(ARGV[i + 1]))
+        if count <= 0 then
+            redis.call('HDEL', KEYS[5], ARGV[i])
+            count = 0
+        end
+        counts[#counts + 1] = count
+    end
+end
+redis.call('ZADD', KEYS[2], seq, ARGV[1])
+local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[4])
+if excess > 0 then
+    local trimmed = redis.call('ZRANGE', KEYS[2], excess - 1, excess - 1, 'WITHSCORES')
+    redis.call('SET', KEYS[3], trimmed[2])
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, excess - 1)
+end
+return {seq, direction, counts}
+"""
+
+
+def _decode(value: bytes | str) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+@dataclass(slots=True)
+class KitchenTicketLine:
+    id: str
+    menu_item_id: str | None
+    name: str
+    quantity: int
+    notes: str | None
+    station: str
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, Any]) -> KitchenTicketLine:
+        return cls(
+            id=values["id"],
+            menu_item_id=values.get("menu_item_id"),
+            name=values["name"],
+            quantity=int(values["quantity"]),
+            notes=values.get("notes"),
+            station=values["station"],
+        )
+
+
+def _encode_lines(lines: Sequence[KitchenTicketLine]) -> str:
+    return json.dumps([asdict(line) for line in lines], separators=(",", ":"))
+
+
+def _decode_lines(raw_value: str | None) -> list[KitchenTicketLine]:
+    if not raw_value:
+        return []
+    return [KitchenTicketLine.from_dict(values) for values in json.loads(raw_value)]
+
+
+@dataclass(frozen=True, slots=True)
+class PrepSummaryKey:
+    station: str
+    menu_item_id: str | None
+    name: str
+    notes: str | None
+
+    @classmethod
+    def for_line(cls, line: KitchenTicketLine) -> PrepSummaryKey:
+        return cls(
+            station=line.station,
+            menu_item_id=line.menu_item_id,
+            name=line.name,
+            notes=line.notes.strip() if line.notes and line.notes.strip() else None,
+        )
+
+    def encode(self) -> str:
+        return json.dumps(
+            [self.station, self.menu_item_id, self.name, self.notes],
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def decode(cls, raw_value: str) -> PrepSummaryKey:
+        station, menu_item_id, name, notes = json.loads(raw_value)
+        return cls(station=station, menu_item_id=menu_item_id, name=name, notes=notes)
+
+
+@dataclass(slots=True)
+class PrepSummaryChange:
+    key: PrepSummaryKey
+    quantity_delta: int
+    quantity: int
+
+
+@dataclass(slots=True)
+class KitchenTicket:
+    id: str
+    restaurant_id: str
+    location_id: str | None
+    session_id: str
+    table_id: str | None
+    table_label: str | None
+    channel: str
+    source_type: str
+    status: str
+    notes: str | None
+    created_at: datetime
+    updated_at: datetime
+    accepted_at: datetime | None = None
+    lines: list[KitchenTicketLine] = field(default_factory=list)
+
+    @property
+    def score(self) -> float:
+        return self.created_at.timestamp()
+
+    @property
+    def stations(self) -> list[str]:
+        return sorted({line.station for line in self.lines})
+
+    def prep_quantities(self) -> dict[PrepSummaryKey, int]:
+        """Quantities this ticket adds to the prep summary, merged by identical item."""
+        quantities: dict[PrepSummaryKey, int] = {}
+        for line in self.lines:
+            key = PrepSummaryKey.for_line(line)
+            quantities[key] = quantities.get(key, 0) + line.quantity
+        return quantities
+
+    def to_hash(self) -> dict[str, str]:
+        values: dict[str, str] = {}
+        for name in _TICKET_FIELDS:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if name == "lines":
+                values[name] = _encode_lines(value)
+            elif isinstance(value, datetime):
+                values[name] = value.isoformat()
+            else:
+                values[name] = str(value)
+        return values
+
+    @classmethod
+    def from_hash(cls, values: Mapping[Any, Any]) -> KitchenTicket:
+        decoded = {_decode(key): _decode(value) for key, value in values.items()}
+        return cls(
+            id=decoded["id"],
+            restaurant_id=decoded["restaurant_id"],
+            location_id=decoded.get("location_id"),
+            session_id=decoded["session_id"],
+            table_id=decoded.get("table_id"),
+            table_label=decoded.get("table_label"),
+            channel=decoded["channel"],
+            source_type=decoded["source_type"],
+            status=decoded["status"],
+            notes=decoded.get("notes"),
+            created_at=datetime.fromisoformat(decoded["created_at"]),
+            updated_at=datetime.fromisoformat(decoded["updated_at"]),
+            accepted_at=(
+                datetime.fromisoformat(decoded["accepted_at"]) if "accepted_at" in decoded else None
+            ),
+            lines=_decode_lines(decoded.get("lines")),
+        )
+
+    @classmethod
+    def from_event(cls, payload: Mapping[str, Any]) -> KitchenTicket:
+        return cls(
+            id=payload["order_id"],
+            restaurant_id=payload["restaurant_id"],
+            location_id=payload.get("location_id"),
+            session_id=payload["session_id"],
+            table_id=payload.get("table_id"),
+            table_label=payload.get("table_label"),
+            channel=payload["channel"],
+            source_type=payload["source_type"],
+            status=payload["status"],
+            notes=payload.get("notes"),
+            created_at=datetime.fromisoformat(payload["created_at"]),
+            updated_at=datetime.fromisoformat(payload["updated_at"]),
+            accepted_at=(
+                datetime.fromisoformat(payload["occurred_at"])
+                if payload.get("event_type") == "order.accepted"
+                else None
+            ),
+            lines=[KitchenTicketLine.from_dict(line) for line in payload.get("lines", [])],
+        )
+
+
+@dataclass(slots=True)
+class KitchenBoardWrite:
+    seq: int
+    prep_changes: list[PrepSummaryChange]
+
+
+@dataclass(slots=True)
+class KitchenBoardChanges:
+    cursor: int
+    reset: bool
+    tickets: list[KitchenTicket]
+    removed: list[str]
+
+
+class _KitchenBoardKeys:
+    """Key layout shared by the sync board and its async reader."""
+
+    @staticmethod
+    def _built_key(restaurant_id: str) -> str:
+        return f"kitchen:{restaurant_id}:built"
+
+    @staticmethod
+    def _seq_key(restaurant_id: str) -> str:
+        return f"kitchen:{restaurant_id}:seq"
+
+    @staticmethod
+    def _changes_key(restaurant_id: str) -> str:
+        return f"kitchen:{restaurant_id}:changes"
+
+    @staticmethod
+    def _floor_key(restaurant_id: str) -> str:
+        return f"kitchen:{restaurant_id}:changes_floor"
+
+    @staticmethod
+    def _prep_key(restaurant_id: str) -> str:
+        return f"kitchen:{restaurant_id}:prep"
+
+    @staticmethod
+    def _queue_key(restaurant_id: str, status: str) -> str:
+        return f"kitchen:{restaurant_id}:q:{status}"
+
+    @staticmethod
+    def _station_queue_key(restaurant_id: str, station: str, status: str) -> str:
+        return f"kitchen:{restaurant_id}:s:{station}:q:{status}"
+
+    @staticmethod
+    def _ticket_key(restaurant_id: str, order_id: str) -> str:
+        return f"kitchen:{restaurant_id}:t:{order_id}"
+
+    def _queue_keys(self, restaurant_id: str, station: str | None = None) -> list[str]:
+        if station is None:
+            return [
+                self._queue_key(restaurant_id, status.value) for status in KITCHEN_BOARD_STATUSES
+            ]
+        return [
+            self._station_queue_key(restaurant_id, station, status.value)
+            for status in KITCHEN_BOARD_STATUSES
+        ]
+
+    def _page_keys(
+        self,
+        restaurant_id: str,
+        statuses: Sequence[OrderStatus],
+        station: str | None = None,
+    ) -> list[str]:
+        return [
+            (
+                self._queue_key(restaurant_id, status.value)
+                if station is None
+                else self._station_queue_key(restaurant_id, station, status.value)
+            )
+            for status in statuses
+        ]
+
+
+def _oldest(ranges: Sequence[Sequence[tuple[Any, float]]], limit: int) -> list[str]:
+    """Order ids of the oldest ``limit`` tickets across ranged reads of status queues."""
+    ordered = heapq.merge(
+        *[[(score, _decode(member)) for member, score in entries] for entries in ranges]
+    )
+    return [order_id for _, order_id in islice(ordered, limit)]
+
+
+def _depths(counts: Sequence[Any]) -> dict[str, int]:
+    return {
+        status.value: int(count)
+        for status, count in zip(KITCHEN_BOARD_STATUSES, counts, strict=True)
+    }
+
+
+class RedisKitchenBoard(_KitchenBoardKeys):
+    """Live per-restaurant kitchen board kept in Redis.
+
+    Each active status has a sorted set of order ids scored by ``created_at`` and every
+    ticket is stored as a compact hash, so a queue page costs one ranged read per status
+    plus one pipelined hash fetch.
+
+    Tickets are also filed in one set of status queues per prep station that has lines on
+    them, so a station screen pages its own queue without filtering the whole board.
+
+    A per-restaurant hash counts the quantity of every distinct item across tickets that
+    still need cooking. The upsert script adjusts it only when a ticket moves in or out of
+    those statuses, so replays and repeated events never double count.
+
+    Every write also bumps a per-restaurant sequence and records the order id in a capped
+    change log scored by that sequence, which backs cursor-based incremental reads.
+    """
+
+    def __init__(self, timeout_seconds: float = 1.0) -> None:
+        self._timeout_seconds = timeout_seconds
+
+    def _client(self):
+        return get_redis_client(timeout_seconds=self._timeout_seconds)
+
+    def apply_event(self, payload: Mapping[str, Any]) -> KitchenBoardWrite | None:
+        try:
+            return self.upsert(KitchenTicket.from_event(payload))
+        except Exception:
+            logger.exception(
+                "kitchen_board_apply_failed",
+                extra={"restaurant_id": payload.get("restaurant_id")},
+            )
+            return None
+
+    def upsert(self, ticket: KitchenTicket) -> KitchenBoardWrite:
+        restaurant_id = ticket.restaurant_id
+        statuses = [status.value for status in KITCHEN_BOARD_STATUSES]
+        target = statuses.index(ticket.status) + 1 if ticket.status in statuses else 0
+        prep = list(ticket.prep_quantities().items())
+        prep_args = [item for key, quantity in prep for item in (key.encode(), quantity)]
+        fields = [item for pair in ticket.to_hash().items() for item in pair]
+        script = self._client().register_script(_UPSERT_SCRIPT)
+        seq, direction, counts = script(
+            keys=[
+                self._seq_key(restaurant_id),
+                self._changes_key(restaurant_id),
+                self._floor_key(restaurant_id),
+                self._ticket_key(restaurant_id, ticket.id),
+                self._prep_key(restaurant_id),
+                *self._queue_keys(restaurant_id),
+                *[
+                    key
+                    for station in ticket.stations
+                    for key in self._queue_keys(restaurant_id, station)
+                ],
+            ],
+            args=[
+                ticket.id,
+                target,
+                ticket.score,
+                CHANGE_LOG_LENGTH,
+                len(KITCHEN_BOARD_STATUSES),
+                len(PREP_SUMMARY_STATUSES),
+                len(prep),
+                *prep_args,
+                *fields,
+            ],
+        )
+        prep_changes = [
+            PrepSummaryChange(
+                key=key,
+                quantity_delta=int(direction) * quantity,
+                quantity=int(count),
+            )
+            for (key, quantity), count in zip(prep, counts, strict=False)
+        ]
+        return KitchenBoardWrite(seq=int(seq), prep_changes=prep_changes)
+
+    def page(
+        self,
+        restaurant_id: str,
+        statuses: Sequence[OrderStatus],
+        limit: int,
+        station: str | None = None,
+    ) -> list[KitchenTicket] | None:
+        """Return the oldest ``limit`` tickets across ``statuses``, optionally for one station.
+
+        Returns ``None`` when the board has not been built for the restaurant yet.
+        """
+        pipeline = self._client().pipeline(transaction=False)
+        pipeline.exists(self._built_key(restaurant_id))
+        for key in self._page_keys(restaurant_id, statuses, station):
+            pipeline.zrange(key, 0, limit - 1, withscores=True)
+        built, *ranges = pipeline.execute()
+        if not built:
+            return None
+        return self._fetch(restaurant_id, _oldest(ranges, limit))
+
+    def _fetch(self, restaurant_id: str, order_ids: Iterable[str]) -> list[KitchenTicket]:
+        pipeline = self._client().pipeline(transaction=False)
+        for order_id in order_ids:
+            pipeline.hgetall(self._ticket_key(restaurant_id, order_id))
+        return [KitchenTicket.from_hash(values) for values in pipeline.execute() if values]
+
+    def changes(self, restaurant_id: str, since: int | None) -> KitchenBoardChanges | None:
+        """Return tickets written after ``since``.
+
+        Without a cursor, or when the cursor predates the retained change log, the full
+        board is returned with ``reset`` set so the caller replaces its local state.
+        Returns ``None`` when the board has not been built for the restaurant yet.
+        """
+        pipeline = self._client().pipeline(transaction=True)
+        pipeline.exists(self._built_key(restaurant_id))
+        pipeline.get(self._seq_key(restaurant_id))
+        pipeline.get(self._floor_key(restaurant_id))
+        pipeline.zrangebyscore(
+            self._changes_key(restaurant_id),
+            f"({since if since is not None else 0}",
+            "+inf",
+        )
+        built, seq, floor, changed = pipeline.execute()
+        if not built:
+            return None
+
+        cursor = int(seq or 0)
+        floor_seq = int(floor or 0)
+        if since is None or since < floor_seq or since > cursor:
+            board = self._fetch(restaurant_id, self.statuses(restaurant_id).keys())
+            board.sort(key=lambda ticket: ticket.score)
+            return KitchenBoardChanges(cursor=cursor, reset=True, tickets=board, removed=[])
+
+        order_ids = [_decode(member) for member in changed]
+        pipeline = self._client().pipeline(transaction=False)
+        for order_id in order_ids:
+            pipeline.hgetall(self._ticket_key(restaurant_id, order_id))
+        tickets: list[KitchenTicket] = []
+        removed: list[str] = []
+        for order_id, values in zip(order_ids, pipeline.execute(), strict=True):
+            if values:
+                tickets.append(KitchenTicket.from_hash(values))
+            else:
+                removed.append(order_id)
+        return KitchenBoardChanges(cursor=cursor, reset=False, tickets=tickets, removed=removed)
+
+    def depth(self, restaurant_id: str, station: str | None = None) -> dict[str, int]:
+        pipeline = self._client().pipeline(transaction=False)
+        for key in self._queue_keys(restaurant_id, station):
+            pipeline.zcard(key)
+        return _depths(pipeline.execute())
+
+    def prep_summary(self, restaurant_id: str) -> dict[PrepSummaryKey, int] | None:
+        """Open quantity per distinct item, or ``None`` when the board is not built yet."""
+        pipeline = self._client().pipeline(transaction=False)
+        pipeline.exists(self._built_key(restaurant_id))
+        pipeline.hgetall(self._prep_key(restaurant_id))
+        built, counts = pipeline.execute()
+        if not built:
+            return None
+        return {
+            PrepSummaryKey.decode(_decode(field)): int(count)
+            for field, count in counts.items()
+            if int(count) > 0
+        }
+
+    def pending_rank(self, restaurant_id: str, order_id: str) -> int | None:
+        rank = self._client().zrank(
+            self._queue_key(restaurant_id, OrderStatus.PENDING.value),
+            order_id,
+        )
+        return None if rank is None else int(rank)
+
+    def ticket(self, restaurant_id: str, order_id: str) -> KitchenTicket | None:
+        tickets = self._fetch(restaurant_id, [order_id])
+        return tickets[0] if tickets else None
+
+    def statuses(self, restaurant_id: str) -> dict[str, str]:
+        """Map every order id on the board to the status queue it sits in."""
+        pipeline = self._client().pipeline(transaction=False)
+        for status in KITCHEN_BOARD_STATUSES:
+            pipeline.zrange(self._queue_key(restaurant_id, status.value), 0, -1)
+        placement: dict[str, str] = {}
+        for status, members in zip(KITCHEN_BOARD_STATUSES, pipeline.execute(), strict=True):
+            for member in members:
+                placement[_decode(member)] = status.value
+        return placement
+
+    def seq(self, restaurant_id: str) -> int:
+        """The board's current write sequence; pass it to :meth:`rebuild` as ``since``."""
+        return int(self._client().get(self._seq_key(restaurant_id)) or 0)
+
+    def rebuild(
+        self,
+        restaurant_id: str,
+        tickets: Iterable[KitchenTicket],
+        since: int,
+    ) -> int | None:
+        """Replace the board with ``tickets``, read from the database after ``since``.
+
+        Events keep landing while the caller reads the database, so every ticket the
+        change log shows as written after ``since`` keeps its board state (or stays
+        removed) instead of being overwritten by the older database snapshot. The change
+        log is read under ``WATCH`` on the sequence, and a write that slips in before the
+        swap restarts it, up to ``REBUILD_WATCH_ATTEMPTS`` times. Returns ``None`` when
+        the log no longer reaches back to ``since`` or the writes keep winning, so the
+        caller has to read the database again.
+        """
+        snapshot = list(tickets)
+        client = self._client()
+        seq_key = self._seq_key(restaurant_id)
+        # Scanned once, outside the retries. Keys created after the scan only hold tickets
+        # written after ``since``, which the rebuild keeps as they are.
+        stale_keys = [
+            _decode(key)
+            for pattern in (
+                self._ticket_key(restaurant_id, "*"),
+                self._station_queue_key(restaurant_id, "*", "*"),
+            )
+            for key in client.scan_iter(match=pattern)
+        ]
+        with client.pipeline(transaction=True) as pipeline:
+            for _ in range(REBUILD_WATCH_ATTEMPTS):
+                try:
+                    pipeline.watch(seq_key)
+                    if int(pipeline.get(self._floor_key(restaurant_id)) or 0) > since:
+                        pipeline.unwatch()
+                        return None
+                    touched = [
+                        _decode(member)
+                        for member in pipeline.zrangebyscore(
+                            self._changes_key(restaurant_id), f"({since}", "+inf"
+                        )
+                    ]
+                    current = [
+                        KitchenTicket.from_hash(values)
+                        for values in (
+                            pipeline.hgetall(self._ticket_key(restaurant_id, order_id))
+                            for order_id in touched
+                        )
+                        if values
+                    ]
+                    # Moving the floor up to a fresh sequence resets every outstanding cursor.
+                    floor = int(pipeline.get(seq_key) or 0) + 1
+                    pipeline.multi()
+                    pipeline.set(seq_key, floor)
+                    changed = set(touched)
+                    count = self._write_board(
+                        pipeline,
+                        restaurant_id,
+                        [ticket for ticket in snapshot if ticket.id not in changed] + current,
+                        stale_keys,
+                    )
+                    pipeline.set(self._floor_key(restaurant_id), floor)
+                    pipeline.set(self._built_key(restaurant_id), "1")
+                    pipeline.execute()
+                    return count
+                except WatchError:
+                    continue
+        logger.warning("kitchen_board_rebuild_contended", extra={"restaurant_id": restaurant_id})
+        return None
+
+    def _write_board(
+        self,
+        pipeline: Any,
+        restaurant_id: str,
+        tickets: Iterable[KitchenTicket],
+        stale_keys: Sequence[str],
+    ) -> int:
+        if stale_keys:
+            pipeline.delete(*stale_keys)
+        pipeline.delete(
+            *self._queue_keys(restaurant_id),
+            self._changes_key(restaurant_id),
+            self._prep_key(restaurant_id),
+        )
+        open_statuses = {status.value for status in PREP_SUMMARY_STATUSES}
+        count = 0
+        for ticket in tickets:
+            if ticket.status in open_statuses:
+                for key, quantity in ticket.prep_quantities().items():
+                    pipeline.hincrby(self._prep_key(restaurant_id), key.encode(), quantity)
+            pipeline.hset(self._ticket_key(restaurant_id, ticket.id), mapping=ticket.to_hash())
+            pipeline.zadd(self._queue_key(restaurant_id, ticket.status), {ticket.id: ticket.score})
+            for station in ticket.stations:
+                pipeline.zadd(
+                    self._station_queue_key(restaurant_id, station, ticket.status),
+                    {ticket.id: ticket.score},
+                )
+            count += 1
+        return count
+
+
+class AsyncRedisKitchenBoard(_KitchenBoardKeys):
+    """The board reads a kitchen queue page needs, on the event loop.
+
+    Writes, rebuilds and the change feed stay on :class:`RedisKitchenBoard`; this reader
+    only pages queues and counts their depth, with the same keys and parsing.
+    """
+
+    def __init__(self, timeout_seconds: float = 1.0) -> None:
+        self._timeout_seconds = timeout_seconds
+
+    def _client(self):
+        return get_async_redis_client(timeout_seconds=self._timeout_seconds)
+
+    async def page(
+        self,
+        restaurant_id: str,
+        statuses: Sequence[OrderStatus],
+        limit: int,
+        station: str | None = None,
+    ) -> list[KitchenTicket] | None:
+        """See :meth:`RedisKitchenBoard.page`."""
+        pipeline = self._client().pipeline(transaction=False)
+        pipeline.exists(self._built_key(restaurant_id))
+        for key in self._page_keys(restaurant_id, statuses, station):
+            pipeline.zrange(key, 0, limit - 1, withscores=True)
+        built, *ranges = await pipeline.execute()
+        if not built:
+            return None
+        pipeline = self._client().pipeline(transaction=False)
+        for order_id in _oldest(ranges, limit):
+            pipeline.hgetall(self._ticket_key(restaurant_id, order_id))
+        return [KitchenTicket.from_hash(values) for values in await pipeline.execute() if values]
+
+    async def depth(self, restaurant_id: str, station: str | None = None) -> dict[str, int]:
+        pipeline = self._client().pipeline(transaction=False)
+        for key in self._queue_keys(restaurant_id, station):
+            pipeline.zcard(key)
+        return _depths(await pipeline.execute())
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from rop.domain.kitchen.prep_time import QuantileSketch, sketch_bucket
+from rop.infrastructure.cache.redis_client import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 900
+ROLLING_WINDOWS = 4
+
+RESTAURANT_SCOPE = "restaurant"
+
+
+def item_scope(menu_item_id: str) -> str:
+    return f"item:{menu_item_id}"
+
+
+def station_scope(station: str) -> str:
+    return f"station:{station}"
+
+
+class RedisPrepTimeStats:
+    """Rolling prep-time sketches kept as Redis hashes of bucket counts.
+
+    Samples are added with ``HINCRBY`` into fixed windows that expire on their own, and a
+    read merges the last ``ROLLING_WINDOWS`` windows, so nothing ever re-scans history.
+    """
+
+    def __init__(self, timeout_seconds: float = 1.0) -> None:
+        self._timeout_seconds = timeout_seconds
+
+    @staticmethod
+    def _key(restaurant_id: str, metric: str, scope: str, window: int) -> str:
+        return f"prep:{restaurant_id}:{metric}:{scope}:{window}"
+
+    @staticmethod
+    def _window(at: datetime) -> int:
+        return int(at.timestamp()) // WINDOW_SECONDS
+
+    def _client(self):
+        return get_redis_client(timeout_seconds=self._timeout_seconds)
+
+    def record(
+        self,
+        restaurant_id: str,
+        metric: str,
+        seconds: float,
+        scopes: Iterable[str],
+        at: datetime,
+    ) -> None:
+        window = self._window(at)
+        bucket = sketch_bucket(seconds)
+        try:
+            pipeline = self._client().pipeline(transaction=False)
+            for scope in {RESTAURANT_SCOPE, *scopes}:
+                key = self._key(restaurant_id, metric, scope, window)
+                pipeline.hincrby(key, str(bucket), 1)
+                pipeline.expire(key, WINDOW_SECONDS * (ROLLING_WINDOWS + 1))
+            pipeline.execute()
+        except Exception:
+            logger.exception(
+                "prep_stats_record_failed",
+                extra={"restaurant_id": restaurant_id, "metric": metric},
+            )
+
+    def sketches(
+        self,
+        restaurant_id: str,
+        metric: str,
+        scopes: Sequence[str],
+        now: datetime,
+    ) -> dict[str, QuantileSketch]:
+        pipeline = self._client().pipeline(transaction=False)
+        for key in _sketch_keys(restaurant_id, metric, scopes, now):
+            pipeline.hgetall(key)
+        return _merge_windows(scopes, pipeline.execute())
+
+
+def _sketch_keys(
+    restaurant_id: str,
+    metric: str,
+    scopes: Sequence[str],
+    now: datetime,
+) -> list[str]:
+    """The window hashes a read merges, ``ROLLING_WINDOWS`` per scope in scope order."""
+    current = RedisPrepTimeStats._window(now)
+    return [
+        RedisPrepTimeStats._key(restaurant_id, metric, scope, window)
+        for scope in scopes
+        for window in range(current - ROLLING_WINDOWS + 1, current + 1)
+    ]
+
+
+def _merge_windows(
+    scopes: Sequence[str],
+    results: Sequence[Mapping[Any, Any]],
+) -> dict[str, QuantileSketch]:
+    windows = iter(results)
+    return {
+        scope: QuantileSketch.from_counts(
+            {int(bucket): int(count) for bucket, count in next(windows).items()}
+            for _ in range(ROLLING_WINDOWS)
+        )
+        for scope in scopes
+    }
+
+
+class AsyncRedisPrepTimeStats:
+    """Reads of :class:`RedisPrepTimeStats` sketches on the event loop."""
+
+    def __init__(self, timeout_seconds: float = 1.0) -> None:
+        self._timeout_seconds = timeout_seconds
+
+    async def sketches(
+        self,
+        restaurant_id: str,
+        metric: str,
+        scopes: Sequence[str],
+        now: datetime,
+    ) -> dict[str, QuantileSketch]:
+        client = get_async_redis_client(timeout_seconds=self._timeout_seconds)
+        pipeline = client.pipeline(transaction=False)
+        for key in _sketch_keys(restaurant_id, metric, scopes, now):
+            pipeline.hgetall(key)
+        return _merge_windows(scopes, await pipeline.execute())
@@ -4,6 +4,7 @@ import os
 from functools import lru_cache
 
 import redis
+from redis import asyncio as redis_asyncio
 
 
 def _redis_url() -> str:
@@ -26,6 +27,30 @@ def get_redis_client(timeout_seconds: float = 1.0) -> redis.Redis:
     return _build_client(_redis_url(), timeout_seconds)
 
 
+# Async clients pool connections on the event loop that opened them, so they are kept
+# here rather than in an lru_cache and closed when the app shuts down.
+_async_clients: dict[tuple[str, float], redis_asyncio.Redis] = {}
+
+
+def get_async_redis_client(timeout_seconds: float = 1.0) -> redis_asyncio.Redis:
+    key = (_redis_url(), timeout_seconds)
+    client = _async_clients.get(key)
+    if client is None:
+        client = _async_clients[key] = redis_asyncio.Redis.from_url(
+            key[0],
+            socket_connect_timeout=timeout_seconds,
+            socket_timeout=timeout_seconds,
+        )
+    return client
+
+
+async def close_async_redis_clients() -> None:
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
 def ping_redis(timeout_seconds: float = 1.0) -> bool:
     try:
         return bool(get_redis_client(timeout_seconds).ping())
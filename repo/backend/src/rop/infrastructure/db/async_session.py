@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from rop.infrastructure.db.pool import pool_options
+from rop.infrastructure.db.query_stats import instrument_engine
+from rop.infrastructure.db.session import _connect_args, _database_url, _replica_urls
+
+# Async pools hold connections bound to the event loop that opened them, so engines are
+# kept here rather than in an lru_cache and disposed when the app shuts down.
+_engines: dict[tuple[str, int, str], AsyncEngine] = {}
+_session_factories: dict[tuple[str, int, str], async_sessionmaker[AsyncSession]] = {}
+
+
+def _engine(database_url: str, connect_timeout: int, pool_name: str) -> AsyncEngine:
+    key = (database_url, connect_timeout, pool_name)
+    engine = _engines.get(key)
+    if engine is None:
+        # psycopg 3 serves both engines from the same postgresql+psycopg URL.
+        engine = _engines[key] = create_async_engine(
+            database_url,
+            connect_args=_connect_args(database_url, connect_timeout),
+            **pool_options(database_url, pool_name, asynchronous=True),
+        )
+        instrument_engine(engine.sync_engine)
+    return engine
+
+
+def _session_factory(
+    database_url: str,
+    connect_timeout: int,
+    pool_name: str,
+) -> async_sessionmaker[AsyncSession]:
+    key = (database_url, connect_timeout, pool_name)
+    factory = _session_factories.get(key)
+    if factory is None:
+        factory = _session_factories[key] = async_sessionmaker(
+            bind=_engine(database_url, connect_timeout, pool_name),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return factory
+
+
+def get_async_engine(timeout_seconds: float = 1.0) -> AsyncEngine:
+    return _engine(_database_url(), max(1, int(timeout_seconds)), "async")
+
+
+def get_async_session_factory(timeout_seconds: float = 1.0) -> async_sessionmaker[AsyncSession]:
+    return _session_factory(_database_url(), max(1, int(timeout_seconds)), "async")
+
+
+def get_async_reader_session_factories(
+    timeout_seconds: float = 1.0,
+) -> list[async_sessionmaker[AsyncSession]]:
+    connect_timeout = max(1, int(timeout_seconds))
+    return [
+        _session_factory(url, connect_timeout, f"async_replica_{index}")
+        for index, url in enumerate(_replica_urls())
+    ]
+
+
+async def dispose_async_engines() -> None:
+    engines = list(_engines.values())
+    _engines.clear()
+    _session_factories.clear()
+    for engine in engines:
+        await engine.dispose()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import re
+
+from prometheus_client import Counter
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from rop.infrastructure.db.async_session import (
+    get_async_reader_session_factories,
+    get_async_session_factory,
+)
+from rop.infrastructure.db.session import get_reader_session_factories, get_session_factory
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+
+DB_READ_ROUTES = Counter(
+    "db_read_routes_total",
+    "Read-only requests by the database they were served from and why",
+    ["target", "reason"],
+)
+
+# pg_lsn text form, e.g. ``0/16B3748``.
+_LSN_PATTERN = re.compile(r"^[0-9A-F]{1,8}/[0-9A-F]{1,8}$")
+_COMMITTED = "rop_committed"
+
+_CURRENT_LSN = text("SELECT pg_current_wal_lsn()::text")
+# pg_last_wal_replay_lsn() is NULL on a server that is not in recovery, so a replica URL
+# that points at the primary is always caught up.
+_REPLAYED = text(
+    "SELECT pg_last_wal_replay_lsn() IS NULL "
+    "OR pg_last_wal_replay_lsn() >= CAST(:token AS pg_lsn)"
+)
+
+_reader_turn = itertools.count()
+
+
+def parse_consistency_token(raw_value: str | None) -> str | None:
+    """Return the token if it is a WAL position; anything else is ignored."""
+    if raw_value is None:
+        return None
+    token = raw_value.strip().upper()
+    return token if _LSN_PATTERN.match(token) else None
+
+
+def _mark_committed(session: Session) -> None:
+    session.info[_COMMITTED] = True
+
+
+def track_commits(session: Session) -> None:
+    event.listen(session, "after_commit", _mark_committed)
+
+
+def committed(session: Session) -> bool:
+    return bool(session.info.get(_COMMITTED))
+
+
+def write_position(session: Session) -> str | None:
+    """The primary's WAL position after a commit, handed to the client as its token."""
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    try:
+        return session.scalar(_CURRENT_LSN)
+    except Exception:
+        logger.exception("consistency_token_failed")
+        return None
+
+
+def _has_replayed(session: Session, token: str) -> bool:
+    try:
+        return bool(session.scalar(_REPLAYED, {"token": token}))
+    except Exception:
+        logger.exception("replica_position_check_failed")
+        return False
+
+
+async def _async_has_replayed(session: AsyncSession, token: str) -> bool:
+    try:
+        return bool(await session.scalar(_REPLAYED, {"token": token}))
+    except Exception:
+        logger.exception("replica_position_check_failed")
+        return False
+
+
+def read_session(token: str | None) -> Session:
+    """Open a session on a replica that has replayed ``token``, else on the primary."""
+    readers = get_reader_session_factories()
+    if not readers:
+        DB_READ_ROUTES.labels(target="primary", reason="no_replicas").inc()
+        return get_session_factory()()
+    session = readers[next(_reader_turn) % len(readers)]()
+    if token is None:
+        DB_READ_ROUTES.labels(target="replica", reason="no_token").inc()
+        return session
+    if _has_replayed(session, token):
+        DB_READ_ROUTES.labels(target="replica", reason="caught_up").inc()
+        return session
+    session.close()
+    DB_READ_ROUTES.labels(target="primary", reason="replica_behind").inc()
+    return get_session_factory()()
+
+
+async def async_read_session(token: str | None) -> AsyncSession:
+    readers = get_async_reader_session_factories()
+    if not readers:
+        DB_READ_ROUTES.labels(target="primary", reason="no_replicas").inc()
+        return get_async_session_factory()()
+    session = readers[next(_reader_turn) % len(readers)]()
+    if token is None:
+        DB_READ_ROUTES.labels(target="replica", reason="no_token").inc()
+        return session
+    if await _async_has_replayed(session, token):
+        DB_READ_ROUTES.labels(target="replica", reason="caught_up").inc()
+        return session
+    await session.close()
+    DB_READ_ROUTES.labels(target="primary", reason="replica_behind").inc()
+    return get_async_session_factory()()
@@ -0,0 +1,26 @@
+"""kitchen stations
+
+Revision ID: 202610190900
+Revises: 202604091200
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "202610190900"
+down_revision = "202604091200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("menu_items", sa.Column("station", sa.String(length=50), nullable=True))
+    op.add_column("order_lines", sa.Column("station", sa.String(length=50), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("order_lines", "station")
+    op.drop_column("menu_items", "station")
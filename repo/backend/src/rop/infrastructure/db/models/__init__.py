@@ -181,6 +181,7 @@ class MenuItemModel(TimestampMixin, SoftDeleteMixin, Base):
     currency: Mapped[str] = mapped_column(String(3), nullable=False, server_default="USD")
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
     is_available: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
+    station: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     restaurant: Mapped[RestaurantModel] = relationship(back_populates="menu_items")
     category: Mapped[CategoryModel | None] = relationship(back_populates="menu_items")
@@ -325,6 +326,7 @@ class OrderLineModel(TimestampMixin, Base):
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     line_total: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    station: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     order: Mapped[OrderModel] = relationship(back_populates="lines")
 
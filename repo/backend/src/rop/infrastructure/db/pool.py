@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    ["pool"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size (negative while the pool is not yet full)",
+    ["pool"],
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent acquiring a connection from the pool",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+
+
+def _pool_label(pool: QueuePool) -> str:
+    # ``logging_name`` is the only identifier a pool carries across ``recreate()``.
+    return pool.logging_name or "default"
+
+
+class _InstrumentedPool:
+    """Pool hooks that time checkouts and keep the usage gauges current.
+
+    Mixed in ahead of ``QueuePool`` so ``recreate()``, which rebuilds the pool from its
+    own class, stays instrumented.
+    """
+
+    def _record_usage(self) -> None:
+        label = _pool_label(self)  # type: ignore[arg-type]
+        DB_POOL_CHECKED_OUT.labels(pool=label).set(self.checkedout())  # type: ignore[attr-defined]
+        DB_POOL_OVERFLOW.labels(pool=label).set(self.overflow())  # type: ignore[attr-defined]
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        label = _pool_label(self)  # type: ignore[arg-type]
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.labels(pool=label).inc()
+            raise
+        finally:
+            DB_POOL_WAIT.labels(pool=label).observe(time.perf_counter() - started)
+        self._record_usage()
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)  # type: ignore[misc]
+        self._record_usage()
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw_value = os.getenv(name)
+    if raw_value is None:
+        return default
+    return raw_value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def pool_options(database_url: str, name: str, asynchronous: bool = False) -> dict[str, Any]:
+    """Engine keyword arguments for the connection pool, read from ``DB_POOL_*``.
+
+    ``DB_POOL_PRE_PING`` pings on every checkout (a round trip per request); deployments
+    can turn it off and rely on ``DB_POOL_RECYCLE`` to retire connections before the
+    server or a proxy drops them.
+    """
+    options: dict[str, Any] = {"pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True)}
+    if database_url.startswith("sqlite"):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        pool_logging_name=name,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "-1")),
+    )
+    return options
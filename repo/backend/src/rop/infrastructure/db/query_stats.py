@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """Statements executed and time spent in the database for one unit of work."""
+
+    statements: int = 0
+    duration_seconds: float = 0.0
+    by_statement: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_seconds: float) -> None:
+        self.statements += 1
+        self.duration_seconds += duration_seconds
+        self.by_statement[statement] += 1
+
+    def repeated(self, times: int = 2) -> dict[str, int]:
+        """Identical statements run at least ``times`` times, the usual sign of an N+1 loop."""
+        return {
+            statement: count for statement, count in self.by_statement.items() if count >= times
+        }
+
+
+_request_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+_REQUEST_STARTED = "rop_request_query_started"
+_CAPTURE_STARTED = "rop_capture_query_started"
+
+
+@contextmanager
+def request_query_stats() -> Iterator[QueryStats]:
+    """Collect statements from instrumented engines issued in this context.
+
+    The stats object is shared rather than the variable reassigned, so statements run by
+    sync handlers on the threadpool (which see a copy of the context) still land here.
+    """
+    stats = QueryStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+def _timing_listeners(
+    key: str,
+    sink: Callable[[], QueryStats | None],
+) -> tuple[Callable[..., None], Callable[..., None]]:
+    # The start time lives on the execution context, so a statement that raises leaves
+    # nothing behind on the connection.
+    def before_cursor_execute(
+        _connection: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        context: Any,
+        _executemany: bool,
+    ) -> None:
+        setattr(context, key, time.perf_counter())
+
+    def after_cursor_execute(
+        _connection: Any,
+        _cursor: Any,
+        statement: str,
+        _parameters: Any,
+        context: Any,
+        _executemany: bool,
+    ) -> None:
+        stats = sink()
+        started = getattr(context, key, None)
+        if stats is not None and started is not None:
+            stats.record(statement, time.perf_counter() - started)
+
+    return before_cursor_execute, after_cursor_execute
+
+
+_request_listeners = _timing_listeners(_REQUEST_STARTED, _request_stats.get)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute ``engine``'s statements to the request in progress, if any."""
+    before, after = _request_listeners
+    if event.contains(engine, "before_cursor_execute", before):
+        return
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Record every statement on any engine while the block runs, from any thread.
+
+    Meant for tests, where requests are served on a thread the caller's context does not
+    reach.
+    """
+    stats = QueryStats()
+    before, after = _timing_listeners(_CAPTURE_STARTED, lambda: stats)
+    event.listen(Engine, "before_cursor_execute", before)
+    event.listen(Engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        event.remove(Engine, "before_cursor_execute", before)
+        event.remove(Engine, "after_cursor_execute", after)
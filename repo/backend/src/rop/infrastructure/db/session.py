@@ -4,10 +4,13 @@ import os
 from contextlib import contextmanager
 from functools import lru_cache
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, make_url, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from rop.infrastructure.db.pool import pool_options
+from rop.infrastructure.db.query_stats import instrument_engine
+
 
 def _database_url() -> str:
     url = os.getenv("DATABASE_URL")
@@ -16,20 +19,42 @@ def _database_url() -> str:
     return url
 
 
+def _replica_urls() -> tuple[str, ...]:
+    raw_value = os.getenv("DATABASE_REPLICA_URLS", "")
+    return tuple(url.strip() for url in raw_value.split(",") if url.strip())
+
+
+def _prepare_threshold() -> int | None:
+    """Executions before psycopg prepares a statement server-side; ``off`` never prepares.
+
+    Prepared statements live on one server connection, so they must be turned off behind a
+    transaction-pooling PgBouncer.
+    """
+    raw_value = os.getenv("DB_PREPARE_THRESHOLD", "2").strip().lower()
+    if raw_value in {"", "off", "none"}:
+        return None
+    return int(raw_value)
+
+
 def _connect_args(database_url: str, connect_timeout: int) -> dict[str, object]:
     if database_url.startswith("sqlite"):
         return {"check_same_thread": False}
-    return {"connect_timeout": connect_timeout}
+    connect_args: dict[str, object] = {"connect_timeout": connect_timeout}
+    if make_url(database_url).get_driver_name() == "psycopg":
+        connect_args["prepare_threshold"] = _prepare_threshold()
+    return connect_args
 
 
 @lru_cache(maxsize=8)
-def _build_engine(database_url: str, connect_timeout: int) -> Engine:
-    return create_engine(
+def _build_engine(database_url: str, connect_timeout: int, pool_name: str = "sync") -> Engine:
+    engine = create_engine(
         database_url,
         future=True,
-        pool_pre_ping=True,
         connect_args=_connect_args(database_url, connect_timeout),
+        **pool_options(database_url, pool_name),
     )
+    instrument_engine(engine)
+    return engine
 
 
 def get_engine(timeout_seconds: float = 1.0) -> Engine:
@@ -38,8 +63,12 @@ def get_engine(timeout_seconds: float = 1.0) -> Engine:
 
 
 @lru_cache(maxsize=8)
-def _build_session_factory(database_url: str, connect_timeout: int) -> sessionmaker[Session]:
-    engine = _build_engine(database_url, connect_timeout)
+def _build_session_factory(
+    database_url: str,
+    connect_timeout: int,
+    pool_name: str = "sync",
+) -> sessionmaker[Session]:
+    engine = _build_engine(database_url, connect_timeout, pool_name)
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
 
@@ -48,6 +77,15 @@ def get_session_factory(timeout_seconds: float = 1.0) -> sessionmaker[Session]:
     return _build_session_factory(_database_url(), connect_timeout)
 
 
+def get_reader_session_factories(timeout_seconds: float = 1.0) -> list[sessionmaker[Session]]:
+    """One factory per ``DATABASE_REPLICA_URLS`` entry; empty when reads stay on the primary."""
+    connect_timeout = max(1, int(timeout_seconds))
+    return [
+        _build_session_factory(url, connect_timeout, f"sync_replica_{index}")
+        for index, url in enumerate(_replica_urls())
+    ]
+
+
 @contextmanager
 def session_scope(timeout_seconds: float = 1.0):
     session = get_session_factory(timeout_seconds)()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
+
+
+class ChangeNotifier:
+    """Wakes in-process long-poll waiters when the fanout sees a restaurant event.
+
+    Waiters grab the current event before checking for changes and then wait on it, so a
+    notification that lands between the check and the wait is never missed. While a
+    waiter is watching, the restaurant is held in ``subscriptions`` so this replica keeps
+    receiving its events; events published before that subscription lands never reach
+    the notifier, which waiters check with :meth:`subscribed`.
+    """
+
+    def __init__(self, subscriptions: FanoutSubscriptions | None = None) -> None:
+        self._events: dict[str, asyncio.Event] = {}
+        self._subscriptions = subscriptions
+
+    def subscribe(self, restaurant_id: str) -> asyncio.Event:
+        event = self._events.get(restaurant_id)
+        if event is None:
+            event = asyncio.Event()
+            self._events[restaurant_id] = event
+        return event
+
+    @contextmanager
+    def watch(self, restaurant_id: str) -> Iterator[asyncio.Event]:
+        if self._subscriptions is not None:
+            self._subscriptions.acquire(restaurant_id)
+        try:
+            yield self.subscribe(restaurant_id)
+        finally:
+            if self._subscriptions is not None:
+                self._subscriptions.release(restaurant_id)
+
+    def subscribed(self, restaurant_id: str) -> bool:
+        return self._subscriptions is None or self._subscriptions.subscribed(restaurant_id)
+
+    async def wait_subscribed(self, restaurant_id: str, timeout_seconds: float) -> bool:
+        if self._subscriptions is None:
+            return True
+        return await self._subscriptions.wait_subscribed(restaurant_id, timeout_seconds)
+
+    def notify(self, restaurant_id: str) -> None:
+        event = self._events.pop(restaurant_id, None)
+        if event is not None:
+            event.set()
+
+    async def wait(self, event: asyncio.Event, timeout_seconds: float) -> bool:
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout=timeout_seconds)
+        return event.is_set()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+
+from rop.infrastructure.cache.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+MAX_REPLAY_EVENTS = 1000
+
+
+def event_stream_maxlen() -> int:
+    return max(1, int(os.getenv("EVENT_STREAM_MAXLEN", "10000")))
+
+
+def event_channel(restaurant_id: str) -> str:
+    return f"events:{restaurant_id}"
+
+
+def event_seq_key(restaurant_id: str) -> str:
+    return f"events:{restaurant_id}:seq"
+
+
+def event_stream_key(restaurant_id: str) -> str:
+    return f"events:{restaurant_id}:stream"
+
+
+_SEQ_PREFIX = '{"seq":'
+
+
+def frame_seq(message: str) -> int | None:
+    """Sequence of a published event frame, read without decoding the whole JSON."""
+    if not message.startswith(_SEQ_PREFIX):
+        return None
+    digits = message[len(_SEQ_PREFIX) : message.find(",", len(_SEQ_PREFIX))]
+    return int(digits) if digits.isdigit() else None
+
+
+@dataclass(slots=True)
+class EventReplay:
+    """Events published after a client's last seen sequence.
+
+    ``reset`` means the gap can no longer be replayed (it was trimmed from the stream, or
+    the cursor is from a stream that no longer exists) and the client must reload its
+    state; ``seq`` is then the sequence to resume live updates from.
+    """
+
+    seq: int | None
+    reset: bool
+    events: list[str]
+
+
+def _decode(value: bytes | str) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+class RedisEventStream:
+    """Reads the capped per-restaurant event stream that backs websocket replay.
+
+    Stream entry ids are ``<seq>-0`` so a client's last seen ``seq`` is directly a stream
+    position.
+    """
+
+    def __init__(self, timeout_seconds: float = 1.0) -> None:
+        self._timeout_seconds = timeout_seconds
+
+    def read_since(
+        self,
+        restaurant_id: str,
+        last_seq: int,
+        limit: int = MAX_REPLAY_EVENTS,
+    ) -> EventReplay:
+        try:
+            pipeline = get_redis_client(timeout_seconds=self._timeout_seconds).pipeline(
+                transaction=True
+            )
+            pipeline.get(event_seq_key(restaurant_id))
+            pipeline.xrange(event_stream_key(restaurant_id), "-", "+", count=1)
+            pipeline.xrange(
+                event_stream_key(restaurant_id),
+                f"{last_seq + 1}-0",
+                "+",
+                count=limit + 1,
+            )
+            seq, oldest, entries = pipeline.execute()
+        except Exception:
+            logger.exception("event_stream_read_failed", extra={"restaurant_id": restaurant_id})
+            return EventReplay(seq=None, reset=True, events=[])
+
+        current = int(seq or 0)
+        if last_seq > current or len(entries) > limit:
+            return EventReplay(seq=current, reset=True, events=[])
+        if last_seq < current:
+            oldest_seq = int(_decode(oldest[0][0]).partition("-")[0]) if oldest else None
+            if oldest_seq is None or oldest_seq > last_seq + 1:
+                return EventReplay(seq=current, reset=True, events=[])
+        return EventReplay(
+            seq=current,
+            reset=False,
+            events=[_decode(fields[b"data"]) for _, fields in entries],
+        )
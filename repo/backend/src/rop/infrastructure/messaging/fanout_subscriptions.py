@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import suppress
+
+
+def _release_grace_seconds() -> float:
+    return max(0.0, float(os.getenv("REDIS_FANOUT_RELEASE_GRACE_SECONDS", "30")))
+
+
+class FanoutSubscriptions:
+    """Reference counts of in-process interest in each restaurant's event channel.
+
+    Websocket connections and long-poll waiters acquire a restaurant while they need its
+    events; the fanout listener keeps exact Redis channel subscriptions in step with the
+    set of restaurants that have at least one holder.
+
+    After the last release a restaurant stays in the set for ``grace_seconds``, so clients
+    that poll or reconnect do not churn SUBSCRIBE and UNSUBSCRIBE. The listener reports
+    which channels it has subscribed with :meth:`set_subscribed`, and holders that must
+    not miss an event wait for theirs with :meth:`wait_subscribed`.
+    """
+
+    def __init__(self, grace_seconds: float | None = None) -> None:
+        self._counts: dict[str, int] = {}
+        self._changed = asyncio.Event()
+        self._grace_seconds = _release_grace_seconds() if grace_seconds is None else grace_seconds
+        self._lingering: dict[str, asyncio.TimerHandle] = {}
+        # None while the listener takes every channel through a pattern subscription.
+        self._subscribed: set[str] | None = set()
+        self._subscribed_events: dict[str, asyncio.Event] = {}
+
+    def acquire(self, restaurant_id: str) -> None:
+        count = self._counts.get(restaurant_id, 0)
+        self._counts[restaurant_id] = count + 1
+        lingering = self._lingering.pop(restaurant_id, None)
+        if lingering is not None:
+            lingering.cancel()
+        elif count == 0:
+            self._changed.set()
+
+    def release(self, restaurant_id: str) -> None:
+        count = self._counts.get(restaurant_id, 0)
+        if count > 1:
+            self._counts[restaurant_id] = count - 1
+            return
+        if self._counts.pop(restaurant_id, None) is None:
+            return
+        if self._grace_seconds > 0:
+            self._lingering[restaurant_id] = asyncio.get_running_loop().call_later(
+                self._grace_seconds, self._expire, restaurant_id
+            )
+        else:
+            self._changed.set()
+
+    def _expire(self, restaurant_id: str) -> None:
+        if self._lingering.pop(restaurant_id, None) is not None:
+            self._changed.set()
+
+    def restaurants(self) -> set[str]:
+        return set(self._counts) | set(self._lingering)
+
+    async def wait_changed(self) -> None:
+        await self._changed.wait()
+        self._changed.clear()
+
+    def set_subscribed(self, restaurant_ids: set[str] | None) -> None:
+        """Record the restaurants whose channels are subscribed; ``None`` means all."""
+        self._subscribed = None if restaurant_ids is None else set(restaurant_ids)
+        for restaurant_id in list(self._subscribed_events):
+            if self.subscribed(restaurant_id):
+                self._subscribed_events.pop(restaurant_id).set()
+
+    def subscribed(self, restaurant_id: str) -> bool:
+        return self._subscribed is None or restaurant_id in self._subscribed
+
+    async def wait_subscribed(self, restaurant_id: str, timeout_seconds: float) -> bool:
+        """Wait up to ``timeout_seconds`` for the listener to subscribe ``restaurant_id``."""
+        if self.subscribed(restaurant_id):
+            return True
+        event = self._subscribed_events.setdefault(restaurant_id, asyncio.Event())
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout=timeout_seconds)
+        return self.subscribed(restaurant_id)
@@ -3,12 +3,38 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from datetime import datetime, timezone
 from typing import Any
 
+from prometheus_client import Counter, Gauge, Histogram
 from redis import asyncio as redis_asyncio
 
+from rop.infrastructure.messaging.event_stream import event_channel
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
+
 logger = logging.getLogger(__name__)
 
+EVENT_DELIVERY_LATENCY = Histogram(
+    "ws_event_delivery_latency_seconds",
+    "Time from an event's occurred_at until it is queued to local websocket clients",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+FANOUT_SUBSCRIBED_CHANNELS = Gauge(
+    "redis_fanout_subscribed_channels",
+    "Restaurant event channels this replica is subscribed to",
+)
+
+FANOUT_DROPPED_EVENTS = Counter(
+    "redis_fanout_dropped_events_total",
+    "Events dropped because a restaurant's dispatch queue was full",
+)
+
+_EVENT_PATTERN = "events:*"
+
+# A restaurant's dispatch worker exits after this long without events.
+_WORKER_IDLE_SECONDS = 60.0
+
 
 def _decode_value(value: bytes | str | None) -> str | None:
     if value is None:
@@ -18,63 +44,226 @@ def _decode_value(value: bytes | str | None) -> str | None:
     return value
 
 
+def _subscribe_mode() -> str:
+    """``exact`` follows local interest per restaurant; ``pattern`` takes every event."""
+    return os.getenv("REDIS_FANOUT_SUBSCRIBE", "exact").lower()
+
+
+def _dispatch_queue_size() -> int:
+    return max(1, int(os.getenv("REDIS_FANOUT_QUEUE_SIZE", "1024")))
+
+
+_OCCURRED_AT = '"occurred_at":"'
+
+
+def _occurred_at(payload: str) -> datetime | None:
+    """An event's ``occurred_at``, read without decoding the whole JSON.
+
+    Events are published compact with ``occurred_at`` at the top level, and a quote inside
+    a string value is escaped, so the first match is the event's own.
+    """
+    start = payload.find(_OCCURRED_AT)
+    if start < 0:
+        return None
+    start += len(_OCCURRED_AT)
+    try:
+        return datetime.fromisoformat(payload[start : payload.find('"', start)])
+    except ValueError:
+        return None
+
+
+def _observe_delivery_latency(payload: str) -> None:
+    occurred_at = _occurred_at(payload)
+    if occurred_at is None:
+        return
+    EVENT_DELIVERY_LATENCY.observe(
+        max(0.0, (datetime.now(timezone.utc) - occurred_at).total_seconds())
+    )
+
+
+class EventDispatcher:
+    """Hands events to one worker per restaurant.
+
+    Events for a restaurant are broadcast in arrival order, while restaurants are served
+    concurrently so one busy restaurant never delays another's displays. Each restaurant's
+    queue is bounded; when its worker falls that far behind, events are counted and
+    dropped, and clients notice the jump in ``seq`` and resume from the event stream.
+    """
+
+    def __init__(self, app_state: Any, queue_size: int | None = None) -> None:
+        self._app_state = app_state
+        self._queue_size = queue_size or _dispatch_queue_size()
+        self._queues: dict[str, asyncio.Queue[str]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+
+    def dispatch(self, restaurant_id: str, payload: str) -> None:
+        queue = self._queues.get(restaurant_id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self._queue_size)
+            self._queues[restaurant_id] = queue
+            self._workers[restaurant_id] = asyncio.create_task(self._run(restaurant_id, queue))
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            FANOUT_DROPPED_EVENTS.inc()
+            logger.warning("redis_fanout_event_dropped", extra={"restaurant_id": restaurant_id})
+
+    async def _run(self, restaurant_id: str, queue: asyncio.Queue[str]) -> None:
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=_WORKER_IDLE_SECONDS)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    del self._queues[restaurant_id]
+                    del self._workers[restaurant_id]
+                    return
+                continue
+            await self._deliver(restaurant_id, payload)
+
+    async def _deliver(self, restaurant_id: str, payload: str) -> None:
+        """Hand an event to every local sink; one failing sink never starves the others."""
+        try:
+            await self._app_state.ws_manager.broadcast(
+                restaurant_id=restaurant_id,
+                message_json_str=payload,
+            )
+        except Exception:
+            logger.exception(
+                "redis_fanout_dispatch_failed",
+                extra={"restaurant_id": restaurant_id, "sink": "websocket"},
+            )
+        else:
+            _observe_delivery_latency(payload)
+
+        for sink, deliver in (
+            ("long_poll", lambda: self._app_state.kitchen_changes.notify(restaurant_id)),
+            ("sse", lambda: self._app_state.sse_hub.publish(restaurant_id, payload)),
+        ):
+            try:
+                deliver()
+            except Exception:
+                logger.exception(
+                    "redis_fanout_dispatch_failed",
+                    extra={"restaurant_id": restaurant_id, "sink": sink},
+                )
+
+    async def close(self) -> None:
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues.clear()
+        self._workers.clear()
+
+
+async def _sync_channels(
+    pubsub: redis_asyncio.client.PubSub,
+    subscriptions: FanoutSubscriptions,
+    ready: asyncio.Event,
+) -> None:
+    """Keep exact channel subscriptions equal to the restaurants held locally."""
+    current: set[str] = set()
+    while True:
+        desired = {event_channel(restaurant_id) for restaurant_id in subscriptions.restaurants()}
+        added = desired - current
+        removed = current - desired
+        # Subscribe before unsubscribing so the listener never sees an empty channel set
+        # in the middle of a swap.
+        if added:
+            await pubsub.subscribe(*sorted(added))
+        if removed:
+            await pubsub.unsubscribe(*sorted(removed))
+        current = desired
+        FANOUT_SUBSCRIBED_CHANNELS.set(len(current))
+        subscriptions.set_subscribed({channel.partition(":")[2] for channel in current})
+        if current:
+            ready.set()
+        else:
+            ready.clear()
+        await subscriptions.wait_changed()
+
+
+async def _listen(
+    pubsub: redis_asyncio.client.PubSub,
+    dispatcher: EventDispatcher,
+    ready: asyncio.Event,
+) -> None:
+    while True:
+        # listen() returns as soon as the connection has no subscriptions left.
+        await ready.wait()
+        async for message in pubsub.listen():
+            if message.get("type") not in {"message", "pmessage"}:
+                continue
+            channel = _decode_value(message.get("channel"))
+            payload = _decode_value(message.get("data"))
+            if not channel or not payload:
+                continue
+
+            _, _, restaurant_id = channel.partition(":")
+            if not restaurant_id:
+                logger.warning("redis_fanout_invalid_channel", extra={"channel": channel})
+                continue
+            dispatcher.dispatch(restaurant_id, payload)
+
+
 async def start_redis_fanout(app_state: Any) -> None:
     redis_url = os.getenv("REDIS_URL")
     if not redis_url:
         logger.warning("redis_fanout_not_started", extra={"reason": "REDIS_URL missing"})
         return
 
+    subscriptions: FanoutSubscriptions = app_state.fanout_subscriptions
+    mode = _subscribe_mode()
+    dispatcher = EventDispatcher(app_state)
     backoff_seconds = 1.0
-    while True:
-        client: redis_asyncio.Redis | None = None
-        pubsub: redis_asyncio.client.PubSub | None = None
-        try:
-            client = redis_asyncio.from_url(redis_url)
-            pubsub = client.pubsub()
-            await pubsub.psubscribe("events:*")
-            logger.info("redis_fanout_subscribed", extra={"pattern": "events:*"})
-            backoff_seconds = 1.0
-
-            while True:
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message is None:
-                    await asyncio.sleep(0.05)
-                    continue
-
-                channel = _decode_value(message.get("channel"))
-                payload = _decode_value(message.get("data"))
-                if not channel or not payload:
-                    continue
-
-                _, _, restaurant_id = channel.partition(":")
-                if not restaurant_id:
-                    logger.warning("redis_fanout_invalid_channel", extra={"channel": channel})
-                    continue
-
-                await app_state.ws_manager.broadcast(
-                    restaurant_id=restaurant_id,
-                    message_json_str=payload,
-                )
-        except asyncio.CancelledError:
-            logger.info("redis_fanout_cancelled")
-            raise
-        except Exception:
-            logger.exception(
-                "redis_fanout_error",
-                extra={"backoff_seconds": backoff_seconds},
-            )
-            await asyncio.sleep(backoff_seconds)
-            backoff_seconds = min(backoff_seconds * 2, 5.0)
-        finally:
-            if pubsub is not None:
-                pubsub_aclose = getattr(pubsub, "aclose", None)
-                if callable(pubsub_aclose):
-                    await pubsub_aclose()
+    try:
+        while True:
+            client: redis_asyncio.Redis | None = None
+            pubsub: redis_asyncio.client.PubSub | None = None
+            tasks: list[asyncio.Task[None]] = []
+            try:
+                client = redis_asyncio.from_url(redis_url)
+                pubsub = client.pubsub()
+                ready = asyncio.Event()
+                if mode == "pattern":
+                    await pubsub.psubscribe(_EVENT_PATTERN)
+                    subscriptions.set_subscribed(None)
+                    ready.set()
                 else:
-                    await pubsub.close()
-            if client is not None:
-                client_aclose = getattr(client, "aclose", None)
-                if callable(client_aclose):
-                    await client_aclose()
-                else:
-                    await client.close()
+                    tasks.append(asyncio.create_task(_sync_channels(pubsub, subscriptions, ready)))
+                logger.info("redis_fanout_subscribed", extra={"mode": mode})
+                backoff_seconds = 1.0
+
+                tasks.append(asyncio.create_task(_listen(pubsub, dispatcher, ready)))
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            except asyncio.CancelledError:
+                logger.info("redis_fanout_cancelled")
+                raise
+            except Exception:
+                logger.exception(
+                    "redis_fanout_error",
+                    extra={"backoff_seconds": backoff_seconds},
+                )
+                await asyncio.sleep(backoff_seconds)
+                backoff_seconds = min(backoff_seconds * 2, 5.0)
+            finally:
+                subscriptions.set_subscribed(set())
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if pubsub is not None:
+                    pubsub_aclose = getattr(pubsub, "aclose", None)
+                    if callable(pubsub_aclose):
+                        await pubsub_aclose()
+                    else:
+                        await pubsub.close()
+                if client is not None:
+                    client_aclose = getattr(client, "aclose", None)
+                    if callable(client_aclose):
+                        await client_aclose()
+                    else:
+                        await client.close()
+    finally:
+        await dispatcher.close()
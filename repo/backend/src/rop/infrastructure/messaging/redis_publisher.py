@@ -5,9 +5,26 @@ import logging
 from typing import Any
 
 from rop.infrastructure.cache.redis_client import get_redis_client
+from rop.infrastructure.messaging.event_stream import (
+    event_channel,
+    event_seq_key,
+    event_stream_key,
+    event_stream_maxlen,
+)
 
 logger = logging.getLogger(__name__)
 
+# KEYS: seq, stream. ARGV: channel, stream max length, non-empty JSON object payload.
+# Stamps the payload with the next sequence, appends it to the capped stream under the
+# entry id "<seq>-0" and publishes it, all atomically so stream and live order agree.
+_PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local message = '{"seq":' .. seq .. ',' .. string.sub(ARGV[3], 2)
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], seq .. '-0', 'data', message)
+redis.call('PUBLISH', ARGV[1], message)
+return seq
+"""
+
 
 class RedisEventPublisher:
     def __init__(self, timeout_seconds: float = 1.0) -> None:
@@ -19,5 +36,18 @@ class RedisEventPublisher:
         except Exception:
             logger.exception("redis_publish_failed", extra={"channel": channel})
 
-    def publish_json(self, restaurant_id: str, payload: dict[str, Any]) -> None:
-        self.publish(f"events:{restaurant_id}", json.dumps(payload))
+    def publish_json(self, restaurant_id: str, payload: dict[str, Any]) -> int | None:
+        """Publish an event for websocket fanout and replay, returning its sequence."""
+        channel = event_channel(restaurant_id)
+        try:
+            script = get_redis_client(timeout_seconds=self._timeout_seconds).register_script(
+                _PUBLISH_SCRIPT
+            )
+            seq = script(
+                keys=[event_seq_key(restaurant_id), event_stream_key(restaurant_id)],
+                args=[channel, event_stream_maxlen(), json.dumps(payload, separators=(",", ":"))],
+            )
+        except Exception:
+            logger.exception("redis_publish_failed", extra={"channel": channel})
+            return None
+        return int(seq)
@@ -1,17 +1,40 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
+import random
 import sys
+from collections.abc import Callable
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from opentelemetry import trace
+from prometheus_client import Counter, Gauge
 
 from rop.api.middleware.request_id import get_request_id
 
 _LOGGING_CONFIGURED = False
+_listener: QueueListener | None = None
+
+ACCESS_LOGGER = "rop.api.access"
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records not written, because access logs were sampled out or the queue was full",
+    ["reason"],
+)
+LOG_QUEUE_BACKLOG = Gauge(
+    "log_queue_backlog_records",
+    "Log records waiting for the background writer",
+)
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
 
 
 def _trace_fields() -> tuple[str | None, str | None]:
@@ -25,32 +48,127 @@ def _trace_fields() -> tuple[str | None, str | None]:
     )
 
 
+def _capture_context(record: logging.LogRecord) -> None:
+    """Copy the request id and trace ids onto ``record`` while their contextvars are live."""
+    record.request_id = get_request_id()
+    record.trace_id, record.span_id = _trace_fields()
+
+
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        trace_id, span_id = _trace_fields()
+        if not hasattr(record, "trace_id"):
+            _capture_context(record)
         payload: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "request_id": get_request_id(),
-            "trace_id": trace_id,
-            "span_id": span_id,
+            "request_id": getattr(record, "request_id", None),
+            "trace_id": getattr(record, "trace_id", None),
+            "span_id": getattr(record, "span_id", None),
         }
 
-        for key in ("method", "path", "status_code", "duration_ms"):
+        for key in (
+            "method",
+            "path",
+            "status_code",
+            "duration_ms",
+            "db_statements",
+            "db_duration_ms",
+        ):
             value = getattr(record, key, None)
             if value is not None:
                 payload[key] = value
 
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
 
         return json.dumps(payload, default=str)
 
 
+class ContextQueueHandler(QueueHandler):
+    """Hand records to a background writer without formatting them on the caller.
+
+    Only what depends on the caller's context is resolved here: the message arguments,
+    the traceback, the request id and the trace ids. As in ``QueueHandler.prepare`` the
+    queued record is a copy whose traceback is rendered to ``exc_text`` and whose
+    ``exc_info`` is cleared, so it does not keep the exception and its frames alive and
+    other handlers still see the original. JSON encoding and the write to stdout happen
+    on the listener thread. When the queue is full the record is counted and dropped
+    rather than blocking the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        _capture_context(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+        record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
+
+
+class AccessLogSampler(logging.Filter):
+    """Keep a fraction of routine access logs; errors and slow requests are always kept."""
+
+    def __init__(
+        self,
+        success_rate: float,
+        client_error_rate: float,
+        slow_ms: float,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        super().__init__()
+        self._success_rate = success_rate
+        self._client_error_rate = client_error_rate
+        self._slow_ms = slow_ms
+        self._rng = rng
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        status_code = getattr(record, "status_code", None) or 0
+        duration_ms = getattr(record, "duration_ms", None) or 0.0
+        if record.levelno >= logging.WARNING or status_code >= 500 or duration_ms >= self._slow_ms:
+            return True
+        rate = self._client_error_rate if status_code >= 400 else self._success_rate
+        if rate >= 1.0 or self._rng() < rate:
+            return True
+        LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+        return False
+
+
+def _sample_rate(name: str) -> float:
+    return min(1.0, max(0.0, float(os.getenv(name, "1.0"))))
+
+
+def _access_log_sampler() -> AccessLogSampler:
+    return AccessLogSampler(
+        success_rate=_sample_rate("LOG_ACCESS_SAMPLE_RATE"),
+        client_error_rate=_sample_rate("LOG_ACCESS_CLIENT_ERROR_SAMPLE_RATE"),
+        slow_ms=float(os.getenv("LOG_ACCESS_SLOW_MS", "500")),
+    )
+
+
+def _queue_size() -> int:
+    return max(1, int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+
+
 def configure_logging() -> None:
-    global _LOGGING_CONFIGURED
+    global _LOGGING_CONFIGURED, _listener
     if _LOGGING_CONFIGURED:
         return
 
@@ -60,7 +178,14 @@ def configure_logging() -> None:
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(JsonFormatter())
-    root_logger.addHandler(handler)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=_queue_size())
+    LOG_QUEUE_BACKLOG.set_function(log_queue.qsize)
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(_stop_listener)
+
+    root_logger.addHandler(ContextQueueHandler(log_queue))
     root_logger.setLevel(level)
+    logging.getLogger(ACCESS_LOGGER).addFilter(_access_log_sampler())
 
     _LOGGING_CONFIGURED = True
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from decimal import Decimal
 
 from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
+from rop.infrastructure.cache.catalog_version import RedisCatalogVersions
 from rop.infrastructure.db.models import (
     CategoryModel,
     LocationModel,
@@ -31,6 +33,25 @@ def _upsert(session: Session, model, record_id: str, **values):
     return instance
 
 
+def seed_restaurants(restaurant_ids: Iterable[str]) -> None:
+    """Upsert bare active restaurants, for benchmarks that connect with their own ids."""
+    now = _utcnow()
+    with Session(get_engine(timeout_seconds=2.0)) as session:
+        for restaurant_id in restaurant_ids:
+            _upsert(
+                session,
+                RestaurantModel,
+                restaurant_id,
+                slug=restaurant_id,
+                name=restaurant_id,
+                status="active",
+                created_at=now,
+                updated_at=now,
+                deleted_at=None,
+            )
+        session.commit()
+
+
 def main() -> None:
     engine = get_engine(timeout_seconds=2.0)
     inspector = inspect(engine)
@@ -171,6 +192,7 @@ def main() -> None:
             currency="USD",
             is_active=True,
             is_available=True,
+            station="cold",
             created_at=now,
             updated_at=now,
             deleted_at=None,
@@ -188,6 +210,7 @@ def main() -> None:
             currency="USD",
             is_active=True,
             is_available=True,
+            station="grill",
             created_at=now,
             updated_at=now,
             deleted_at=None,
@@ -205,13 +228,17 @@ def main() -> None:
             currency="USD",
             is_active=True,
             is_available=True,
+            station=None,
             created_at=now,
             updated_at=now,
             deleted_at=None,
         )
 
         session.commit()
-        print("seed complete")
+
+    # Stations changed underneath any compiled routing tables, so have replicas recompile.
+    RedisCatalogVersions().bump("rst_001")
+    print("seed complete")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from collections.abc import Callable
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 from typing import Iterator
 
@@ -15,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 from rop.api.main import app
 from rop.infrastructure.cache import redis_client
 from rop.infrastructure.db import session as db_session
+from rop.infrastructure.db.query_stats import QueryStats, capture_queries
 from rop.tools import seed
 
 BACKEND_DIR = Path(__file__).resolve().parents[2]
@@ -85,3 +88,25 @@ def reset_state() -> Iterator[None]:
 def client() -> Iterator[TestClient]:
     with TestClient(app) as test_client:
         yield test_client
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., AbstractContextManager[QueryStats]]:
+    """``with query_budget(n):`` fails if the block runs more than ``n`` SQL statements.
+
+    Running the same statement more than ``max_repeats`` times fails too, since that is how
+    a per-row lookup (an N+1 loop) shows up.
+    """
+
+    @contextmanager
+    def budget(max_statements: int, max_repeats: int = 1) -> Iterator[QueryStats]:
+        with capture_queries() as queries:
+            yield queries
+        assert queries.statements <= max_statements, (
+            f"{queries.statements} statements ran, budget is {max_statements}: "
+            f"{list(queries.by_statement)}"
+        )
+        repeated = queries.repeated(max_repeats + 1)
+        assert not repeated, f"statements repeated more than {max_repeats} times: {repeated}"
+
+    return budget
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+
+def test_public_catalog_groups_available_items_by_category(client) -> None:
+    response = client.get("/v1/restaurants/rst_001/catalog")
+
+    assert response.status_code == 200
+    body = response.json()
+    items_by_category = {
+        category["id"]: sorted(item["id"] for item in category["items"])
+        for category in body["categories"]
+    }
+    assert items_by_category == {"cat_001": ["itm_001"], "cat_002": ["itm_002", "itm_003"]}
+
+
+def test_public_catalog_for_unknown_restaurant_is_not_found(client) -> None:
+    response = client.get("/v1/restaurants/rst_missing/catalog")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "RESTAURANT_NOT_FOUND"
@@ -60,3 +60,50 @@ def test_invalid_workflow_transition_is_rejected(client) -> None:
     invalid_ready = client.post(f"/v1/orders/{order_id}/ready")
     assert invalid_ready.status_code == 409
     assert invalid_ready.json()["error"]["code"] == "INVALID_ORDER_TRANSITION"
+
+
+def test_prep_time_stats_and_etas(client, monkeypatch) -> None:
+    monkeypatch.setenv("KITCHEN_DEFAULT_PREP_SECONDS", "300")
+    monkeypatch.setenv("KITCHEN_PARALLEL_TICKETS", "1")
+    session_response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    session_id = session_response.json()["id"]
+    order_ids = [
+        client.post(
+            "/v1/orders",
+            json={
+                "restaurant_id": "rst_001",
+                "session_id": session_id,
+                "lines": [{"menu_item_id": "itm_001", "quantity": 1}],
+            },
+        ).json()["id"]
+        for _ in range(2)
+    ]
+
+    queue = client.get("/v1/restaurants/rst_001/kitchen/orders")
+    assert [order["eta_seconds"] for order in queue.json()["orders"]] == [300, 600]
+    assert client.get(f"/v1/orders/{order_ids[1]}").json()["eta_seconds"] == 600
+
+    first_id = order_ids[0]
+    for action in ("accept", "ready", "served"):
+        assert client.post(f"/v1/orders/{first_id}/{action}").status_code == 200
+
+    stats = client.get("/v1/restaurants/rst_001/kitchen/prep-stats?menu_item_id=itm_001")
+    assert stats.status_code == 200
+    samples = {
+        (entry["metric"], entry["scope"]): entry["samples"] for entry in stats.json()["stats"]
+    }
+    assert samples == {
+        ("accept_to_ready", "restaurant"): 1,
+        ("accept_to_ready", "item:itm_001"): 1,
+        ("ready_to_served", "restaurant"): 1,
+        ("ready_to_served", "item:itm_001"): 1,
+    }
+    assert client.get(f"/v1/orders/{first_id}").json()["eta_seconds"] is None
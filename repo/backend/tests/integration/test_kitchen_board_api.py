@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+
+from rop.infrastructure.cache import redis_client
+from rop.infrastructure.cache.kitchen_board import RedisKitchenBoard
+
+
+def _create_pickup_order(client, notes: str | None = None) -> str:
+    session_response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    assert session_response.status_code == 201
+    response = client.post(
+        "/v1/orders",
+        json={
+            "restaurant_id": "rst_001",
+            "session_id": session_response.json()["id"],
+            "lines": [{"menu_item_id": "itm_001", "quantity": 1}],
+            "notes": notes,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_kitchen_queue_is_served_from_board_and_follows_transitions(client) -> None:
+    first_id = _create_pickup_order(client)
+    second_id = _create_pickup_order(client)
+
+    queue = client.get("/v1/restaurants/rst_001/kitchen/orders")
+    assert queue.status_code == 200
+    assert [order["id"] for order in queue.json()["orders"]] == [first_id, second_id]
+    assert redis_client.get_redis_client().exists("kitchen:rst_001:built")
+
+    assert client.post(f"/v1/orders/{first_id}/accept").status_code == 200
+    assert client.patch(f"/v1/orders/{second_id}", json={"notes": "no salt"}).status_code == 200
+
+    accepted = client.get("/v1/restaurants/rst_001/kitchen/orders?status=accepted")
+    assert [order["id"] for order in accepted.json()["orders"]] == [first_id]
+    pending = client.get("/v1/restaurants/rst_001/kitchen/orders?status=pending")
+    assert [order["notes"] for order in pending.json()["orders"]] == ["no salt"]
+
+    assert client.post(f"/v1/orders/{first_id}/ready").status_code == 200
+    assert client.post(f"/v1/orders/{first_id}/served").status_code == 200
+    assert client.delete(f"/v1/orders/{second_id}").status_code == 200
+
+    queue = client.get("/v1/restaurants/rst_001/kitchen/orders")
+    assert queue.json()["orders"] == []
+
+    consistency = client.get("/v1/restaurants/rst_001/kitchen/board/consistency")
+    assert consistency.status_code == 200
+    assert consistency.json()["consistent"] is True
+
+
+def test_consistency_check_reports_drift_and_rebuild_repairs_it(client) -> None:
+    order_id = _create_pickup_order(client)
+    client.get("/v1/restaurants/rst_001/kitchen/orders")
+
+    redis_client.get_redis_client().zrem("kitchen:rst_001:q:pending", order_id)
+
+    drifted = client.get("/v1/restaurants/rst_001/kitchen/board/consistency")
+    assert drifted.json()["consistent"] is False
+    assert drifted.json()["mismatches"] == [
+        {"order_id": order_id, "database_status": "pending", "board_status": None}
+    ]
+
+    rebuilt = client.post("/v1/restaurants/rst_001/kitchen/board/rebuild")
+    assert rebuilt.status_code == 200
+    assert rebuilt.json() == {"restaurant_id": "rst_001", "tickets": 1}
+
+    repaired = client.get("/v1/restaurants/rst_001/kitchen/board/consistency")
+    assert repaired.json()["consistent"] is True
+
+
+def test_rebuild_keeps_events_applied_after_the_database_read(client) -> None:
+    first_id = _create_pickup_order(client)
+    second_id = _create_pickup_order(client)
+    client.get("/v1/restaurants/rst_001/kitchen/orders")
+    board = RedisKitchenBoard()
+
+    # The snapshot a rebuild read from the database, before two events were applied.
+    since = board.seq("rst_001")
+    snapshot = [board.ticket("rst_001", first_id), board.ticket("rst_001", second_id)]
+    assert client.post(f"/v1/orders/{first_id}/accept").status_code == 200
+    assert client.delete(f"/v1/orders/{second_id}").status_code == 200
+
+    assert board.rebuild("rst_001", [ticket for ticket in snapshot if ticket], since) == 1
+    assert board.statuses("rst_001") == {first_id: "accepted"}
+
+
+def test_changes_endpoint_returns_only_tickets_changed_since_cursor(client) -> None:
+    first_id = _create_pickup_order(client)
+
+    snapshot = client.get("/v1/restaurants/rst_001/kitchen/orders/changes")
+    assert snapshot.status_code == 200
+    assert snapshot.json()["reset"] is True
+    assert [order["id"] for order in snapshot.json()["orders"]] == [first_id]
+    cursor = snapshot.json()["cursor"]
+
+    unchanged = client.get(f"/v1/restaurants/rst_001/kitchen/orders/changes?since={cursor}")
+    assert unchanged.json() == {"cursor": cursor, "reset": False, "orders": [], "removed": []}
+
+    second_id = _create_pickup_order(client)
+    assert client.post(f"/v1/orders/{first_id}/accept").status_code == 200
+    assert client.post(f"/v1/orders/{first_id}/ready").status_code == 200
+    assert client.post(f"/v1/orders/{first_id}/served").status_code == 200
+
+    delta = client.get(f"/v1/restaurants/rst_001/kitchen/orders/changes?since={cursor}")
+    assert delta.json()["reset"] is False
+    assert [order["id"] for order in delta.json()["orders"]] == [second_id]
+    assert delta.json()["removed"] == [first_id]
+    assert int(delta.json()["cursor"]) > int(cursor)
+
+
+def test_changes_endpoint_long_polls_until_an_order_event_arrives(client) -> None:
+    snapshot = client.get("/v1/restaurants/rst_001/kitchen/orders/changes")
+    cursor = snapshot.json()["cursor"]
+    result: dict[str, httpx.Response] = {}
+
+    def _long_poll() -> None:
+        result["response"] = client.get(
+            f"/v1/restaurants/rst_001/kitchen/orders/changes?since={cursor}&wait=10s"
+        )
+
+    poller = threading.Thread(target=_long_poll, daemon=True)
+    poller.start()
+    time.sleep(0.2)
+    order_id = _create_pickup_order(client)
+
+    poller.join(timeout=5.0)
+    assert not poller.is_alive(), "long poll did not wake up on the order event"
+    response = result["response"]
+    assert [order["id"] for order in response.json()["orders"]] == [order_id]
+
+
+def test_changes_endpoint_rejects_malformed_cursor_and_wait(client) -> None:
+    bad_cursor = client.get("/v1/restaurants/rst_001/kitchen/orders/changes?since=abc")
+    assert bad_cursor.status_code == 400
+    assert bad_cursor.json()["error"]["code"] == "INVALID_CURSOR"
+
+    bad_wait = client.get("/v1/restaurants/rst_001/kitchen/orders/changes?wait=soon")
+    assert bad_wait.status_code == 400
+    assert bad_wait.json()["error"]["code"] == "INVALID_WAIT"
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import threading
+
+
+def _create_pickup_order(client, lines: list[dict]) -> dict:
+    session_response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    assert session_response.status_code == 201
+    response = client.post(
+        "/v1/orders",
+        json={
+            "restaurant_id": "rst_001",
+            "session_id": session_response.json()["id"],
+            "lines": lines,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_order_lines_are_routed_into_station_queues(client) -> None:
+    order = _create_pickup_order(
+        client,
+        [
+            {"menu_item_id": "itm_001", "quantity": 1},
+            {"menu_item_id": "itm_002", "quantity": 2},
+            {"menu_item_id": "itm_003", "quantity": 1},
+        ],
+    )
+    assert {line["menu_item_id"]: line["station"] for line in order["lines"]} == {
+        "itm_001": "cold",
+        "itm_002": "grill",
+        "itm_003": "general",
+    }
+
+    grill = client.get("/v1/restaurants/rst_001/kitchen/stations/grill/orders")
+    assert grill.status_code == 200
+    body = grill.json()
+    assert body["station"] == "grill"
+    assert [entry["id"] for entry in body["orders"]] == [order["id"]]
+    entry = body["orders"][0]
+    assert entry["stations"] == ["cold", "general", "grill"]
+    assert [(line["menu_item_id"], line["quantity"]) for line in entry["lines"]] == [("itm_002", 2)]
+
+    queue = client.get("/v1/restaurants/rst_001/kitchen/orders").json()
+    assert len(queue["orders"][0]["lines"]) == 3
+
+    cold_only = _create_pickup_order(client, [{"menu_item_id": "itm_001", "quantity": 1}])
+    grill_ids = [
+        entry["id"]
+        for entry in client.get("/v1/restaurants/rst_001/kitchen/stations/grill/orders").json()[
+            "orders"
+        ]
+    ]
+    assert cold_only["id"] not in grill_ids
+
+    assert client.post(f"/v1/orders/{order['id']}/accept").status_code == 200
+    assert client.post(f"/v1/orders/{order['id']}/ready").status_code == 200
+    accepted = client.get(
+        "/v1/restaurants/rst_001/kitchen/stations/grill/orders",
+        params={"status": "ACCEPTED"},
+    )
+    assert accepted.json()["orders"] == []
+    ready = client.get(
+        "/v1/restaurants/rst_001/kitchen/stations/grill/orders",
+        params={"status": "READY"},
+    )
+    assert [entry["id"] for entry in ready.json()["orders"]] == [order["id"]]
+
+    rebuilt = client.post("/v1/restaurants/rst_001/kitchen/board/rebuild")
+    assert rebuilt.status_code == 200
+    cold = client.get("/v1/restaurants/rst_001/kitchen/stations/cold/orders").json()
+    assert [entry["id"] for entry in cold["orders"]] == [order["id"], cold_only["id"]]
+
+
+def test_menu_item_station_changes_reroute_new_orders(client) -> None:
+    first = _create_pickup_order(client, [{"menu_item_id": "itm_003", "quantity": 1}])
+    assert first["lines"][0]["station"] == "general"
+
+    response = client.patch("/v1/admin/menu-items/itm_003", json={"station": " Oven "})
+    assert response.status_code == 200
+    assert response.json()["station"] == "oven"
+
+    second = _create_pickup_order(client, [{"menu_item_id": "itm_003", "quantity": 1}])
+    assert second["lines"][0]["station"] == "oven"
+    oven = client.get("/v1/restaurants/rst_001/kitchen/stations/oven/orders").json()
+    assert [entry["id"] for entry in oven["orders"]] == [second["id"]]
+
+    invalid = client.patch("/v1/admin/menu-items/itm_003", json={"station": "hot:line"})
+    assert invalid.status_code == 400
+    assert invalid.json()["error"]["code"] == "INVALID_STATION"
+
+
+def test_websocket_station_filter_skips_other_stations(client) -> None:
+    with client.websocket_connect("/ws?restaurant_id=rst_001&role=KITCHEN&station=cold") as ws:
+        message_holder: dict[str, str] = {}
+
+        def _receive_message() -> None:
+            message_holder["text"] = ws.receive_text()
+
+        receiver = threading.Thread(target=_receive_message, daemon=True)
+        receiver.start()
+
+        _create_pickup_order(client, [{"menu_item_id": "itm_002", "quantity": 1}])
+        cold_order = _create_pickup_order(client, [{"menu_item_id": "itm_001", "quantity": 1}])
+
+        receiver.join(timeout=2.0)
+        assert not receiver.is_alive(), "timed out waiting for websocket event"
+        payload = json.loads(message_holder["text"])
+        assert payload["order_id"] == cold_order["id"]
+        assert payload["stations"] == ["cold"]
+
+
+def test_prep_summary_aggregates_open_tickets_and_pushes_deltas(client) -> None:
+    first = _create_pickup_order(
+        client,
+        [
+            {"menu_item_id": "itm_002", "quantity": 2},
+            {"menu_item_id": "itm_001", "quantity": 1, "notes": "no bread"},
+        ],
+    )
+    _create_pickup_order(client, [{"menu_item_id": "itm_002", "quantity": 3}])
+
+    summary = client.get("/v1/restaurants/rst_001/kitchen/prep-summary")
+    assert summary.status_code == 200
+    assert [
+        (item["menu_item_id"], item["notes"], item["quantity"]) for item in summary.json()["items"]
+    ] == [("itm_002", None, 5), ("itm_001", "no bread", 1)]
+
+    grill = client.get("/v1/restaurants/rst_001/kitchen/prep-summary", params={"station": "grill"})
+    assert [item["menu_item_id"] for item in grill.json()["items"]] == ["itm_002"]
+
+    with client.websocket_connect("/ws?restaurant_id=rst_001&role=KITCHEN&station=grill") as ws:
+        messages: list[dict] = []
+
+        def _receive_messages() -> None:
+            while len(messages) < 3:
+                messages.append(json.loads(ws.receive_text()))
+
+        receiver = threading.Thread(target=_receive_messages, daemon=True)
+        receiver.start()
+
+        assert client.post(f"/v1/orders/{first['id']}/accept").status_code == 200
+        assert client.post(f"/v1/orders/{first['id']}/ready").status_code == 200
+
+        receiver.join(timeout=2.0)
+        assert not receiver.is_alive(), "timed out waiting for websocket events"
+
+    assert [message["event_type"] for message in messages] == [
+        "order.accepted",
+        "order.ready",
+        "kitchen.prep_summary.delta",
+    ]
+    delta = messages[-1]
+    assert delta["stations"] == ["cold", "grill"]
+    grill_item = next(item for item in delta["items"] if item["station"] == "grill")
+    assert grill_item == {
+        "station": "grill",
+        "menu_item_id": "itm_002",
+        "name": "Smash Burger",
+        "notes": None,
+        "quantity_delta": -2,
+        "quantity": 3,
+    }
+
+    rebuilt = client.post("/v1/restaurants/rst_001/kitchen/board/rebuild")
+    assert rebuilt.status_code == 200
+    summary = client.get("/v1/restaurants/rst_001/kitchen/prep-summary")
+    assert [(item["menu_item_id"], item["quantity"]) for item in summary.json()["items"]] == [
+        ("itm_002", 3)
+    ]
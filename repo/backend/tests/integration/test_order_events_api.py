@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+
+def _create_pickup_order(client) -> str:
+    session_response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    assert session_response.status_code == 201
+    response = client.post(
+        "/v1/orders",
+        json={
+            "restaurant_id": "rst_001",
+            "session_id": session_response.json()["id"],
+            "lines": [{"menu_item_id": "itm_002", "quantity": 1}],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_pickup_board_lists_ready_pickup_orders(client) -> None:
+    waiting_id = _create_pickup_order(client)
+    ready_id = _create_pickup_order(client)
+    assert client.post(f"/v1/orders/{ready_id}/accept").status_code == 200
+    assert client.post(f"/v1/orders/{ready_id}/ready").status_code == 200
+
+    response = client.get("/v1/locations/loc_002/pickup-board")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["restaurant_id"] == "rst_001"
+    assert [order["order_id"] for order in body["orders"]] == [ready_id]
+    assert waiting_id not in {order["order_id"] for order in body["orders"]}
+
+    assert client.post(f"/v1/orders/{ready_id}/served").status_code == 200
+    assert client.get("/v1/locations/loc_002/pickup-board").json()["orders"] == []
+
+
+def test_order_event_stream_for_unknown_order_is_not_found(client) -> None:
+    response = client.get("/v1/orders/ord_missing/events")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "ORDER_NOT_FOUND"
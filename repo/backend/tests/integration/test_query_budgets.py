@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+
+def _create_pickup_session(client) -> str:
+    response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_order(client, session_id: str) -> str:
+    response = client.post(
+        "/v1/orders",
+        json={
+            "restaurant_id": "rst_001",
+            "session_id": session_id,
+            "lines": [
+                {"menu_item_id": "itm_001", "quantity": 1},
+                {"menu_item_id": "itm_002", "quantity": 2},
+                {"menu_item_id": "itm_003", "quantity": 1},
+            ],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_order_create_and_read_stay_within_budget(client, query_budget) -> None:
+    session_id = _create_pickup_session(client)
+
+    with query_budget(12):
+        order_id = _create_order(client, session_id)
+    with query_budget(2):
+        response = client.get(f"/v1/orders/{order_id}")
+
+    assert response.status_code == 200
+
+
+def test_kitchen_queue_statements_do_not_grow_with_orders(client, query_budget) -> None:
+    session_id = _create_pickup_session(client)
+    for _ in range(5):
+        _create_order(client, session_id)
+
+    with query_budget(4) as queries:
+        response = client.get("/v1/restaurants/rst_001/kitchen/orders")
+
+    assert response.status_code == 200
+    assert len(response.json()["orders"]) == 5
+    assert queries.repeated() == {}
@@ -3,6 +3,10 @@ from __future__ import annotations
 import json
 import threading
 
+import msgpack  # type: ignore[import-untyped]
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
 
 def test_websocket_receives_order_created_event(client) -> None:
     session_response = client.post(
@@ -46,3 +50,142 @@ def test_websocket_receives_order_created_event(client) -> None:
         payload = json.loads(message_holder["text"])
         assert payload["event_type"] == "order.created"
         assert payload["restaurant_id"] == "rst_001"
+
+
+def test_websocket_topics_can_be_changed_with_control_messages(client) -> None:
+    session_response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    session_id = session_response.json()["id"]
+
+    with client.websocket_connect("/ws?restaurant_id=rst_001&topics=event:order.ready") as ws:
+        ws.send_text(json.dumps({"action": "subscribe", "topics": ["event:order.created"]}))
+        assert json.loads(ws.receive_text()) == {
+            "type": "subscriptions",
+            "topics": ["event:order.created", "event:order.ready"],
+        }
+
+        ws.send_text(json.dumps({"action": "subscribe", "topics": ["kitchen:grill"]}))
+        assert json.loads(ws.receive_text())["code"] == "INVALID_TOPIC"
+
+        response = client.post(
+            "/v1/orders",
+            json={
+                "restaurant_id": "rst_001",
+                "session_id": session_id,
+                "lines": [{"menu_item_id": "itm_001", "quantity": 1}],
+            },
+        )
+        assert response.status_code == 201
+        order_id = response.json()["id"]
+        assert client.post(f"/v1/orders/{order_id}/accept").status_code == 200
+        assert client.post(f"/v1/orders/{order_id}/ready").status_code == 200
+
+        created = json.loads(ws.receive_text())
+        ready = json.loads(ws.receive_text())
+        assert (created["event_type"], ready["event_type"]) == ("order.created", "order.ready")
+
+
+def _open_pickup_session(client) -> str:
+    response = client.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": "rst_001",
+            "location_id": "loc_002",
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_order(client, session_id: str) -> str:
+    response = client.post(
+        "/v1/orders",
+        json={
+            "restaurant_id": "rst_001",
+            "session_id": session_id,
+            "lines": [{"menu_item_id": "itm_001", "quantity": 1}],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_websocket_replays_events_missed_while_disconnected(client) -> None:
+    session_id = _open_pickup_session(client)
+    with client.websocket_connect("/ws?restaurant_id=rst_001&topics=event:order.created") as ws:
+        _create_order(client, session_id)
+        first = json.loads(ws.receive_text())
+    assert isinstance(first["seq"], int)
+
+    missed_ids = [_create_order(client, session_id) for _ in range(2)]
+    query = f"restaurant_id=rst_001&topics=event:order.created&last_event_id={first['seq']}"
+    with client.websocket_connect(f"/ws?{query}") as ws:
+        replayed = [json.loads(ws.receive_text()) for _ in missed_ids]
+        live_id = _create_order(client, session_id)
+        live = json.loads(ws.receive_text())
+
+    assert [event["order_id"] for event in replayed] == missed_ids
+    assert [event["seq"] for event in replayed] == sorted(event["seq"] for event in replayed)
+    assert replayed[0]["seq"] > first["seq"]
+    assert live["order_id"] == live_id
+    assert live["seq"] > replayed[-1]["seq"]
+    # Topic filtered, so each frame names the one sent before it.
+    assert replayed[0]["prev_seq"] == first["seq"]
+    assert live["prev_seq"] == replayed[-1]["seq"]
+
+
+def test_websocket_resume_from_an_unknown_sequence_sends_reset(client) -> None:
+    session_id = _open_pickup_session(client)
+    _create_order(client, session_id)
+    with client.websocket_connect("/ws?restaurant_id=rst_001&last_event_id=999999") as ws:
+        frame = json.loads(ws.receive_text())
+    assert frame["type"] == "reset"
+    assert isinstance(frame["seq"], int)
+
+
+def test_websocket_coalesced_replay_collapses_superseded_status_events(client) -> None:
+    session_id = _open_pickup_session(client)
+    with client.websocket_connect("/ws?restaurant_id=rst_001&topics=event:order.created") as ws:
+        order_id = _create_order(client, session_id)
+        created = json.loads(ws.receive_text())
+    assert client.post(f"/v1/orders/{order_id}/accept").status_code == 200
+    assert client.post(f"/v1/orders/{order_id}/ready").status_code == 200
+
+    query = (
+        f"restaurant_id=rst_001&topics=order:{order_id}"
+        f"&last_event_id={created['seq'] - 1}&coalesce_ms=10"
+    )
+    with client.websocket_connect(f"/ws?{query}") as ws:
+        batch = json.loads(ws.receive_text())
+
+    assert [event["event_type"] for event in batch] == ["order.created", "order.ready"]
+    assert {event["order_id"] for event in batch} == {order_id}
+    assert batch[1]["prev_seq"] == batch[0]["seq"]
+
+
+def test_websocket_rejects_coalesce_window_above_the_limit(client) -> None:
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/ws?restaurant_id=rst_001&coalesce_ms=60000") as ws:
+            ws.receive_text()
+    assert exc_info.value.code == 1008
+
+
+def test_websocket_msgpack_encoding_sends_binary_frames(client) -> None:
+    session_id = _open_pickup_session(client)
+    query = "restaurant_id=rst_001&topics=event:order.created&encoding=msgpack"
+    with client.websocket_connect(f"/ws?{query}") as ws:
+        order_id = _create_order(client, session_id)
+        event = msgpack.unpackb(ws.receive_bytes())
+
+    assert event["event_type"] == "order.created"
+    assert event["order_id"] == order_id
+    assert isinstance(event["seq"], int)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from rop.api.middleware.access_log import AccessLogMiddleware
+from rop.api.middleware.request_id import get_request_id
+from rop.api.routes.metrics import router as metrics_router
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str) -> dict[str, object]:
+        return {"item_id": item_id, "request_id": get_request_id()}
+
+    @app.post("/items")
+    async def create_item(request: Request) -> dict[str, str]:
+        request.state.consistency_token = "0/16B3748"
+        return {"status": "created"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    app.add_middleware(AccessLogMiddleware)
+    return app
+
+
+def _access_records(caplog) -> list[logging.LogRecord]:
+    return [record for record in caplog.records if record.name == "rop.api.access"]
+
+
+def test_request_id_is_echoed_or_generated_and_visible_to_handlers() -> None:
+    client = TestClient(_app())
+
+    response = client.get("/items/itm_001", headers={"X-Request-Id": "req-123"})
+    assert response.headers["X-Request-Id"] == "req-123"
+    assert response.json() == {"item_id": "itm_001", "request_id": "req-123"}
+
+    response = client.get("/items/itm_001")
+    generated = response.headers["X-Request-Id"]
+    assert generated
+    assert response.json()["request_id"] == generated
+    assert get_request_id() is None
+
+
+def test_consistency_token_from_the_handler_is_returned() -> None:
+    client = TestClient(_app())
+
+    assert client.post("/items").headers["X-Consistency-Token"] == "0/16B3748"
+    assert "X-Consistency-Token" not in client.get("/items/itm_001").headers
+
+
+def test_requests_are_logged_once_with_their_status(caplog) -> None:
+    caplog.set_level(logging.INFO, logger="rop.api.access")
+    client = TestClient(_app())
+
+    response = client.get("/stream", headers={"X-Request-Id": "req-stream"})
+
+    assert response.text == "abc"
+    assert response.headers["X-Request-Id"] == "req-stream"
+    [record] = _access_records(caplog)
+    assert record.getMessage() == "request_complete"
+    assert getattr(record, "status_code") == 200
+    assert getattr(record, "path") == "/stream"
+    assert getattr(record, "db_statements") == 0
+
+
+def test_unhandled_errors_are_logged_and_reraised(caplog) -> None:
+    caplog.set_level(logging.INFO, logger="rop.api.access")
+    client = TestClient(_app())
+
+    with pytest.raises(RuntimeError):
+        client.get("/boom")
+
+    [record] = _access_records(caplog)
+    assert record.getMessage() == "request_error"
+    assert getattr(record, "status_code") == 500
+    assert record.exc_info is not None
+
+
+def _requests_total(method: str, route: str, status_code: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "http_requests_total",
+        {"method": method, "route": route, "status_code": status_code},
+    )
+    return value or 0.0
+
+
+def test_metrics_are_labeled_by_route_template() -> None:
+    client = TestClient(_app())
+    matched = _requests_total("GET", "/items/{item_id}", "200")
+    unmatched = _requests_total("GET", "unmatched", "404")
+    other = _requests_total("other", "/items/{item_id}", "405")
+
+    client.get("/items/itm_001")
+    client.get("/items/itm_002")
+    client.get("/no/such/path")
+    client.request("BREW", "/items/itm_001")
+
+    assert _requests_total("GET", "/items/{item_id}", "200") == matched + 2
+    assert _requests_total("GET", "unmatched", "404") == unmatched + 1
+    assert _requests_total("other", "/items/{item_id}", "405") == other + 1
+    assert (
+        REGISTRY.get_sample_value(
+            "http_requests_total",
+            {"method": "GET", "route": "/items/itm_001", "status_code": "200"},
+        )
+        is None
+    )
+
+
+def test_metrics_endpoint_negotiates_openmetrics() -> None:
+    app = FastAPI()
+    app.include_router(metrics_router)
+    client = TestClient(app)
+
+    response = client.get("/metrics", headers={"Accept": "application/openmetrics-text"})
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    assert response.text.endswith("# EOF\n")
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from rop.infrastructure.db.pool import InstrumentedQueuePool, pool_options
+from rop.infrastructure.db.session import _connect_args
+
+
+def _sample(name: str, pool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": pool}) or 0.0
+
+
+def test_pool_options_come_from_the_environment(monkeypatch) -> None:
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_POOL_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT_SECONDS", "2.5")
+    monkeypatch.setenv("DB_POOL_RECYCLE_SECONDS", "900")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+    options = pool_options("postgresql+psycopg://db/rop", "sync")
+
+    assert options == {
+        "pool_pre_ping": False,
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": "sync",
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_timeout": 2.5,
+        "pool_recycle": 900,
+    }
+
+
+def test_checkouts_update_gauges_and_timeouts_are_counted(tmp_path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name="unit",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    timeouts_before = _sample("db_pool_checkout_timeouts_total", "unit")
+
+    connection = engine.connect()
+    assert _sample("db_pool_checked_out_connections", "unit") == 1
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    assert _sample("db_pool_checkout_timeouts_total", "unit") == timeouts_before + 1
+
+    connection.close()
+    assert _sample("db_pool_checked_out_connections", "unit") == 0
+    assert _sample("db_pool_checkout_wait_seconds_count", "unit") >= 2
+    engine.dispose()
+
+
+def test_psycopg_connections_prepare_hot_statements(monkeypatch) -> None:
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+    assert _connect_args("postgresql+psycopg://db/rop", 3) == {
+        "connect_timeout": 3,
+        "prepare_threshold": 2,
+    }
+
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "off")
+    assert _connect_args("postgresql+psycopg://db/rop", 3)["prepare_threshold"] is None
+    assert _connect_args("postgresql+psycopg2://db/rop", 3) == {"connect_timeout": 3}
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import cast
+
+from prometheus_client import REGISTRY
+from redis.asyncio.client import PubSub
+
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
+from rop.infrastructure.messaging.redis_event_listener import (
+    EventDispatcher,
+    _occurred_at,
+    _sync_channels,
+)
+
+
+class RecordingManager:
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.delivered: list[tuple[str, str]] = []
+
+    async def broadcast(self, restaurant_id: str, message_json_str: str) -> None:
+        await asyncio.sleep(self.delays.get(restaurant_id, 0.0))
+        self.delivered.append((restaurant_id, message_json_str))
+
+
+class RecordingNotifier:
+    def __init__(self) -> None:
+        self.notified: list[str] = []
+
+    def notify(self, restaurant_id: str) -> None:
+        self.notified.append(restaurant_id)
+
+
+class RecordingHub:
+    def __init__(self) -> None:
+        self.published: list[str] = []
+
+    def publish(self, restaurant_id: str, message_json_str: str) -> None:
+        self.published.append(restaurant_id)
+
+
+async def test_slow_restaurant_does_not_delay_others_and_order_is_kept() -> None:
+    manager = RecordingManager({"rst_slow": 0.2})
+    state = SimpleNamespace(
+        ws_manager=manager,
+        kitchen_changes=RecordingNotifier(),
+        sse_hub=RecordingHub(),
+    )
+    dispatcher = EventDispatcher(state)
+
+    dispatcher.dispatch("rst_slow", '{"seq": 1}')
+    for seq in range(1, 4):
+        dispatcher.dispatch("rst_fast", f'{{"seq": {seq}}}')
+    await asyncio.sleep(0.05)
+
+    assert manager.delivered == [
+        ("rst_fast", '{"seq": 1}'),
+        ("rst_fast", '{"seq": 2}'),
+        ("rst_fast", '{"seq": 3}'),
+    ]
+    await asyncio.sleep(0.25)
+    assert manager.delivered[-1] == ("rst_slow", '{"seq": 1}')
+    assert state.kitchen_changes.notified.count("rst_fast") == 3
+    await dispatcher.close()
+
+
+class FailingManager:
+    async def broadcast(self, restaurant_id: str, message_json_str: str) -> None:
+        raise RuntimeError("socket gone")
+
+
+async def test_a_failing_broadcast_still_wakes_long_polls_and_sse() -> None:
+    state = SimpleNamespace(
+        ws_manager=FailingManager(),
+        kitchen_changes=RecordingNotifier(),
+        sse_hub=RecordingHub(),
+    )
+    dispatcher = EventDispatcher(state)
+
+    dispatcher.dispatch("rst_001", '{"seq": 1}')
+    dispatcher.dispatch("rst_001", '{"seq": 2}')
+    await asyncio.sleep(0.01)
+
+    assert state.kitchen_changes.notified == ["rst_001", "rst_001"]
+    assert state.sse_hub.published == ["rst_001", "rst_001"]
+    await dispatcher.close()
+
+
+class RecordingPubSub:
+    def __init__(self) -> None:
+        self.channels: set[str] = set()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+
+async def test_channel_subscriptions_follow_local_interest() -> None:
+    subscriptions = FanoutSubscriptions(grace_seconds=0)
+    pubsub = RecordingPubSub()
+    ready = asyncio.Event()
+    syncer = asyncio.create_task(_sync_channels(cast(PubSub, pubsub), subscriptions, ready))
+    try:
+        await asyncio.sleep(0)
+        assert pubsub.channels == set()
+        assert not ready.is_set()
+
+        subscriptions.acquire("rst_001")
+        subscriptions.acquire("rst_002")
+        await asyncio.sleep(0.01)
+        assert pubsub.channels == {"events:rst_001", "events:rst_002"}
+        assert ready.is_set()
+        assert subscriptions.subscribed("rst_001")
+
+        subscriptions.release("rst_001")
+        subscriptions.release("rst_002")
+        await asyncio.sleep(0.01)
+        assert pubsub.channels == set()
+        assert not ready.is_set()
+        assert not subscriptions.subscribed("rst_001")
+    finally:
+        syncer.cancel()
+        await asyncio.gather(syncer, return_exceptions=True)
+
+
+async def test_a_full_restaurant_queue_drops_and_counts_events() -> None:
+    manager = RecordingManager({"rst_001": 60.0})
+    state = SimpleNamespace(
+        ws_manager=manager,
+        kitchen_changes=RecordingNotifier(),
+        sse_hub=RecordingHub(),
+    )
+    dispatcher = EventDispatcher(state, queue_size=2)
+    before = REGISTRY.get_sample_value("redis_fanout_dropped_events_total") or 0.0
+
+    for seq in range(1, 5):
+        dispatcher.dispatch("rst_001", f'{{"seq": {seq}}}')
+        await asyncio.sleep(0)
+
+    assert REGISTRY.get_sample_value("redis_fanout_dropped_events_total") == before + 1
+    await dispatcher.close()
+
+
+def test_occurred_at_is_read_without_decoding_the_event() -> None:
+    payload = json.dumps(
+        {"seq": 3, "notes": '"occurred_at":"x"', "occurred_at": "2026-01-02T03:04:05+00:00"},
+        separators=(",", ":"),
+    )
+
+    assert _occurred_at(payload) == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert _occurred_at('{"seq":3}') is None
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
+
+
+async def test_channel_set_changes_only_on_first_acquire_and_last_release() -> None:
+    subscriptions = FanoutSubscriptions(grace_seconds=0)
+
+    subscriptions.acquire("rst_001")
+    await asyncio.wait_for(subscriptions.wait_changed(), timeout=1)
+    subscriptions.acquire("rst_001")
+    subscriptions.release("rst_001")
+
+    waiter = asyncio.create_task(subscriptions.wait_changed())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert subscriptions.restaurants() == {"rst_001"}
+
+    subscriptions.release("rst_001")
+    await asyncio.wait_for(waiter, timeout=1)
+    assert subscriptions.restaurants() == set()
+
+
+async def test_release_of_unknown_restaurant_is_ignored() -> None:
+    subscriptions = FanoutSubscriptions()
+
+    subscriptions.release("rst_001")
+
+    assert subscriptions.restaurants() == set()
+
+
+async def test_the_last_release_keeps_the_channel_for_the_grace_period() -> None:
+    subscriptions = FanoutSubscriptions(grace_seconds=0.05)
+    subscriptions.acquire("rst_001")
+    await subscriptions.wait_changed()
+
+    subscriptions.release("rst_001")
+    subscriptions.acquire("rst_001")
+    subscriptions.release("rst_001")
+    waiter = asyncio.create_task(subscriptions.wait_changed())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    assert subscriptions.restaurants() == {"rst_001"}
+
+    await asyncio.wait_for(waiter, timeout=1)
+    assert subscriptions.restaurants() == set()
+
+
+async def test_waiters_resume_once_the_listener_subscribes_their_channel() -> None:
+    subscriptions = FanoutSubscriptions(grace_seconds=0)
+    subscriptions.acquire("rst_001")
+
+    assert not await subscriptions.wait_subscribed("rst_001", 0.01)
+    waiter = asyncio.create_task(subscriptions.wait_subscribed("rst_001", 1))
+    await asyncio.sleep(0)
+    subscriptions.set_subscribed({"rst_002"})
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    subscriptions.set_subscribed({"rst_001", "rst_002"})
+    assert await asyncio.wait_for(waiter, timeout=1)
+    subscriptions.set_subscribed(None)
+    assert subscriptions.subscribed("rst_003")
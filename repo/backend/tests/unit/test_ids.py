@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from rop.domain import ids
+from rop.domain.ids import MonotonicIdGenerator, id_timestamp_ms, new_id
+
+
+def test_ids_keep_their_prefix_and_encode_the_creation_time() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    value = new_id("ord")
+    after_ms = time.time_ns() // 1_000_000
+
+    assert value.startswith("ord_")
+    assert len(value) == len("ord_") + 26
+    assert before_ms <= id_timestamp_ms(value) <= after_ms
+
+
+def test_ids_increase_within_a_millisecond_and_when_the_clock_steps_back(monkeypatch) -> None:
+    clock = iter([5_000_000_000_000, 5_000_000_000_000, 4_000_000_000_000, 6_000_000_000_000])
+    monkeypatch.setattr(ids.time, "time_ns", lambda: next(clock))
+    generator = MonotonicIdGenerator()
+
+    values = [generator.new_id("orl") for _ in range(4)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == 4
+    assert [id_timestamp_ms(value) for value in values] == [
+        5_000_000,
+        5_000_000,
+        5_000_000,
+        6_000_000,
+    ]
+
+
+def test_random_ids_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        id_timestamp_ms("ord_0123456789ab")
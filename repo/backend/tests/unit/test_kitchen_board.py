@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+
+from redis.exceptions import WatchError
+
+from rop.infrastructure.cache.kitchen_board import REBUILD_WATCH_ATTEMPTS, RedisKitchenBoard
+
+
+class ContendedPipeline:
+    """A pipeline whose transaction always loses the WATCH race."""
+
+    def __init__(self) -> None:
+        self.executions = 0
+
+    def __enter__(self) -> ContendedPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def get(self, key: str) -> None:
+        return None
+
+    def zrangebyscore(self, *args: object) -> list[bytes]:
+        return []
+
+    def execute(self) -> None:
+        self.executions += 1
+        raise WatchError("seq changed")
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: None
+
+
+class ContendedClient:
+    def __init__(self) -> None:
+        self.pipeline_ = ContendedPipeline()
+        self.scans = 0
+
+    def pipeline(self, transaction: bool = True) -> ContendedPipeline:
+        return self.pipeline_
+
+    def scan_iter(self, match: str) -> list[bytes]:
+        self.scans += 1
+        return []
+
+
+def test_rebuild_gives_up_when_writes_keep_winning_the_watch(monkeypatch) -> None:
+    client = ContendedClient()
+    board = RedisKitchenBoard()
+    monkeypatch.setattr(board, "_client", lambda: client)
+
+    assert board.rebuild("rst_001", [], since=0) is None
+    assert client.pipeline_.executions == REBUILD_WATCH_ATTEMPTS
+    # One scan per key pattern, not one per attempt.
+    assert client.scans == 2
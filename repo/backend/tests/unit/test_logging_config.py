@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import sys
+import threading
+
+from prometheus_client import REGISTRY
+
+from rop.api.middleware.request_id import request_id_context
+from rop.infrastructure.observability.logging_config import (
+    AccessLogSampler,
+    ContextQueueHandler,
+    JsonFormatter,
+)
+
+
+def _record(message: str = "request_complete", level: int = logging.INFO, **extra):
+    record = logging.LogRecord("rop.api.access", level, __file__, 1, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def _dropped(reason: str) -> float:
+    return REGISTRY.get_sample_value("log_records_dropped_total", {"reason": reason}) or 0.0
+
+
+def test_records_are_formatted_off_thread_with_the_callers_context() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = ContextQueueHandler(log_queue)
+    record = logging.LogRecord("rop.test", logging.INFO, __file__, 1, "order %s", ("ord_1",), None)
+
+    token = request_id_context.set("req-123")
+    try:
+        handler.handle(record)
+    finally:
+        request_id_context.reset(token)
+
+    lines: list[str] = []
+    writer = threading.Thread(target=lambda: lines.append(JsonFormatter().format(log_queue.get())))
+    writer.start()
+    writer.join()
+
+    payload = json.loads(lines[0])
+    assert payload["message"] == "order ord_1"
+    assert payload["request_id"] == "req-123"
+    assert payload["logger"] == "rop.test"
+
+
+def test_tracebacks_are_rendered_on_the_caller_and_the_exception_released() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = ContextQueueHandler(log_queue)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "rop.test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+        )
+
+    handler.handle(record)
+    queued = log_queue.get_nowait()
+
+    assert record.exc_info is not None
+    assert queued.exc_info is None
+    assert queued.exc_text is not None
+    assert "RuntimeError: boom" in queued.exc_text
+    assert "RuntimeError: boom" in json.loads(JsonFormatter().format(queued))["exception"]
+
+
+def test_a_full_queue_drops_and_counts_instead_of_blocking() -> None:
+    handler = ContextQueueHandler(queue.Queue(maxsize=1))
+    before = _dropped("queue_full")
+
+    handler.handle(_record())
+    handler.handle(_record())
+
+    assert _dropped("queue_full") == before + 1
+
+
+def test_sampler_always_keeps_errors_and_slow_requests() -> None:
+    sampler = AccessLogSampler(
+        success_rate=0.0, client_error_rate=0.0, slow_ms=500, rng=lambda: 0.5
+    )
+    before = _dropped("sampled")
+
+    assert sampler.filter(_record(status_code=503, duration_ms=3.0))
+    assert sampler.filter(_record("request_error", logging.ERROR, status_code=500))
+    assert sampler.filter(_record(status_code=200, duration_ms=750.0))
+    assert not sampler.filter(_record(status_code=200, duration_ms=3.0))
+    assert not sampler.filter(_record(status_code=404, duration_ms=3.0))
+    assert _dropped("sampled") == before + 2
+
+
+def test_sampler_applies_separate_rates_to_success_and_client_errors() -> None:
+    sampler = AccessLogSampler(
+        success_rate=0.1, client_error_rate=1.0, slow_ms=500, rng=lambda: 0.5
+    )
+
+    assert not sampler.filter(_record(status_code=200, duration_ms=3.0))
+    assert sampler.filter(_record(status_code=404, duration_ms=3.0))
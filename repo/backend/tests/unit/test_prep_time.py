@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+from rop.domain.commerce.enums import OrderStatus
+from rop.domain.kitchen.prep_time import (
+    SKETCH_RELATIVE_ACCURACY,
+    QuantileSketch,
+    estimate_ready_seconds,
+    sketch_bucket,
+)
+
+
+def test_sketch_quantiles_stay_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    samples = sorted(rng.uniform(60, 1800) for _ in range(5000))
+    sketch = QuantileSketch()
+    for sample in samples:
+        sketch.add(sample)
+
+    for q in (0.5, 0.9, 0.99):
+        exact = samples[int(q * (len(samples) - 1))]
+        estimate = sketch.quantile(q)
+        assert estimate is not None
+        assert abs(estimate - exact) / exact <= SKETCH_RELATIVE_ACCURACY * 1.01
+
+
+def test_sketch_merges_bucket_counts() -> None:
+    first = {sketch_bucket(120): 3}
+    second = {sketch_bucket(120): 1, sketch_bucket(600): 4}
+
+    merged = QuantileSketch.from_counts([first, second])
+
+    assert merged.count == 8
+    assert QuantileSketch().quantile(0.5) is None
+    estimate = merged.quantile(0.99)
+    assert estimate is not None and abs(estimate - 600) / 600 <= SKETCH_RELATIVE_ACCURACY
+
+
+def test_ready_estimate_accounts_for_queue_depth_and_progress() -> None:
+    assert (
+        estimate_ready_seconds(status=OrderStatus.READY, prep_seconds=600, parallel_tickets=4) == 0
+    )
+    assert (
+        estimate_ready_seconds(
+            status=OrderStatus.ACCEPTED,
+            prep_seconds=600,
+            parallel_tickets=4,
+            elapsed_seconds=450,
+        )
+        == 150
+    )
+    assert (
+        estimate_ready_seconds(
+            status=OrderStatus.PENDING,
+            prep_seconds=600,
+            parallel_tickets=4,
+            tickets_ahead=9,
+        )
+        == 1800
+    )
+    assert (
+        estimate_ready_seconds(status=OrderStatus.SERVED, prep_seconds=600, parallel_tickets=4)
+        is None
+    )
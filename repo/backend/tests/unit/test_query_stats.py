@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from rop.infrastructure.db.query_stats import (
+    capture_queries,
+    instrument_engine,
+    request_query_stats,
+)
+
+
+def test_statements_are_counted_for_the_request_in_progress() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with request_query_stats() as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+            connection.execute(text("SELECT 1"))
+
+    assert stats.statements == 3
+    assert stats.duration_seconds > 0
+    assert stats.repeated() == {"SELECT 1": 2}
+
+
+def test_capture_sees_uninstrumented_engines_and_survives_failed_statements() -> None:
+    engine = create_engine("sqlite://")
+
+    with capture_queries() as stats, engine.connect() as connection:
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing"))
+        connection.execute(text("SELECT 1"))
+
+    assert stats.statements == 1
+    assert stats.repeated() == {}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from rop.infrastructure.db.consistency import (
+    committed,
+    parse_consistency_token,
+    read_session,
+    track_commits,
+)
+
+
+def _database(session) -> str:
+    return str(session.get_bind().url)
+
+
+def test_only_wal_positions_are_accepted_as_tokens() -> None:
+    assert parse_consistency_token("0/16b3748") == "0/16B3748"
+    assert parse_consistency_token(" 1A/FF ") == "1A/FF"
+    assert parse_consistency_token(None) is None
+    assert parse_consistency_token("") is None
+    assert parse_consistency_token("16B3748") is None
+    assert parse_consistency_token("0/16B3748; DROP TABLE orders") is None
+
+
+def test_reads_use_the_primary_without_replicas(monkeypatch, tmp_path) -> None:
+    primary = f"sqlite:///{tmp_path / 'primary.db'}"
+    monkeypatch.setenv("DATABASE_URL", primary)
+    monkeypatch.delenv("DATABASE_REPLICA_URLS", raising=False)
+
+    session = read_session(None)
+    try:
+        assert _database(session) == primary
+    finally:
+        session.close()
+
+
+def test_reads_go_to_a_replica_unless_it_cannot_prove_it_is_caught_up(
+    monkeypatch,
+    tmp_path,
+) -> None:
+    primary = f"sqlite:///{tmp_path / 'primary.db'}"
+    replica = f"sqlite:///{tmp_path / 'replica.db'}"
+    monkeypatch.setenv("DATABASE_URL", primary)
+    monkeypatch.setenv("DATABASE_REPLICA_URLS", replica)
+
+    session = read_session(None)
+    try:
+        assert _database(session) == replica
+    finally:
+        session.close()
+
+    # SQLite has no WAL position to compare, so a token pins the read to the primary.
+    session = read_session("0/16B3748")
+    try:
+        assert _database(session) == primary
+    finally:
+        session.close()
+
+
+def test_commits_are_tracked_per_session(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.delenv("DATABASE_REPLICA_URLS", raising=False)
+
+    session = read_session(None)
+    track_commits(session)
+    try:
+        session.execute(text("SELECT 1"))
+        assert not committed(session)
+        session.commit()
+        assert committed(session)
+    finally:
+        session.close()
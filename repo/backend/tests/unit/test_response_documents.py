@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import cast
+
+import pydantic_core
+
+from rop.application.commerce.schemas import OrderResponse
+from rop.application.commerce.service import CommerceService
+from rop.application.kitchen.schemas import KitchenQueueEntryResponse, KitchenQueueResponse
+from rop.application.kitchen.service import AsyncKitchenService, KitchenService
+from rop.domain.kitchen.prep_time import QuantileSketch
+from rop.infrastructure.cache.kitchen_board import (
+    AsyncRedisKitchenBoard,
+    KitchenTicket,
+    KitchenTicketLine,
+)
+from rop.infrastructure.cache.prep_stats import RESTAURANT_SCOPE, AsyncRedisPrepTimeStats
+from rop.infrastructure.db.models import OrderLineModel, OrderModel
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _rendered(document: object) -> object:
+    return json.loads(pydantic_core.to_json(document))
+
+
+def test_order_documents_render_like_the_response_model() -> None:
+    order = OrderModel(
+        id="ord_001",
+        restaurant_id="rst_001",
+        location_id="loc_002",
+        session_id="ses_001",
+        table_id=None,
+        channel="pickup",
+        source_type="business_website",
+        status="pending",
+        external_source=None,
+        external_reference=None,
+        subtotal=Decimal("28.50"),
+        discount_total=Decimal("0.00"),
+        tax_total=Decimal("0.00"),
+        total=Decimal("28.50"),
+        notes="no onions",
+        idempotency_key=None,
+        created_at=NOW,
+        updated_at=NOW,
+        deleted_at=None,
+        lines=[
+            OrderLineModel(
+                id="orl_001",
+                menu_item_id="itm_001",
+                item_name_snapshot="Burrata Plate",
+                unit_price_snapshot=Decimal("12.50"),
+                quantity=1,
+                line_total=Decimal("12.50"),
+                notes=None,
+                station=None,
+            ),
+            OrderLineModel(
+                id="orl_002",
+                menu_item_id="itm_002",
+                item_name_snapshot="Smash Burger",
+                unit_price_snapshot=Decimal("8.00"),
+                quantity=2,
+                line_total=Decimal("16.00"),
+                notes=None,
+                station="grill",
+            ),
+        ],
+    )
+
+    service = CommerceService(db=None)  # type: ignore[arg-type]
+    document = service._order_document(order, eta_seconds=90)
+
+    assert _rendered(document) == OrderResponse.model_validate(document).model_dump(mode="json")
+    assert [line["station"] for line in document["lines"]] == ["general", "grill"]
+
+
+def _ticket() -> KitchenTicket:
+    return KitchenTicket(
+        id="ord_001",
+        restaurant_id="rst_001",
+        location_id="loc_001",
+        session_id="ses_001",
+        table_id="tbl_001",
+        table_label="T1",
+        channel="dine_in",
+        source_type="qr",
+        status="accepted",
+        notes=None,
+        created_at=NOW,
+        updated_at=NOW,
+        lines=[
+            KitchenTicketLine(
+                id="orl_001",
+                menu_item_id="itm_002",
+                name="Smash Burger",
+                quantity=1,
+                notes=None,
+                station="grill",
+            ),
+            KitchenTicketLine(
+                id="orl_002",
+                menu_item_id="itm_001",
+                name="Burrata Plate",
+                quantity=1,
+                notes=None,
+                station="cold",
+            ),
+        ],
+    )
+
+
+def test_queue_entry_documents_render_like_the_response_model() -> None:
+    service = KitchenService(db=None)  # type: ignore[arg-type]
+    entry = service._queue_entry(_ticket(), NOW, 120, station="grill")
+
+    assert _rendered(entry) == KitchenQueueEntryResponse.model_validate(entry).model_dump(
+        mode="json"
+    )
+    assert [line["id"] for line in entry["lines"]] == ["orl_001"]
+
+
+class _FakeBoard:
+    def __init__(self, tickets: list[KitchenTicket] | None) -> None:
+        self.tickets = tickets
+
+    async def page(self, *args: object) -> list[KitchenTicket] | None:
+        return self.tickets
+
+    async def depth(self, *args: object) -> dict[str, int]:
+        return {"pending": 0, "accepted": 1, "ready": 0}
+
+
+class _FakeStats:
+    async def sketches(self, *args: object) -> dict[str, QuantileSketch]:
+        return {RESTAURANT_SCOPE: QuantileSketch()}
+
+
+def _async_service(tickets: list[KitchenTicket] | None) -> AsyncKitchenService:
+    return AsyncKitchenService(
+        board=cast(AsyncRedisKitchenBoard, _FakeBoard(tickets)),
+        stats=cast(AsyncRedisPrepTimeStats, _FakeStats()),
+    )
+
+
+async def test_async_queue_reads_the_board_and_defers_misses_to_the_sync_service() -> None:
+    document = await _async_service([_ticket()]).queue("rst_001", None, 50)
+
+    assert document is not None
+    assert _rendered(document) == KitchenQueueResponse.model_validate(document).model_dump(
+        mode="json"
+    )
+    assert document["orders"][0]["eta_seconds"] is not None
+    assert await _async_service(None).queue("rst_001", None, 50) is None
+
+    station = await _async_service([_ticket()]).station_queue("rst_001", " Grill ", None, 50)
+    assert station is not None
+    assert station["station"] == "grill"
+    assert [line["id"] for line in station["orders"][0]["lines"]] == ["orl_001"]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+
+from rop.api.sse.hub import ORDER_STREAM, PICKUP_BOARD_STREAM, SseHub
+from rop.infrastructure.messaging.fanout_subscriptions import FanoutSubscriptions
+
+
+def _event(seq: int, order_id: str, status: str, channel: str = "pickup") -> str:
+    return json.dumps(
+        {
+            "seq": seq,
+            "event_type": f"order.{status}",
+            "order_id": order_id,
+            "location_id": "loc_002",
+            "channel": channel,
+            "status": status,
+            "updated_at": "2026-10-19T12:00:00+00:00",
+            "notes": "ring the bell",
+        }
+    )
+
+
+async def test_order_subscribers_share_one_frame_per_event() -> None:
+    hub = SseHub(queue_size=8)
+    first = hub.subscribe(ORDER_STREAM, "rst_001", "ord_1")
+    second = hub.subscribe(ORDER_STREAM, "rst_001", "ord_1")
+    other = hub.subscribe(ORDER_STREAM, "rst_001", "ord_2")
+
+    message = _event(7, "ord_1", "accepted")
+    hub.publish("rst_001", message)
+
+    frame = first.queue.get_nowait()
+    assert frame == f"id: 7\nevent: order.accepted\ndata: {message}\n\n"
+    assert second.queue.get_nowait() is frame
+    assert other.queue.empty()
+
+
+async def test_pickup_board_gets_public_ready_and_cleared_frames_only() -> None:
+    hub = SseHub(queue_size=8)
+    board = hub.subscribe(PICKUP_BOARD_STREAM, "rst_001", "loc_002")
+
+    hub.publish("rst_001", _event(1, "ord_1", "accepted"))
+    hub.publish("rst_001", _event(2, "ord_1", "ready"))
+    hub.publish("rst_001", _event(3, "ord_2", "ready", channel="dine_in"))
+    hub.publish("rst_001", _event(4, "ord_1", "served"))
+
+    ready = board.queue.get_nowait()
+    cleared = board.queue.get_nowait()
+    assert board.queue.empty()
+    assert ready is not None and cleared is not None
+    assert ready.startswith("id: 2\nevent: pickup.ready\n")
+    assert cleared.startswith("id: 4\nevent: pickup.cleared\n")
+    assert "ring the bell" not in ready
+
+
+async def test_overflowing_subscriber_is_dropped_and_releases_fanout_interest() -> None:
+    subscriptions = FanoutSubscriptions(grace_seconds=0)
+    hub = SseHub(subscriptions=subscriptions, queue_size=2)
+    subscriber = hub.subscribe(ORDER_STREAM, "rst_001", "ord_1")
+    assert subscriptions.restaurants() == {"rst_001"}
+
+    for seq in range(3):
+        hub.publish("rst_001", _event(seq, "ord_1", "accepted"))
+
+    assert subscriber.queue.get_nowait() is None
+    assert subscriptions.restaurants() == set()
+    hub.unsubscribe(subscriber)
+    assert subscriptions.restaurants() == set()
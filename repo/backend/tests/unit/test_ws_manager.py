@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import cast
+
+import msgpack  # type: ignore[import-untyped]
+from fastapi import WebSocket
+
+from rop.api.ws.manager import ConnectionManager, Replay
+
+
+class FakeWebSocket:
+    def __init__(self, send_delay: float = 0.0) -> None:
+        self.send_delay = send_delay
+        self.sent: list[str | bytes] = []
+        self.closed_with: int | None = None
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, message: str) -> None:
+        await asyncio.sleep(self.send_delay)
+        self.sent.append(message)
+
+    async def send_bytes(self, message: bytes) -> None:
+        await asyncio.sleep(self.send_delay)
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed_with = code
+
+
+def _socket(fake: FakeWebSocket) -> WebSocket:
+    return cast(WebSocket, fake)
+
+
+def _replay(frames: list[str], covered_through: int) -> Replay:
+    async def replay() -> tuple[list[str], int | None]:
+        return frames, covered_through
+
+    return replay
+
+
+async def test_broadcast_does_not_wait_for_a_slow_client() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=5.0)
+    fast = FakeWebSocket()
+    slow = FakeWebSocket(send_delay=1.0)
+    await manager.register(_socket(fast), "rst_001", "KITCHEN")
+    await manager.register(_socket(slow), "rst_001", "KITCHEN")
+
+    await asyncio.wait_for(manager.broadcast("rst_001", '{"n": 1}'), timeout=0.1)
+    await asyncio.sleep(0.05)
+
+    assert fast.sent == ['{"n": 1}']
+    assert slow.sent == []
+    await manager.shutdown()
+
+
+async def test_client_that_overflows_its_queue_is_evicted() -> None:
+    manager = ConnectionManager(send_queue_size=2, send_timeout_seconds=5.0)
+    fast = FakeWebSocket()
+    stuck = FakeWebSocket(send_delay=60.0)
+    await manager.register(_socket(fast), "rst_001", "KITCHEN")
+    await manager.register(_socket(stuck), "rst_001", "KITCHEN")
+
+    for index in range(4):
+        await manager.broadcast("rst_001", f'{{"n": {index}}}')
+        await asyncio.sleep(0.01)
+
+    assert stuck.closed_with == 1013
+    assert len(fast.sent) == 4
+    await manager.broadcast("rst_001", '{"n": 4}')
+    await asyncio.sleep(0.01)
+    assert len(fast.sent) == 5
+    await manager.shutdown()
+
+
+async def test_client_that_stalls_past_the_deadline_is_evicted() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=0.05)
+    stuck = FakeWebSocket(send_delay=60.0)
+    await manager.register(_socket(stuck), "rst_001", "KITCHEN")
+
+    await manager.broadcast("rst_001", '{"n": 1}')
+    await asyncio.sleep(0.2)
+
+    assert stuck.closed_with == 1013
+    await manager.shutdown()
+
+
+async def test_topic_subscribers_only_receive_matching_events() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=5.0)
+    everything = FakeWebSocket()
+    grill = FakeWebSocket()
+    order = FakeWebSocket()
+    await manager.register(_socket(everything), "rst_001", "MANAGER")
+    await manager.register(_socket(grill), "rst_001", "KITCHEN", topics={"station:grill"})
+    await manager.register(_socket(order), "rst_001", "CUSTOMER", topics={"order:ord_2"})
+
+    await manager.broadcast("rst_001", '{"order_id": "ord_1", "stations": ["grill"]}')
+    await manager.broadcast("rst_001", '{"order_id": "ord_2", "stations": ["cold"]}')
+    await asyncio.sleep(0.01)
+
+    assert len(everything.sent) == 2
+    assert grill.sent == ['{"order_id": "ord_1", "stations": ["grill"]}']
+    assert order.sent == ['{"order_id": "ord_2", "stations": ["cold"]}']
+
+    current = await manager.update_topics(
+        _socket(order),
+        subscribe={"station:grill"},
+        unsubscribe={"order:ord_2"},
+    )
+    assert current == {"station:grill"}
+    await manager.broadcast("rst_001", '{"order_id": "ord_2", "stations": ["cold"]}')
+    await manager.broadcast("rst_001", '{"order_id": "ord_3", "stations": ["grill"]}')
+    await asyncio.sleep(0.01)
+    assert order.sent[-1] == '{"order_id": "ord_3", "stations": ["grill"]}'
+    assert len(order.sent) == 2
+    await manager.shutdown()
+
+
+async def test_a_conjunctive_filter_only_receives_events_matching_all_its_topics() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=5.0)
+    grill_here = FakeWebSocket()
+    await manager.register(
+        _socket(grill_here), "rst_001", "KITCHEN", topics={"location:loc_1;station:grill"}
+    )
+
+    here = '{"location_id": "loc_1", "stations": ["grill"]}'
+    await manager.broadcast("rst_001", '{"location_id": "loc_2", "stations": ["grill"]}')
+    await manager.broadcast("rst_001", '{"location_id": "loc_1", "stations": ["cold"]}')
+    await manager.broadcast("rst_001", here)
+    await asyncio.sleep(0.01)
+
+    assert grill_here.sent == [here]
+    await manager.shutdown()
+
+
+async def test_filtered_clients_get_the_seq_of_the_previous_frame_sent_to_them() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=5.0)
+    plain = FakeWebSocket()
+    grill = FakeWebSocket()
+    await manager.register(_socket(plain), "rst_001", "KITCHEN")
+    await manager.register(
+        _socket(grill),
+        "rst_001",
+        "KITCHEN",
+        topics={"station:grill"},
+        replay=_replay(['{"seq":4,"stations":["grill"]}'], 5),
+        last_event_id=3,
+    )
+
+    await manager.broadcast("rst_001", '{"seq":5,"stations":["grill"]}')
+    await manager.broadcast("rst_001", '{"seq":6,"stations":["cold"]}')
+    await manager.broadcast("rst_001", '{"seq":7,"stations":["grill"]}')
+    await asyncio.sleep(0.01)
+
+    assert [json.loads(frame) for frame in grill.sent] == [
+        {"seq": 4, "prev_seq": 3, "stations": ["grill"]},
+        {"seq": 7, "prev_seq": 4, "stations": ["grill"]},
+    ]
+    assert plain.sent[-1] == '{"seq":7,"stations":["grill"]}'
+    await manager.shutdown()
+
+
+async def test_filtered_clients_are_disconnected_when_events_were_lost_upstream() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=5.0)
+    plain = FakeWebSocket()
+    grill = FakeWebSocket()
+    await manager.register(_socket(plain), "rst_001", "KITCHEN")
+    await manager.register(_socket(grill), "rst_001", "KITCHEN", topics={"station:grill"})
+
+    await manager.broadcast("rst_001", '{"seq":1,"stations":["grill"]}')
+    await manager.broadcast("rst_001", '{"seq":3,"stations":["cold"]}')
+    await asyncio.sleep(0.01)
+
+    assert grill.closed_with == 1013
+    assert plain.closed_with is None
+    assert len(plain.sent) == 2
+    await manager.shutdown()
+
+
+async def test_coalescing_client_gets_one_batch_with_superseded_statuses_collapsed() -> None:
+    manager = ConnectionManager(send_queue_size=16, send_timeout_seconds=5.0)
+    batched = FakeWebSocket()
+    plain = FakeWebSocket()
+    await manager.register(_socket(batched), "rst_001", "KITCHEN", coalesce_seconds=0.02)
+    await manager.register(_socket(plain), "rst_001", "KITCHEN")
+
+    frames = [
+        '{"event_type": "order.created", "order_id": "ord_1"}',
+        '{"event_type": "order.created", "order_id": "ord_2"}',
+        '{"event_type": "kitchen.prep_summary.delta", "items": []}',
+        '{"event_type": "order.accepted", "order_id": "ord_1"}',
+        '{"event_type": "order.ready", "order_id": "ord_1"}',
+    ]
+    for frame in frames:
+        await manager.broadcast("rst_001", frame)
+    await asyncio.sleep(0.05)
+
+    assert plain.sent == frames
+    assert len(batched.sent) == 1
+    assert json.loads(batched.sent[0]) == [
+        {"event_type": "order.created", "order_id": "ord_1"},
+        {"event_type": "order.created", "order_id": "ord_2"},
+        {"event_type": "kitchen.prep_summary.delta", "items": []},
+        {"event_type": "order.ready", "order_id": "ord_1"},
+    ]
+    await manager.shutdown()
+
+
+async def test_collapsed_events_do_not_break_the_prev_seq_chain() -> None:
+    manager = ConnectionManager(send_queue_size=16, send_timeout_seconds=5.0)
+    batched = FakeWebSocket()
+    await manager.register(_socket(batched), "rst_001", "KITCHEN", coalesce_seconds=0.02)
+
+    for seq, event_type in enumerate(["order.created", "order.accepted", "order.ready"], 1):
+        await manager.broadcast(
+            "rst_001", f'{{"seq":{seq},"event_type":"{event_type}","order_id":"ord_1"}}'
+        )
+    await asyncio.sleep(0.05)
+    await manager.broadcast("rst_001", '{"seq":4,"event_type":"order.served","order_id":"ord_1"}')
+    await asyncio.sleep(0.05)
+
+    batches = [json.loads(frame) for frame in batched.sent]
+    assert [[(event["seq"], event["prev_seq"]) for event in batch] for batch in batches] == [
+        [(1, 0), (3, 1)],
+        [(4, 3)],
+    ]
+    await manager.shutdown()
+
+
+async def test_msgpack_clients_share_one_encoding_per_event() -> None:
+    manager = ConnectionManager(send_queue_size=8, send_timeout_seconds=5.0)
+    first = FakeWebSocket()
+    second = FakeWebSocket()
+    batched = FakeWebSocket()
+    await manager.register(_socket(first), "rst_001", "KITCHEN", encoding="msgpack")
+    await manager.register(_socket(second), "rst_001", "KITCHEN", encoding="msgpack")
+    await manager.register(
+        _socket(batched), "rst_001", "KITCHEN", encoding="msgpack", coalesce_seconds=0.02
+    )
+
+    await manager.broadcast("rst_001", '{"seq":1,"event_type":"order.created","order_id":"o1"}')
+    await manager.broadcast("rst_001", '{"seq":2,"event_type":"order.created","order_id":"o2"}')
+    await asyncio.sleep(0.05)
+
+    assert msgpack.unpackb(first.sent[0]) == {
+        "seq": 1,
+        "event_type": "order.created",
+        "order_id": "o1",
+    }
+    assert first.sent[0] is second.sent[0]
+    assert [event["order_id"] for event in msgpack.unpackb(batched.sent[0])] == ["o1", "o2"]
+    await manager.shutdown()
+
+
+async def test_silent_heartbeat_client_is_reaped_while_replying_and_opted_out_ones_stay() -> None:
+    manager = ConnectionManager(
+        send_queue_size=8,
+        send_timeout_seconds=5.0,
+        ping_interval_seconds=0.05,
+        ping_timeout_seconds=0.05,
+    )
+    silent = FakeWebSocket()
+    replying = FakeWebSocket()
+    listening = FakeWebSocket()
+    await manager.register(_socket(silent), "rst_001", "KITCHEN", heartbeat=True)
+    await manager.register(_socket(replying), "rst_001", "KITCHEN", heartbeat=True)
+    await manager.register(_socket(listening), "rst_001", "KITCHEN")
+
+    for _ in range(8):
+        await asyncio.sleep(0.025)
+        manager.touch(_socket(replying))
+
+    assert '{"type": "ping"}' in silent.sent
+    assert silent.closed_with == 1013
+    assert replying.closed_with is None
+    assert listening.sent == []
+    assert listening.closed_with is None
+    await manager.broadcast("rst_001", '{"n": 1}')
+    await asyncio.sleep(0.01)
+    assert replying.sent[-1] == '{"n": 1}'
+    await manager.shutdown()
+
+
+async def test_connections_beyond_the_restaurant_limit_are_refused() -> None:
+    manager = ConnectionManager(
+        send_queue_size=8,
+        send_timeout_seconds=5.0,
+        max_connections_per_restaurant=1,
+    )
+    first = FakeWebSocket()
+    second = FakeWebSocket()
+    other_restaurant = FakeWebSocket()
+
+    assert await manager.register(_socket(first), "rst_001", "KITCHEN")
+    assert not await manager.register(_socket(second), "rst_001", "KITCHEN")
+    assert await manager.register(_socket(other_restaurant), "rst_002", "KITCHEN")
+
+    assert second.closed_with == 1013
+    await manager.unregister(_socket(first))
+    assert await manager.register(_socket(second), "rst_001", "KITCHEN")
+    await manager.shutdown()
+
+
+async def test_connections_beyond_the_replica_limit_are_refused() -> None:
+    manager = ConnectionManager(
+        send_queue_size=8,
+        send_timeout_seconds=5.0,
+        max_connections=2,
+    )
+    sockets = [FakeWebSocket() for _ in range(3)]
+
+    assert await manager.register(_socket(sockets[0]), "rst_001", "KITCHEN")
+    assert await manager.register(_socket(sockets[1]), "rst_002", "KITCHEN")
+    assert not await manager.register(_socket(sockets[2]), "rst_003", "KITCHEN")
+
+    assert sockets[2].closed_with == 1013
+    await manager.shutdown()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from rop.api.ws import routes
+from rop.api.ws.manager import ConnectionManager
+from rop.application.catalog.service import AsyncCatalogService
+from rop.domain.errors import NotFoundError
+
+
+class FakeSession:
+    async def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def lookups(monkeypatch) -> list[str]:
+    seen: list[str] = []
+
+    async def read_session(token: str | None) -> FakeSession:
+        return FakeSession()
+
+    async def require_restaurant(self: AsyncCatalogService, restaurant_id: str) -> None:
+        seen.append(restaurant_id)
+        if restaurant_id != "rst_001":
+            raise NotFoundError("restaurant not found", code="RESTAURANT_NOT_FOUND")
+
+    monkeypatch.setattr(routes, "async_read_session", read_session)
+    monkeypatch.setattr(AsyncCatalogService, "require_restaurant", require_restaurant)
+    monkeypatch.setattr(routes, "_known_restaurants", {})
+    return seen
+
+
+async def test_known_restaurants_are_remembered_and_unknown_ones_rechecked(lookups) -> None:
+    assert await routes._restaurant_exists("rst_001")
+    assert await routes._restaurant_exists("rst_001")
+    assert not await routes._restaurant_exists("rst_made_up")
+    assert not await routes._restaurant_exists("rst_made_up")
+
+    assert lookups == ["rst_001", "rst_made_up", "rst_made_up"]
+
+
+def test_sockets_for_unknown_restaurants_are_refused_before_registering(lookups) -> None:
+    app = FastAPI()
+    app.include_router(routes.router)
+    app.state.ws_manager = ConnectionManager()
+    client = TestClient(app)
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/ws?restaurant_id=rst_made_up"):
+            pass
+
+    assert exc.value.code == 1008
+    assert lookups == ["rst_made_up"]
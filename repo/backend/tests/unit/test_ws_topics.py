@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from rop.api.ws.topics import event_topics, index_topic, matches, parse_topics
+from rop.domain.errors import ValidationError
+
+
+def test_parse_topics_normalizes_station_names() -> None:
+    assert parse_topics(["station: Grill ", "order:ord_123", "event:order.ready"]) == {
+        "station:grill",
+        "order:ord_123",
+        "event:order.ready",
+    }
+
+
+@pytest.mark.parametrize("raw_topic", ["grill", "kitchen:grill", "table:", "station:hot:line"])
+def test_parse_topics_rejects_unknown_or_empty_topics(raw_topic: str) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        parse_topics([raw_topic])
+    assert exc_info.value.code in {"INVALID_TOPIC", "INVALID_STATION"}
+
+
+def test_event_topics_cover_every_dimension_present_in_the_payload() -> None:
+    payload = {
+        "event_type": "order.created",
+        "order_id": "ord_1",
+        "location_id": "loc_001",
+        "table_id": None,
+        "stations": ["cold", "grill"],
+    }
+    assert event_topics(payload) == {
+        "event:order.created",
+        "order:ord_1",
+        "location:loc_001",
+        "station:cold",
+        "station:grill",
+    }
+
+
+def test_topics_joined_with_a_semicolon_form_one_canonical_filter() -> None:
+    assert parse_topics(["location:loc_001; station:Grill", "order:ord_1"]) == {
+        "location:loc_001;station:grill",
+        "order:ord_1",
+    }
+
+
+def test_a_filter_matches_only_events_carrying_all_of_its_topics() -> None:
+    filters = parse_topics(["station:grill;location:loc_001"])
+
+    assert matches(filters, {"station:grill", "location:loc_001", "order:ord_1"})
+    assert not matches(filters, {"station:grill", "location:loc_002"})
+    assert index_topic("location:loc_001;station:grill") == "station:grill"
@@ -0,0 +1,159 @@
+"""Compare per-replica CPU of exact vs pattern Redis fanout subscriptions.
+
+Starts several uvicorn replicas against one Redis, connects websocket clients so each
+replica only serves a slice of the restaurants, publishes events for every restaurant
+and reports the CPU time each replica spent. Run from ``backend/`` with ``REDIS_URL`` and
+``DATABASE_URL`` pointing at the local stack::
+
+    PYTHONPATH=src python tools/bench/fanout_replicas.py --replicas 4 --restaurants 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+import websockets
+from websockets.asyncio.client import ClientConnection
+
+from rop.infrastructure.messaging.redis_publisher import RedisEventPublisher
+from rop.tools.seed import seed_restaurants
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+@dataclass(frozen=True)
+class RunResult:
+    mode: str
+    cpu_seconds: list[float]
+    received: int
+
+
+def _cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat", encoding="utf-8") as stat:
+        fields = stat.read().rpartition(")")[2].split()
+    # utime and stime are fields 14 and 15; the split starts at field 3.
+    return (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+
+
+def _start_replicas(count: int, base_port: int, mode: str) -> list[subprocess.Popen[bytes]]:
+    env = {**os.environ, "REDIS_FANOUT_SUBSCRIBE": mode}
+    return [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "rop.api.main:app",
+                "--port",
+                str(base_port + index),
+                "--log-level",
+                "warning",
+            ],
+            env=env,
+        )
+        for index in range(count)
+    ]
+
+
+async def _wait_ready(port: int, timeout_seconds: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+
+
+async def _drain(websocket: ClientConnection, counter: list[int]) -> None:
+    async for _ in websocket:
+        counter[0] += 1
+
+
+async def _run(args: argparse.Namespace, mode: str) -> RunResult:
+    replicas = _start_replicas(args.replicas, args.base_port, mode)
+    sockets: list[ClientConnection] = []
+    drains: list[asyncio.Task[None]] = []
+    counter = [0]
+    try:
+        for index in range(args.replicas):
+            await _wait_ready(args.base_port + index)
+        restaurant_ids = [f"bench_{index:04d}" for index in range(args.restaurants)]
+        # Websockets are refused for restaurants that do not exist.
+        seed_restaurants(restaurant_ids)
+        # Each replica serves a disjoint slice, as a sticky load balancer would arrange.
+        for position, restaurant_id in enumerate(restaurant_ids):
+            port = args.base_port + position % args.replicas
+            for _ in range(args.clients_per_restaurant):
+                websocket = await websockets.connect(
+                    f"ws://127.0.0.1:{port}/ws?restaurant_id={restaurant_id}&role=BENCH"
+                )
+                sockets.append(websocket)
+                drains.append(asyncio.create_task(_drain(websocket, counter)))
+        # Give the replicas' channel syncers time to subscribe.
+        await asyncio.sleep(1.0)
+
+        before = [_cpu_seconds(replica.pid) for replica in replicas]
+        publisher = RedisEventPublisher()
+        payload = {"event_type": "bench.tick", "padding": "x" * args.payload_bytes}
+        for index in range(args.events):
+            restaurant_id = restaurant_ids[index % len(restaurant_ids)]
+            await asyncio.to_thread(
+                publisher.publish_json,
+                restaurant_id,
+                {**payload, "restaurant_id": restaurant_id},
+            )
+        await asyncio.sleep(args.settle_seconds)
+        after = [_cpu_seconds(replica.pid) for replica in replicas]
+        return RunResult(
+            mode=mode,
+            cpu_seconds=[end - start for start, end in zip(before, after)],
+            received=counter[0],
+        )
+    finally:
+        for task in drains:
+            task.cancel()
+        for websocket in sockets:
+            await websocket.close()
+        for replica in replicas:
+            replica.terminate()
+        for replica in replicas:
+            replica.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=4)
+    parser.add_argument("--restaurants", type=int, default=40)
+    parser.add_argument("--clients-per-restaurant", type=int, default=2)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--payload-bytes", type=int, default=512)
+    parser.add_argument("--base-port", type=int, default=18000)
+    parser.add_argument("--settle-seconds", type=float, default=3.0)
+    parser.add_argument("--modes", default="pattern,exact")
+    args = parser.parse_args()
+
+    for mode in args.modes.split(","):
+        result = asyncio.run(_run(args, mode))
+        per_replica = ", ".join(f"{seconds:.2f}" for seconds in result.cpu_seconds)
+        print(
+            f"{result.mode:>8}: cpu_s per replica [{per_replica}] "
+            f"mean {sum(result.cpu_seconds) / len(result.cpu_seconds):.2f} "
+            f"frames_received {result.received}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""Closed-loop HTTP load test for the hot request paths.
+
+Each of ``--concurrency`` workers issues requests back to back for ``--duration``
+seconds, per scenario, and the run reports throughput, latency percentiles and errors.
+``catalog`` is served on the async database path while ``location`` is a comparable
+single-row read on the sync threadpool path, so the pair shows what the threadpool cap
+(``HTTP_THREADPOOL_TOKENS``, default 40) costs at high concurrency. Start the app with
+seeded data first, then from ``backend/``::
+
+    python tools/bench/http_load.py --url http://127.0.0.1:8000 --concurrency 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+RESTAURANT_ID = "rst_001"
+PICKUP_LOCATION_ID = "loc_002"
+
+Request = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+@dataclass
+class ScenarioResult:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+async def _open_pickup_session(http: httpx.AsyncClient) -> str:
+    response = await http.post(
+        "/v1/sessions",
+        json={
+            "restaurant_id": RESTAURANT_ID,
+            "location_id": PICKUP_LOCATION_ID,
+            "channel": "pickup",
+            "source_type": "business_website",
+        },
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def _scenarios(http: httpx.AsyncClient) -> dict[str, Request]:
+    session_id = await _open_pickup_session(http)
+    order = {
+        "restaurant_id": RESTAURANT_ID,
+        "session_id": session_id,
+        "lines": [{"menu_item_id": "itm_002", "quantity": 1}],
+    }
+    return {
+        "catalog": lambda client: client.get(f"/v1/restaurants/{RESTAURANT_ID}/catalog"),
+        "location": lambda client: client.get(f"/v1/locations/{PICKUP_LOCATION_ID}"),
+        "kitchen_queue": lambda client: client.get(
+            f"/v1/restaurants/{RESTAURANT_ID}/kitchen/orders"
+        ),
+        "create_order": lambda client: client.post("/v1/orders", json=order),
+    }
+
+
+async def _worker(
+    http: httpx.AsyncClient,
+    request: Request,
+    deadline: float,
+    result: ScenarioResult,
+) -> None:
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await request(http)
+        except httpx.HTTPError:
+            result.errors += 1
+            continue
+        if response.status_code >= 400:
+            result.errors += 1
+            continue
+        result.latencies.append(time.perf_counter() - started)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+async def _run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as http:
+        scenarios = await _scenarios(http)
+        names = args.scenarios.split(",") if args.scenarios else list(scenarios)
+        print(f"{'scenario':>14} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} errors")
+        for name in names:
+            result = ScenarioResult()
+            deadline = time.monotonic() + args.duration
+            await asyncio.gather(
+                *(_worker(http, scenarios[name], deadline, result) for _ in range(args.concurrency))
+            )
+            latencies = sorted(result.latencies)
+            print(
+                f"{name:>14} {len(latencies) / args.duration:9.1f} "
+                f"{_percentile(latencies, 0.5) * 1000:8.1f} "
+                f"{_percentile(latencies, 0.95) * 1000:8.1f} "
+                f"{_percentile(latencies, 0.99) * 1000:8.1f} {result.errors}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument(
+        "--scenarios",
+        default="",
+        help="comma separated subset of catalog,location,kitchen_queue,create_order",
+    )
+    asyncio.run(_run(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
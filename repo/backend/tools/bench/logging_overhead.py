@@ -0,0 +1,79 @@
+"""Caller-side cost of writing an access log record, synchronously versus queued.
+
+``sync`` is the previous setup: a ``StreamHandler`` with ``JsonFormatter`` on the logging
+thread. ``queued`` is the current one: ``ContextQueueHandler`` hands the record to a
+``QueueListener`` that formats and writes on a background thread. Both write to
+``--output`` (``/dev/null`` by default; pass a file or pipe to include real I/O). The
+caller figure is the time the logging call holds the caller, which for access logs is
+the event loop; the writer figure is the work moved to the background thread. From
+``backend/``::
+
+    PYTHONPATH=src python tools/bench/logging_overhead.py --records 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueListener
+
+from rop.infrastructure.observability.logging_config import ContextQueueHandler, JsonFormatter
+
+EXTRA = {
+    "method": "GET",
+    "path": "/v1/orders/ord_01m59f93v3qtwzpjg35ergtg50",
+    "status_code": 200,
+    "duration_ms": 3.21,
+    "db_statements": 1,
+    "db_duration_ms": 0.42,
+}
+
+
+def _per_record_us(logger: logging.Logger, records: int) -> float:
+    started = time.perf_counter()
+    for _ in range(records):
+        logger.info("request_complete", extra=EXTRA)
+    return (time.perf_counter() - started) / records * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--output", default=os.devnull)
+    args = parser.parse_args()
+
+    with open(args.output, "w") as output:
+        stream = logging.StreamHandler(output)
+        stream.setFormatter(JsonFormatter())
+
+        sync_logger = logging.getLogger("bench.sync")
+        sync_logger.propagate = False
+        sync_logger.setLevel(logging.INFO)
+        sync_logger.addHandler(stream)
+        sync_us = _per_record_us(sync_logger, args.records)
+
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        listener = QueueListener(log_queue, stream)
+        queued_logger = logging.getLogger("bench.queued")
+        queued_logger.propagate = False
+        queued_logger.setLevel(logging.INFO)
+        queued_logger.addHandler(ContextQueueHandler(log_queue))
+        # The listener starts after the loop so the writer thread does not compete with
+        # the caller for the GIL; its cost is reported separately as the drain time.
+        queued_us = _per_record_us(queued_logger, args.records)
+        started = time.perf_counter()
+        listener.start()
+        listener.stop()
+        drain_us = (time.perf_counter() - started) / args.records * 1_000_000
+
+    print(f"{'handler':<8} {'caller us/record':>17} {'writer us/record':>17}")
+    print(f"{'sync':<8} {sync_us:>17.1f} {'-':>17}")
+    print(f"{'queued':<8} {queued_us:>17.1f} {drain_us:>17.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
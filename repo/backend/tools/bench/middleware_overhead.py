@@ -0,0 +1,135 @@
+"""Per-request middleware overhead on ``/health/live``.
+
+The health router is mounted in a bare FastAPI app and called directly over ASGI, with
+no server or socket, under three stacks. ``none`` has no middleware. ``base_http`` is the
+previous stack: request id, access log and consistency token middlewares, each a
+``BaseHTTPMiddleware``. ``asgi`` is the current single ``AccessLogMiddleware``. Logging
+is silenced so the numbers show the middleware, not the log handler. From
+``backend/``::
+
+    PYTHONPATH=src python tools/bench/middleware_overhead.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from uuid import uuid4
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message
+
+from rop.api.middleware.access_log import AccessLogMiddleware
+from rop.api.middleware.request_id import REQUEST_ID_HEADER, request_id_context
+from rop.api.routes.health import router as health_router
+from rop.infrastructure.db.consistency import CONSISTENCY_TOKEN_HEADER
+from rop.infrastructure.db.query_stats import request_query_stats
+
+STACKS = ("none", "base_http", "asgi")
+
+
+class _RequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get(REQUEST_ID_HEADER, str(uuid4()))
+        token = request_id_context.set(request_id)
+        request.state.request_id = request_id
+        try:
+            response = await call_next(request)
+        finally:
+            request_id_context.reset(token)
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+
+
+class _AccessLogMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        started = time.perf_counter()
+        with request_query_stats() as queries:
+            response = await call_next(request)
+        AccessLogMiddleware._log(request.scope, response.status_code, started, queries)
+        return response
+
+
+class _ConsistencyTokenMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        token = getattr(request.state, "consistency_token", None)
+        if token:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = token
+        return response
+
+
+def _app(stack: str) -> ASGIApp:
+    app = FastAPI()
+    app.include_router(health_router)
+    if stack == "base_http":
+        app.add_middleware(_ConsistencyTokenMiddleware)
+        app.add_middleware(_AccessLogMiddleware)
+        app.add_middleware(_RequestIDMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(AccessLogMiddleware)
+    return app
+
+
+async def _call(app: ASGIApp) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/health/live",
+        "raw_path": b"/health/live",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _per_call_us(app: ASGIApp, iterations: int) -> float:
+    for _ in range(min(iterations, 500)):
+        assert await _call(app) == 200
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await _call(app)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def _run(iterations: int) -> None:
+    results = {stack: await _per_call_us(_app(stack), iterations) for stack in STACKS}
+    print(f"{'stack':<10} {'us/request':>11} {'middleware us':>14}")
+    for stack, per_call_us in results.items():
+        overhead_us = per_call_us - results["none"]
+        print(f"{stack:<10} {per_call_us:>11.1f} {overhead_us:>14.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    logging.getLogger("rop.api.access").disabled = True
+    asyncio.run(_run(args.iterations))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
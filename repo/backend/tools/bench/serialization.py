@@ -0,0 +1,179 @@
+"""Response serialization cost for a large order and a full kitchen queue.
+
+Each case is timed two ways. ``validated`` is the previous path: the response model is
+built with validation, FastAPI validates it again against ``response_model``, and
+``JSONResponse`` renders it with ``json.dumps``. ``fast`` is the current path: the
+services build a JSON-ready dict from the ORM row or board ticket and the route returns
+it in a ``FastJSONResponse``, which pydantic-core serializes straight to bytes. No
+database or Redis is needed. From ``backend/``::
+
+    PYTHONPATH=src python tools/bench/serialization.py --lines 50 --entries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+
+from rop.api.responses import FastJSONResponse
+from rop.application.commerce.schemas import OrderResponse
+from rop.application.commerce.service import CommerceService
+from rop.application.kitchen.schemas import KitchenQueueResponse
+from rop.application.kitchen.service import KitchenService
+from rop.infrastructure.cache.kitchen_board import KitchenTicket, KitchenTicketLine
+from rop.infrastructure.db.models import OrderLineModel, OrderModel
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _order(line_count: int) -> OrderModel:
+    lines = [
+        OrderLineModel(
+            id=f"orl_{index:026d}",
+            menu_item_id="itm_001",
+            item_name_snapshot="Smash Burger",
+            unit_price_snapshot=Decimal("16.00"),
+            quantity=2,
+            line_total=Decimal("32.00"),
+            notes=None,
+            station="grill",
+        )
+        for index in range(line_count)
+    ]
+    return OrderModel(
+        id="ord_01m59f93v3qtwzpjg35ergtg50",
+        restaurant_id="rst_001",
+        location_id="loc_002",
+        session_id="ses_01m59f93t1kywtrssywnht6nhr",
+        table_id=None,
+        channel="pickup",
+        source_type="business_website",
+        status="pending",
+        external_source=None,
+        external_reference=None,
+        subtotal=Decimal("32.00") * line_count,
+        discount_total=Decimal("0.00"),
+        tax_total=Decimal("0.00"),
+        total=Decimal("32.00") * line_count,
+        notes=None,
+        idempotency_key=None,
+        created_at=NOW,
+        updated_at=NOW,
+        deleted_at=None,
+        lines=lines,
+    )
+
+
+def _tickets(entry_count: int) -> list[KitchenTicket]:
+    return [
+        KitchenTicket(
+            id=f"ord_{index:026d}",
+            restaurant_id="rst_001",
+            location_id="loc_001",
+            session_id=f"ses_{index:026d}",
+            table_id="tbl_001",
+            table_label="T1",
+            channel="dine_in",
+            source_type="qr",
+            status="accepted",
+            notes=None,
+            created_at=NOW - timedelta(minutes=index),
+            updated_at=NOW,
+            accepted_at=NOW,
+            lines=[
+                KitchenTicketLine(
+                    id=f"orl_{index:022d}{line:04d}",
+                    menu_item_id="itm_002",
+                    name="Smash Burger",
+                    quantity=1,
+                    notes=None,
+                    station="grill",
+                )
+                for line in range(3)
+            ],
+        )
+        for index in range(entry_count)
+    ]
+
+
+Runner = Callable[[], Awaitable[bytes]]
+
+
+def _validated(model_type: type[BaseModel], build: Callable[[], Any]) -> Runner:
+    field = create_model_field(name="Response", type_=model_type, mode="serialization")
+
+    async def run() -> bytes:
+        # Validating the document stands in for the old validating model constructors.
+        model = model_type.model_validate(build())
+        content = await serialize_response(field=field, response_content=model)
+        return JSONResponse(content).body
+
+    return run
+
+
+def _fast(build: Callable[[], Any]) -> Runner:
+    async def run() -> bytes:
+        return FastJSONResponse(build()).body
+
+    return run
+
+
+async def _per_call_us(run: Runner, iterations: int) -> float:
+    for _ in range(min(iterations, 50)):
+        await run()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await run()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def _run(args: argparse.Namespace) -> None:
+    commerce = CommerceService(db=None)  # type: ignore[arg-type]
+    kitchen = KitchenService(db=None)  # type: ignore[arg-type]
+    order = _order(args.lines)
+    tickets = _tickets(args.entries)
+
+    def build_order() -> Any:
+        return commerce._order_document(order)
+
+    def build_queue() -> Any:
+        return {"orders": [kitchen._queue_entry(ticket, NOW) for ticket in tickets]}
+
+    cases: dict[str, tuple[type[BaseModel], Callable[[], Any]]] = {
+        f"order ({args.lines} lines)": (OrderResponse, build_order),
+        f"kitchen queue ({args.entries} entries)": (KitchenQueueResponse, build_queue),
+    }
+    print(f"{'case':<28} {'validated us':>13} {'fast us':>9} {'speedup':>8}")
+    for name, (model_type, build) in cases.items():
+        validated = _validated(model_type, build)
+        fast = _fast(build)
+        assert await validated() == await fast(), f"{name}: the paths render different JSON"
+        validated_us = await _per_call_us(validated, args.iterations)
+        fast_us = await _per_call_us(fast, args.iterations)
+        speedup = validated_us / fast_us
+        print(f"{name:<28} {validated_us:>13.1f} {fast_us:>9.1f} {speedup:>7.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""Per-call cost of building hot-path queries fresh versus executing prebuilt statements.
+
+``fresh`` constructs the ``select()`` on every call, as the commerce service used to;
+``prebuilt`` executes the module-level statements with bind parameters. The difference is
+the Python-side construction and cache-key work per call. The default in-memory SQLite
+database keeps the round trip out of the numbers. Pass ``--database-url`` for a migrated
+Postgres database to include psycopg's server-side prepared statements
+(``DB_PREPARE_THRESHOLD``). From ``backend/``::
+
+    PYTHONPATH=src python tools/bench/statement_cache.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload
+
+from rop.application.commerce.service import (
+    _MENU_ITEMS_BY_ID,
+    _ORDER_BY_ID,
+    _ORDER_BY_IDEMPOTENCY_KEY,
+)
+from rop.infrastructure.db.models import MenuItemModel, OrderLineModel, OrderModel
+from rop.infrastructure.db.session import _connect_args
+
+MENU_ITEM_IDS = ["itm_001", "itm_002", "itm_003"]
+
+
+def _cases(db: Session) -> dict[str, tuple[Callable[[int], object], Callable[[int], object]]]:
+    def order_fresh(i: int) -> object:
+        return db.scalar(
+            select(OrderModel)
+            .options(joinedload(OrderModel.lines))
+            .where(OrderModel.id == f"ord_{i}")
+        )
+
+    def order_prebuilt(i: int) -> object:
+        return db.scalar(_ORDER_BY_ID, {"order_id": f"ord_{i}"})
+
+    def idempotency_fresh(i: int) -> object:
+        return db.scalar(
+            select(OrderModel)
+            .options(joinedload(OrderModel.lines))
+            .where(
+                OrderModel.restaurant_id == "rst_001",
+                OrderModel.idempotency_key == f"key-{i}",
+            )
+        )
+
+    def idempotency_prebuilt(i: int) -> object:
+        return db.scalar(
+            _ORDER_BY_IDEMPOTENCY_KEY,
+            {"restaurant_id": "rst_001", "idempotency_key": f"key-{i}"},
+        )
+
+    def menu_items_fresh(_: int) -> object:
+        return db.scalars(select(MenuItemModel).where(MenuItemModel.id.in_(MENU_ITEM_IDS))).all()
+
+    def menu_items_prebuilt(_: int) -> object:
+        return db.scalars(_MENU_ITEMS_BY_ID, {"menu_item_ids": MENU_ITEM_IDS}).all()
+
+    return {
+        "order_by_id": (order_fresh, order_prebuilt),
+        "idempotency_lookup": (idempotency_fresh, idempotency_prebuilt),
+        "menu_items_in": (menu_items_fresh, menu_items_prebuilt),
+    }
+
+
+def _per_call_us(run: Callable[[int], object], iterations: int) -> float:
+    for i in range(min(iterations, 500)):
+        run(i)
+    started = time.perf_counter()
+    for i in range(iterations):
+        run(i)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10_000)
+    parser.add_argument("--database-url", default="sqlite://")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, connect_args=_connect_args(args.database_url, 5))
+    if args.database_url.startswith("sqlite"):
+        metadata = MenuItemModel.metadata
+        metadata.create_all(
+            engine,
+            tables=[
+                metadata.tables[model.__tablename__]
+                for model in (MenuItemModel, OrderModel, OrderLineModel)
+            ],
+        )
+
+    print(f"{'query':<20} {'fresh us':>10} {'prebuilt us':>12} {'saved':>7}")
+    with Session(engine) as db:
+        for name, (fresh, prebuilt) in _cases(db).items():
+            fresh_us = _per_call_us(fresh, args.iterations)
+            prebuilt_us = _per_call_us(prebuilt, args.iterations)
+            saved = 1 - prebuilt_us / fresh_us
+            print(f"{name:<20} {fresh_us:>10.1f} {prebuilt_us:>12.1f} {saved:>7.0%}")
+    engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
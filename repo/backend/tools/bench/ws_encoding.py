@@ -0,0 +1,110 @@
+"""Bytes on the wire and server CPU per event for each websocket encoding.
+
+Simulates fanning a stream of order events out to ``--recipients`` sockets. The JSON and
+MessagePack encodings are produced once per event and shared by every recipient, as the
+connection manager does; permessage-deflate keeps a compressor per connection (with
+context takeover), so its cost is paid per recipient. Run from ``backend/``::
+
+    PYTHONPATH=src python tools/bench/ws_encoding.py --recipients 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import zlib
+from datetime import datetime, timezone
+
+from rop.api.ws.encoding import JSON, MSGPACK, encode_frame, msgpack_event
+
+_STATIONS = ("grill", "cold", "general")
+
+
+def _order_event(seq: int, line_count: int) -> str:
+    now = datetime.now(timezone.utc).isoformat()
+    lines = [
+        {
+            "id": f"oln_{seq:06d}_{index}",
+            "menu_item_id": f"itm_{index:03d}",
+            "name": f"Menu item {index}",
+            "quantity": 1 + index % 3,
+            "notes": "no onions" if index % 2 else None,
+            "station": _STATIONS[index % 3],
+        }
+        for index in range(line_count)
+    ]
+    payload = {
+        "event_type": "order.accepted",
+        "order_id": f"ord_{seq:06d}",
+        "restaurant_id": "rst_001",
+        "location_id": "loc_001",
+        "session_id": f"ses_{seq:06d}",
+        "table_id": "tbl_001",
+        "table_label": "T1",
+        "channel": "dine_in",
+        "source_type": "pos",
+        "status": "ACCEPTED",
+        "notes": None,
+        "created_at": now,
+        "updated_at": now,
+        "occurred_at": now,
+        "stations": sorted({_STATIONS[index % 3] for index in range(line_count)}),
+        "lines": lines,
+    }
+    return f'{{"seq":{seq},' + json.dumps(payload, separators=(",", ":"))[1:]
+
+
+def _deflate(frame: str | bytes, compressor: zlib._Compress) -> bytes:
+    data = frame.encode("utf-8") if isinstance(frame, str) else frame
+    # permessage-deflate strips the trailing empty block of each sync-flushed message.
+    return (compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+
+
+def _run(
+    events: list[str],
+    recipients: int,
+    encoding: str,
+    deflate: bool,
+) -> tuple[float, float]:
+    """Mean wire bytes per recipient and CPU milliseconds per event."""
+    msgpack_event.cache_clear()
+    compressors: list[zlib._Compress] = [
+        zlib.compressobj(wbits=-zlib.MAX_WBITS) for _ in range(recipients if deflate else 0)
+    ]
+    wire_bytes = 0
+    started = time.process_time()
+    for event in events:
+        frame = encode_frame(event, encoding)
+        if deflate:
+            for compressor in compressors:
+                wire_bytes += len(_deflate(frame, compressor))
+        else:
+            size = len(frame.encode("utf-8")) if isinstance(frame, str) else len(frame)
+            wire_bytes += size * recipients
+    cpu_seconds = time.process_time() - started
+    return wire_bytes / len(events) / recipients, cpu_seconds * 1000 / len(events)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=4)
+    args = parser.parse_args()
+
+    events = [_order_event(seq, args.lines) for seq in range(1, args.events + 1)]
+    print(f"{args.events} events x {args.recipients} recipients")
+    for encoding in (JSON, MSGPACK):
+        for deflate in (False, True):
+            bytes_per_recipient, cpu_ms = _run(events, args.recipients, encoding, deflate)
+            name = f"{encoding}+deflate" if deflate else encoding
+            print(
+                f"{name:>16}: {bytes_per_recipient:8.1f} B/event/recipient "
+                f"{cpu_ms:8.3f} ms CPU/event"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())